@@ -14,12 +14,13 @@ def main():
     files_and_dirs = [
         "main.py",
         "src/core",
-        "src/tests"
+        "src/tests",
+        "src/bench"
     ]
 
     total_lines = 0
 
-    print("Counting lines of code in main.py and all .py files in src/core and src/tests...\n")
+    print("Counting lines of code in main.py and all .py files in src/core, src/tests and src/bench...\n")
     for path in files_and_dirs:
         if os.path.isfile(path):
             # If it's a single file, count its lines
@@ -0,0 +1,38 @@
+import time
+import numpy as np
+from src.core.camera import Camera
+from src.core.geometry import Vector
+from src.core.log import log
+
+def bench_camera(indent="", verbose=True, vertices=1_000_000, scalar_vertices=50_000):
+    """
+    Camera.apply per Vector vs Camera.apply_many over one vertex array.
+    The per-vector loop runs over the first `scalar_vertices` vertices and is scaled up.
+    """
+    log(f"Benchmarking vertex projection: {vertices} vertices...", indent, verbose)
+    camera = Camera(mode="frustum", near=1, far=100, fov=70)
+    points = np.random.default_rng(0).uniform(-20, 20, (vertices, 3))
+    points[:, 2] -= 50
+    sample = [Vector(*p) for p in points[:scalar_vertices].tolist()]
+
+    start = time.perf_counter()
+    looped = [camera.apply(v) for v in sample]
+    loop_time = (time.perf_counter() - start) * vertices / len(sample)
+
+    out = np.empty((vertices, 2))
+    camera.apply_many(points, out=out, viewport=(0, 0, 1920, 1080), clip=True)  # Allocate scratch buffers
+    start = time.perf_counter()
+    camera.apply_many(points, out=out, viewport=(0, 0, 1920, 1080), clip=True)
+    batch_time = time.perf_counter() - start
+
+    projected = camera.apply_many(points[:scalar_vertices])
+    results = {"loop": loop_time, "batch": batch_time, "speedup": loop_time / batch_time,
+               "vertices_per_second": vertices / batch_time,
+               "max_error": float(np.abs(projected - np.array(looped)).max())}
+    log(f"apply: ~{loop_time:.2f}s, apply_many: {batch_time * 1000:.1f}ms "
+        f"({results['vertices_per_second'] / 1e6:.1f}M vertices/s, {results['speedup']:.0f}x faster, "
+        f"max difference {results['max_error']:.1e})", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_camera()
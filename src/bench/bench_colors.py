@@ -0,0 +1,36 @@
+import time
+import numpy as np
+from src.core.colors import note_color, note_color_array, note_colors
+from src.core.log import log
+
+def bench_colors(indent="", verbose=True, bins=2048, samplerate=44100, frames=600):
+    """Colouring every bin of a spectrum per frame: scalar note_color vs arrays vs the LUT, against a 60 fps budget."""
+    log(f"Benchmarking spectrum colouring: {bins} bins, {frames} frames...", indent, verbose)
+    frequencies = np.linspace(0, samplerate / 2, bins)
+    levels = np.random.default_rng(0).uniform(0.2, 0.8, bins)
+    out = np.empty((bins, 3), dtype=np.uint8)
+    budget = 1 / 60
+
+    start = time.perf_counter()
+    for _ in range(max(1, frames // 20)):
+        [note_color(f, l) for f, l in zip(frequencies[1:], levels[1:])]
+    scalar_time = (time.perf_counter() - start) / max(1, frames // 20)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        note_color_array(frequencies, levels)
+    array_time = (time.perf_counter() - start) / frames
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        note_colors(frequencies, out=out)
+    lut_time = (time.perf_counter() - start) / frames
+
+    results = {"scalar": scalar_time, "array": array_time, "lut": lut_time,
+               "lut_budget_fraction": lut_time / budget}
+    log(f"note_color loop {scalar_time * 1000:.2f}ms/frame, note_color_array {array_time * 1000:.3f}ms/frame, "
+        f"LUT {lut_time * 1000:.3f}ms/frame ({results['lut_budget_fraction']:.2%} of a 60 fps frame)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_colors()
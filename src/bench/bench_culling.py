@@ -0,0 +1,41 @@
+import time
+import numpy as np
+from src.core.geometry import Vector, Triangle3D
+from src.core.camera import Camera
+from src.core.culling import Culler
+from src.core.log import log
+
+def bench_culling(indent="", verbose=True, shapes=50_000, frames=20):
+    """Projecting every triangle each frame vs culling against the frustum first."""
+    log(f"Benchmarking frustum culling: {shapes} triangles...", indent, verbose)
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(-100, 100, (shapes, 3))
+    triangles = [Triangle3D(Vector(*c), Vector(*(c + [2, 0, 0])), Vector(*(c + [0, 2, 1]))) for c in corners]
+    vertices = np.array([[v.coords for v in t.vertices] for t in triangles])  # shapes x 3 x 3
+    camera = Camera(mode="frustum", near=1, far=150, fov=60, aspect_ratio=16 / 9)
+    camera.look_at(Vector(0, 0, 100), Vector(0, 0, 0))
+
+    start = time.perf_counter()
+    culler = Culler(triangles)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        camera.apply_many(vertices.reshape(-1, 3), viewport=(0, 0, 1920, 1080))
+    full_time = (time.perf_counter() - start) / frames
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        mask = culler.visible_mask(camera)
+        camera.apply_many(vertices[mask].reshape(-1, 3), viewport=(0, 0, 1920, 1080))
+    culled_time = (time.perf_counter() - start) / frames
+
+    results = {"build": build_time, "full": full_time, "culled": culled_time,
+               "visible_fraction": float(mask.mean()), "speedup": full_time / culled_time}
+    log(f"build {build_time * 1000:.0f}ms, project all {full_time * 1000:.2f}ms/frame, "
+        f"cull + project {culled_time * 1000:.2f}ms/frame ({results['visible_fraction']:.0%} visible, "
+        f"{results['speedup']:.1f}x faster)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_culling()
@@ -0,0 +1,32 @@
+import time
+from pathlib import Path
+import numpy as np
+from src.core.engine import Engine, EngineModulator
+from src.core.sound import Sound
+from src.core.log import log
+
+def bench_engine_audio(indent="", verbose=True, seconds=60.0, blocksize=1024, control_rate=200, quality="cubic"):
+    """
+    Offline render of an engine-modulated Sound driven by a pedal curve.
+    Nothing is played; the blocks are generated as fast as possible and timed.
+    """
+    log(f"Benchmarking engine-modulated rendering of {seconds}s ({quality}, {control_rate} Hz control)...", indent, verbose)
+    sound = Sound(Path("audio") / "short.mp3", chunk_size=blocksize, quality=quality)
+    pedal = lambda t: 0.5 + 0.45 * np.sin(2 * np.pi * 0.25 * t)  # Slow rev up and down
+    engine = Engine(friction=0.9)
+    engine.current_rpm = engine.max_rpm * engine.baseline_ratio
+    sound.set_modulator(EngineModulator(engine, pedal, sound.sample_rate, control_rate))
+
+    blocks = int(seconds * sound.sample_rate / blocksize)
+    start = time.perf_counter()
+    for _ in range(blocks):
+        sound._generate_chunk(blocksize)
+    elapsed = time.perf_counter() - start
+
+    results = {"seconds": blocks * blocksize / sound.sample_rate, "elapsed": elapsed}
+    results["realtime_factor"] = results["seconds"] / elapsed
+    log(f"Rendered {results['seconds']:.1f}s in {elapsed:.3f}s ({results['realtime_factor']:.0f}x real time)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_engine_audio()
@@ -0,0 +1,35 @@
+import time
+import numpy as np
+from src.core.engine import Engine
+from src.core.log import log
+
+def bench_engine_batch(indent="", verbose=True, engines=1000, steps=2000):
+    """Python update_rpm loop vs Engine.simulate for a sweep of engine profiles."""
+    log(f"Benchmarking Engine simulation: {engines} profiles x {steps} steps...", indent, verbose)
+    rng = np.random.default_rng(0)
+    pedals = rng.uniform(0, 1, (engines, steps))
+    max_rpm = rng.uniform(4000, 9000, engines)
+    friction = np.round(rng.uniform(0.05, 0.95, engines), 2)  # Realistic sweeps reuse friction values
+    ratio = rng.uniform(0.3, 0.7, engines)
+
+    start = time.perf_counter()
+    looped = np.empty_like(pedals)
+    for i in range(engines):
+        engine = Engine(max_rpm[i], friction[i], ratio[i])
+        for step in range(steps):
+            engine.update_rpm(pedals[i, step])
+            looped[i, step] = engine.current_rpm
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = Engine.simulate(pedals, max_rpm, friction, ratio)
+    batch_time = time.perf_counter() - start
+
+    results = {"loop": loop_time, "batch": batch_time, "speedup": loop_time / batch_time,
+               "exact": bool(np.array_equal(looped, batch))}
+    log(f"update_rpm loop: {loop_time:.3f}s, simulate: {batch_time:.4f}s "
+        f"({results['speedup']:.0f}x faster, identical results: {results['exact']})", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_engine_batch()
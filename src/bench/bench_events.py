@@ -0,0 +1,68 @@
+import time
+import numpy as np
+import pygame
+from src.core.component import Component
+from src.core.view import View
+from src.core.log import log
+
+class _Probe(Component):
+    def __init__(self, rect):
+        super().__init__(rect)
+        self.received = 0
+
+    def handle_event(self, event):
+        self.received += 1
+
+def _broadcast(components, event):
+    """The old delivery: every component, and recursively its children, sees every event."""
+    for component in components:
+        component.handle_event(event)
+        _broadcast(component.children, event)
+
+def _tree(panels, per_panel, size=100):
+    """A View of `panels` size x size panels laid out on a square grid, each holding `per_panel` 10x10 probes."""
+    side = int(np.ceil(np.sqrt(panels)))
+    view = View(pygame.Surface((side * size, side * size)))
+    for p in range(panels):
+        panel = _Probe(pygame.Rect(p % side * size, p // side * size, size, size))
+        view.add_child(panel)
+        for c in range(per_panel):
+            panel.add_child(_Probe(pygame.Rect(c % (size // 10) * 10, c // (size // 10) * 10, 10, 10)))
+    return view
+
+def bench_events(indent="", verbose=True, events=2000):
+    """
+    Cost per pointer event of broadcasting to the whole tree vs hit-test dispatch, for about 1k and
+    10k components laid out at the same density, with mouse motion at random positions.
+    """
+    log(f"Benchmarking event dispatch: {events} motion events...", indent, verbose)
+    rng = np.random.default_rng(0)
+    results = {}
+    for panels, per_panel in ((9, 99), (100, 99)):
+        view = _tree(panels, per_panel)
+        width, height = view.canvas.get_size()
+        motions = [pygame.event.Event(pygame.MOUSEMOTION, pos=(int(x), int(y)), buttons=(0, 0, 0), rel=(0, 0))
+                   for x, y in rng.uniform(0, 1, (events, 2)) * (width, height)]
+        count = panels * (per_panel + 1)
+        view.child_index()
+        for panel in view.children:
+            panel.child_index()  # Build the indexes outside the timed loop
+
+        start = time.perf_counter()
+        for event in motions[:events // 10]:
+            _broadcast(view.children, event)
+        broadcast_time = (time.perf_counter() - start) / (events // 10)
+
+        start = time.perf_counter()
+        for event in motions:
+            view.handle_event(event)
+        dispatch_time = (time.perf_counter() - start) / events
+
+        results[count] = {"broadcast": broadcast_time, "dispatch": dispatch_time,
+                          "speedup": broadcast_time / dispatch_time}
+        log(f"{count} components: broadcast {broadcast_time * 1e6:.0f}us/event, dispatch {dispatch_time * 1e6:.1f}us/event "
+            f"({results[count]['speedup']:.0f}x faster)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_events()
@@ -0,0 +1,45 @@
+import time
+import pygame
+from src.core.fonts import get_font_manager
+from src.core.style import Style
+from src.core.log import log
+
+def bench_fonts(indent="", verbose=True, styles=500, labels=2000):
+    """
+    Creating `styles` styles (a Font loaded from disk per style before vs the shared font now), and
+    rendering `labels` numeric readouts drawn from 100 distinct strings with and without the text cache.
+    """
+    log(f"Benchmarking fonts: {styles} styles, {labels} labels...", indent, verbose)
+    pygame.font.init()
+    start = time.perf_counter()
+    for _ in range(styles):
+        pygame.font.Font("LiberationMono-Regular.ttf", 24)  # What every Style() used to do
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    made = [Style() for _ in range(styles)]
+    style_time = time.perf_counter() - start
+
+    manager = get_font_manager()
+    font = made[0].font
+    texts = [f"{i % 100 * 4.41:.2f} Hz" for i in range(labels)]
+    start = time.perf_counter()
+    for text in texts:
+        font.render(text, True, (255, 255, 255))
+    render_time = time.perf_counter() - start
+
+    hits, misses = manager.hits, manager.misses
+    start = time.perf_counter()
+    for text in texts:
+        manager.render(font, text, True, (255, 255, 255))
+    cached_time = time.perf_counter() - start
+
+    results = {"load": load_time, "style": style_time, "render": render_time, "cached": cached_time,
+               "hits": manager.hits - hits, "misses": manager.misses - misses}
+    log(f"{styles} styles: {load_time * 1000:.1f}ms loading each font vs {style_time * 1000:.1f}ms shared; "
+        f"{labels} labels: {render_time * 1000:.1f}ms rendered vs {cached_time * 1000:.1f}ms cached "
+        f"({results['hits']} hits, {results['misses']} misses)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_fonts()
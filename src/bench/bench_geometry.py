@@ -0,0 +1,44 @@
+import time
+import numpy as np
+from src.core.geometry import Vector, Rect, Ellipse, Triangle, Rect3D, Ellipse3D, Triangle3D, Shape3D
+from src.core.log import log
+
+def bench_geometry(indent="", verbose=True, points=1_000_000, scalar_points=100_000):
+    """
+    Scalar contains() loop vs contains_many() for each shape type.
+    The scalar loop runs over the first `scalar_points` points and is scaled up to `points`.
+    """
+    log(f"Benchmarking point-in-shape queries over {points} points...", indent, verbose)
+    rng = np.random.default_rng(0)
+    solid = rng.uniform(-12, 12, (points, 3))
+    flat = np.ascontiguousarray(solid[:, :2])
+    shapes = [Rect(Vector(-5, -5), Vector(10, 8)),
+              Ellipse(Vector(0, 0), Vector(6, 0), Vector(0, 4)),
+              Triangle(Vector(-8, -6), Vector(9, -2), Vector(1, 10)),
+              Rect3D(Vector(-5, -5, 0), Vector(10, 8)),
+              Ellipse3D(Vector(0, 0, 0), Vector(6, 0, 2), Vector(0, 4, 2)),
+              Triangle3D(Vector(-8, -6, 0), Vector(9, -2, 1), Vector(1, 10, 2))]
+
+    results = {}
+    for shape in shapes:
+        name = type(shape).__name__
+        batch = solid if isinstance(shape, Shape3D) else flat
+        sample = batch[:scalar_points].tolist()
+
+        start = time.perf_counter()
+        looped = [shape.contains(*p) for p in sample]
+        loop_time = (time.perf_counter() - start) * points / len(sample)
+
+        start = time.perf_counter()
+        mask = shape.contains_many(batch)
+        batch_time = time.perf_counter() - start
+
+        results[name] = {"scalar": loop_time, "batch": batch_time, "speedup": loop_time / batch_time,
+                         "exact": bool(np.array_equal(mask[:len(sample)], looped))}
+        log(f"{name}: contains ~{loop_time:.2f}s, contains_many {batch_time * 1000:.1f}ms "
+            f"({results[name]['speedup']:.0f}x faster, identical results: {results[name]['exact']})",
+            indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_geometry()
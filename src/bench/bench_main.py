@@ -0,0 +1,52 @@
+from src.core.log import log
+from src.bench.bench_mixer import bench_mixer
+from src.bench.bench_resample import bench_resample
+from src.bench.bench_pcm_cache import bench_pcm_cache
+from src.bench.bench_engine_audio import bench_engine_audio
+from src.bench.bench_engine_batch import bench_engine_batch
+from src.bench.bench_render import bench_render
+from src.bench.bench_graph import bench_graph
+from src.bench.bench_geometry import bench_geometry
+from src.bench.bench_spatial import bench_spatial
+from src.bench.bench_camera import bench_camera
+from src.bench.bench_culling import bench_culling
+from src.bench.bench_raster import bench_raster
+from src.bench.bench_colors import bench_colors
+from src.bench.bench_spectrum import bench_spectrum
+from src.bench.bench_redraw import bench_redraw
+from src.bench.bench_mainloop import bench_mainloop
+from src.bench.bench_widgets import bench_widgets
+from src.bench.bench_fonts import bench_fonts
+from src.bench.bench_events import bench_events
+
+def bench_main(indent=""):
+  log("Running benchmarks", indent, True)
+  benches = {
+    "mixer": (bench_mixer, True),
+    "resample": (bench_resample, True),
+    "pcm cache": (bench_pcm_cache, True),
+    "engine audio": (bench_engine_audio, True),
+    "engine batch": (bench_engine_batch, True),
+    "render": (bench_render, True),
+    "graph": (bench_graph, True),
+    "geometry": (bench_geometry, True),
+    "spatial": (bench_spatial, True),
+    "camera": (bench_camera, True),
+    "culling": (bench_culling, True),
+    "raster": (bench_raster, True),
+    "colors": (bench_colors, True),
+    "spectrum": (bench_spectrum, True),
+    "redraw": (bench_redraw, True),
+    "mainloop": (bench_mainloop, True),
+    "widgets": (bench_widgets, True),
+    "fonts": (bench_fonts, True),
+    "events": (bench_events, True),
+  }
+  results = {}
+  for n in benches:
+    f,v = benches[n]
+    results[n] = f("\t", v)
+  return results
+
+if __name__ == "__main__":
+  bench_main()
@@ -0,0 +1,51 @@
+import os
+import time
+import pygame
+from src.core.view import View
+from src.core.slider import Slider
+from src.core.style import Style
+from src.core.log import log
+
+def bench_mainloop(indent="", verbose=True, seconds=1.0):
+    """
+    CPU used by View.mainloop on a headless display (SDL dummy video driver) over `seconds`:
+    an idle UI spinning unpaced (the old loop), paced to 60 fps, and waiting for events;
+    then frame-time statistics of an animated UI paced to 60 fps.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    log(f"Benchmarking mainloop CPU use over {seconds}s per mode...", indent, verbose)
+    canvas = pygame.display.set_mode((800, 600))
+    style = Style(background=(60, 60, 60), foreground=(230, 230, 230))
+
+    def run(target_fps, idle_wait, animate=False):
+        view = View(canvas)
+        view.target_fps, view.idle_wait = target_fps, idle_wait
+        for i in range(100):
+            slider = Slider(500, 0, 1000, pygame.Rect(i % 10 * 80 + 5, i // 10 * 60 + 5, 60, 20), style)
+            if animate:
+                slider.update = lambda slider=slider: (setattr(slider, "current", (slider.current + 7) % 1000),
+                                                       slider.mark_dirty())
+            view.add_child(slider)
+        if animate:
+            view.animated = list(view.children)
+        pygame.event.clear()
+        pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), 1)
+        start, cpu = time.perf_counter(), time.process_time()
+        view.mainloop(quit=False)
+        return (time.process_time() - cpu) / (time.perf_counter() - start), view.stats.summary()
+
+    results = {
+        "spin": run(0, False)[0],
+        "paced": run(60, False)[0],
+        "idle_wait": run(60, True)[0],
+    }
+    results["animated"], stats = run(60, True, animate=True)
+    results["animated_stats"] = stats
+    log(f"idle CPU: unpaced {results['spin']:.0%}, paced {results['paced']:.0%}, event wait {results['idle_wait']:.1%}; "
+        f"animated at 60 fps: CPU {results['animated']:.0%}, {stats['frames']} frames, mean {stats['mean'] * 1000:.2f}ms, "
+        f"p95 {stats['p95'] * 1000:.2f}ms, p99 {stats['p99'] * 1000:.2f}ms, {stats['dropped']} dropped", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_mainloop()
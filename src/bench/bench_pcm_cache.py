@@ -0,0 +1,40 @@
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+import soundfile as sf
+from src.core.pcm_cache import PCMCache
+from src.core.log import log
+
+def _time(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_pcm_cache(indent="", verbose=True, seconds=120.0, repeats=5):
+    """Cold (decode + transcode) vs warm (memmap) load times for the bundled MP3 and a long FLAC."""
+    log("Benchmarking PCMCache cold vs warm loads...", indent, verbose)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        long_file = Path(directory) / "long.flac"
+        rng = np.random.default_rng(0)
+        sf.write(long_file, rng.uniform(-0.5, 0.5, (int(seconds * 44100), 2)).astype(np.float32), 44100)
+
+        for source in (Path("audio") / "short.mp3", long_file):
+            cache = PCMCache(Path(directory) / "pcm")
+            decode = _time(lambda: sf.read(source, dtype="float32", always_2d=True), repeats)
+            def cold():
+                cache.clear()
+                cache.load(source)
+            cold_time = _time(cold, repeats)
+            warm_time = _time(lambda: cache.load(source), repeats)
+            results[source.name] = {"decode": decode, "cold": cold_time, "warm": warm_time}
+            log(f"{source.name}: sf.read {1000 * decode:.2f} ms, cold {1000 * cold_time:.2f} ms, "
+                f"warm {1000 * warm_time:.3f} ms ({decode / warm_time:.0f}x faster than decoding)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_pcm_cache()
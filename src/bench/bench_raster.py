@@ -0,0 +1,46 @@
+import time
+import numpy as np
+import pygame
+from src.core.geometry import Vector, Rect, Ellipse, Triangle
+from src.core.raster import fill, coverage
+from src.core.log import log
+
+def bench_raster(indent="", verbose=True, shapes=2000, width=1920, height=1080, frames=5):
+    """Frame time for painting a screen of note shapes onto a surface, with and without antialiasing."""
+    log(f"Benchmarking rasterization: {shapes} shapes on {width}x{height}...", indent, verbose)
+    rng = np.random.default_rng(0)
+    items = []
+    for i, (x, y, size) in enumerate(zip(rng.uniform(0, width, shapes), rng.uniform(0, height, shapes),
+                                         rng.uniform(6, 30, shapes))):
+        if i % 3 == 0:
+            items.append(Rect(Vector(x, y), Vector(size, size / 2)))
+        elif i % 3 == 1:
+            items.append(Ellipse(Vector(x, y), Vector(size, 0), Vector(0, size / 2)))
+        else:
+            items.append(Triangle(Vector(x, y), Vector(x + size, y), Vector(x, y + size)))
+    colors = rng.integers(0, 256, (shapes, 3))
+    surface = pygame.Surface((width, height))
+    mask = np.zeros((height, width), dtype=np.float32)
+
+    results = {}
+    for antialias in (False, True):
+        start = time.perf_counter()
+        for _ in range(frames):
+            surface.fill((0, 0, 0))
+            fill(surface, items, colors, antialias=antialias)
+        surface_time = (time.perf_counter() - start) / frames
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            mask.fill(0)
+            coverage(items, (width, height), antialias=antialias, out=mask)
+        mask_time = (time.perf_counter() - start) / frames
+
+        name = "antialiased" if antialias else "aliased"
+        results[name] = {"surface": surface_time, "mask": mask_time}
+        log(f"{name}: fill {surface_time * 1000:.1f}ms/frame, coverage mask {mask_time * 1000:.1f}ms/frame "
+            f"({shapes / surface_time:,.0f} shapes/s)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_raster()
@@ -0,0 +1,56 @@
+import os
+import time
+import pygame
+from src.core.view import View
+from src.core.slider import Slider
+from src.core.style import Style
+from src.core.log import log
+
+def bench_redraw(indent="", verbose=True, columns=16, rows=30, frames=200):
+    """
+    View.draw frame time on a headless display (SDL dummy video driver) with a grid of sliders:
+    repainting everything every frame (the old behaviour) vs idle frames vs frames where
+    one slider or 10% of them changed. The same 10% changes are also timed with a full
+    repaint, so both sides pay for re-rendering the changed sliders.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    log(f"Benchmarking dirty-rect redraw: {columns * rows} sliders, {frames} frames...", indent, verbose)
+    view = View(pygame.display.set_mode((800, 600)))
+    style = Style(background=(60, 60, 60), foreground=(230, 230, 230))
+    sliders = []
+    for row in range(rows):
+        for column in range(columns):
+            slider = Slider(500, 0, 1000, pygame.Rect(column * 50 + 10, row * 20 + 2, 30, 14), style)
+            view.add_child(slider)
+            sliders.append(slider)
+    view.draw()
+
+    def run(step):
+        start = time.perf_counter()
+        for frame in range(frames):
+            step(frame)
+            view.draw()
+        return (time.perf_counter() - start) / frames
+
+    def change(count):
+        def step(frame):
+            for slider in sliders[frame * count % len(sliders):][:count]:
+                slider.current = (slider.current + 37) % 1000
+                slider.mark_dirty()
+        return step
+
+    results = {
+        "full": run(lambda frame: view.invalidate()),
+        "idle": run(lambda frame: None),
+        "one": run(change(1)),
+        "tenth": run(change(len(sliders) // 10)),
+        "tenth_full": run(lambda frame: (change(len(sliders) // 10)(frame), view.invalidate())),
+    }
+    log(f"full redraw {results['full'] * 1000:.3f}ms/frame, idle {results['idle'] * 1000:.3f}ms, "
+        f"1 changed {results['one'] * 1000:.3f}ms, 10% changed {results['tenth'] * 1000:.3f}ms "
+        f"(full repaint {results['tenth_full'] * 1000:.3f}ms)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_redraw()
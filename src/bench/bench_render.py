@@ -0,0 +1,25 @@
+import tempfile
+from pathlib import Path
+from src.core.mixer import Mixer
+from src.core.sound import Sound
+from src.core.log import log
+
+def bench_render(indent="", verbose=True, voices=32, seconds=60.0, quality="cubic"):
+    """Real-time factor of rendering a mixer with `voices` Sounds offline to WAV and FLAC."""
+    log(f"Benchmarking offline render: {voices} voices, {seconds}s...", indent, verbose)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in ("wav", "flac"):
+            mixer = Mixer(44100, channels=2, blocksize=4096, offline=True)
+            for i in range(voices):
+                sound = Sound(Path("audio") / "short.mp3", speed=0.5 + i / voices, mixer=mixer,
+                              gain=1.0 / voices, pan=2 * i / max(1, voices - 1) - 1, quality=quality)
+                sound.play()
+            report = mixer.render_to_file(Path(directory) / f"render.{extension}", seconds=seconds)
+            results[extension] = report
+            log(f"{extension}: {report['seconds']:.1f}s in {report['elapsed']:.2f}s "
+                f"({report['realtime_factor']:.1f}x real time)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_render()
@@ -0,0 +1,38 @@
+import time
+import numpy as np
+from src.core.resample import Resampler, QUALITIES
+from src.core.log import log
+
+def legacy_chunk(audio_data, position, step, frames):
+    """The original Sound._generate_chunk: truncating float indices, phase dropped per chunk."""
+    indices = np.arange(position, position + step * frames, step)
+    indices = np.mod(indices, len(audio_data)).astype(int)
+    return audio_data[indices], indices[-1]
+
+def bench_resample(indent="", verbose=True, seconds=20.0, speed=0.87, channels=2, blocksize=1024, samplerate=44100):
+    """Samples per second produced by the legacy chunk generator and each Resampler quality."""
+    log(f"Benchmarking Resampler at speed {speed}, {channels} channels, {blocksize}-frame blocks...", indent, verbose)
+    rng = np.random.default_rng(0)
+    source = rng.uniform(-1, 1, (10 * samplerate, channels)).astype(np.float32)
+    blocks = int(seconds * samplerate / blocksize)
+    results = {}
+
+    position = 0
+    start = time.perf_counter()
+    for _ in range(blocks):
+        _, position = legacy_chunk(source, position, speed, blocksize)
+    results["legacy"] = blocks * blocksize / (time.perf_counter() - start)
+
+    for quality in QUALITIES:
+        resampler = Resampler(quality, channels, blocksize)
+        start = time.perf_counter()
+        for _ in range(blocks):
+            resampler.process(source, speed, blocksize)
+        results[quality] = blocks * blocksize / (time.perf_counter() - start)
+
+    for name, rate in results.items():
+        log(f"{name:>8}: {rate / 1e6:7.2f} M samples/s ({rate / samplerate:8.1f}x real time)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_resample()
@@ -0,0 +1,51 @@
+import time
+import numpy as np
+from src.core.geometry import Vector, Rect, Ellipse, Triangle
+from src.core.spatial import GridIndex
+from src.core.log import log
+
+def bench_spatial(indent="", verbose=True, shapes=5000, queries=2000, width=1920, height=1080):
+    """Linear contains() scan vs GridIndex.query_point for a screen full of note shapes."""
+    log(f"Benchmarking hit-testing: {shapes} shapes, {queries} point queries...", indent, verbose)
+    rng = np.random.default_rng(0)
+    items = []
+    for i, (x, y, size) in enumerate(zip(rng.uniform(0, width, shapes), rng.uniform(0, height, shapes),
+                                         rng.uniform(4, 40, shapes))):
+        if i % 3 == 0:
+            items.append(Rect(Vector(x, y), Vector(size, size / 2)))
+        elif i % 3 == 1:
+            items.append(Ellipse(Vector(x, y), Vector(size, 0), Vector(0, size / 2)))
+        else:
+            items.append(Triangle(Vector(x, y), Vector(x + size, y), Vector(x, y + size)))
+    points = np.column_stack([rng.uniform(0, width, queries), rng.uniform(0, height, queries)]).tolist()
+
+    start = time.perf_counter()
+    index = GridIndex(cell_size=32)
+    for item in items:
+        index.insert(item)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    linear = [[item for item in items if item.contains(x, y)] for x, y in points]
+    linear_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [index.query_point(x, y) for x, y in points]
+    index_time = time.perf_counter() - start
+
+    moved = [item for item in items if isinstance(item, Rect)][:1000]
+    start = time.perf_counter()
+    for item in moved:
+        item.top_left = item.top_left + Vector(3, 3)
+        index.move(item)
+    move_time = (time.perf_counter() - start) / len(moved)
+
+    results = {"build": build_time, "linear": linear_time / queries, "indexed": index_time / queries,
+               "speedup": linear_time / index_time, "move": move_time, "exact": indexed == linear}
+    log(f"build {build_time * 1000:.1f}ms, linear {results['linear'] * 1e6:.0f}us/query, "
+        f"indexed {results['indexed'] * 1e6:.1f}us/query ({results['speedup']:.0f}x faster, "
+        f"identical results: {results['exact']}), move {move_time * 1e6:.1f}us", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_spatial()
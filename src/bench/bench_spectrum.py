@@ -0,0 +1,46 @@
+import time
+import numpy as np
+import pygame
+from src.core.spectrum import SpectrumAnalyzer
+from src.core.spectrogram_view import SpectrogramView
+from src.core.log import log
+
+def bench_spectrum(indent="", verbose=True, samplerate=44100, size=2048, hop=512, chunk=1024, seconds=10):
+    """
+    Cost of the analysis path: feed() per chunk on the audio thread, process() per spectrum on
+    the analysis thread (against the real-time hop period), and one SpectrogramView redraw.
+    """
+    log(f"Benchmarking spectrum analysis: {seconds}s of stereo audio, {size}-point FFT every {hop} frames...", indent, verbose)
+    rng = np.random.default_rng(0)
+    audio = rng.uniform(-1, 1, (seconds * samplerate // chunk * chunk, 2)).astype(np.float32)
+    chunks = np.split(audio, len(audio) // chunk)
+    analyzer = SpectrumAnalyzer(samplerate, size, hop, buffer_frames=len(audio), max_backlog=len(audio))
+
+    start = time.perf_counter()
+    for block in chunks:
+        analyzer.feed(block)
+    feed_time = (time.perf_counter() - start) / len(chunks)
+
+    start = time.perf_counter()
+    spectra = analyzer.process()
+    process_time = (time.perf_counter() - start) / spectra
+
+    view = SpectrogramView(analyzer, pygame.Rect(0, 0, 512, 256))
+    canvas = pygame.Surface((512, 256))
+    view.draw(canvas)
+    repeats = 50
+    start = time.perf_counter()
+    for _ in range(repeats):
+        view._drawn = None  # Force a full re-render
+        view.draw(canvas)
+    draw_time = (time.perf_counter() - start) / repeats
+
+    results = {"feed": feed_time, "process": process_time, "draw": draw_time,
+               "realtime_factor": (hop / samplerate) / process_time}
+    log(f"feed {feed_time * 1e6:.1f}us/chunk ({feed_time / (chunk / samplerate):.3%} of a chunk period), "
+        f"process {process_time * 1e6:.1f}us/spectrum ({results['realtime_factor']:.0f}x real time), "
+        f"draw {draw_time * 1000:.2f}ms (512x256)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_spectrum()
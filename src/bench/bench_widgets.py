@@ -0,0 +1,42 @@
+import time
+import pygame
+from src.core.button import Button
+from src.core.style import Style
+from src.core.log import log
+
+def bench_widgets(indent="", verbose=True, buttons=1000, frames=20):
+    """
+    Drawing `buttons` buttons per frame: the old path (a default Font built per draw, then
+    the text rendered), rendering every draw, and blitting the cached appearance.
+    """
+    pygame.font.init()
+    log(f"Benchmarking button drawing: {buttons} buttons, {frames} frames...", indent, verbose)
+    canvas = pygame.Surface((1000, 1000))
+    style = Style(background=(70, 70, 90), text=(240, 240, 240))
+    widgets = [Button(pygame.Rect(i % 25 * 40, i // 25 * 25, 38, 23), style, f"B{i}") for i in range(buttons)]
+
+    def run(draw):
+        start = time.perf_counter()
+        for _ in range(frames):
+            for button in widgets:
+                draw(button)
+        return (time.perf_counter() - start) / frames
+
+    def old(button):
+        pygame.font.Font(None, 36)  # Built as the .get() default on every draw
+        button.draw_appearance(canvas, button.rect)
+
+    results = {
+        "old": run(old),
+        "uncached": run(lambda button: button.draw_appearance(canvas, button.rect)),
+    }
+    for button in widgets:
+        button.draw(canvas)  # Render the caches once; later frames only blit
+    results["cached"] = run(lambda button: button.draw(canvas))
+    results["speedup"] = results["old"] / results["cached"]
+    log(f"old draw {results['old'] * 1000:.2f}ms/frame, render every draw {results['uncached'] * 1000:.2f}ms, "
+        f"cached {results['cached'] * 1000:.2f}ms ({results['speedup']:.0f}x faster than before)", indent + "  ", verbose)
+    return results
+
+if __name__ == "__main__":
+    bench_widgets()
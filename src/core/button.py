@@ -3,6 +3,7 @@ from src.core.geometry import *
 from src.core.style import *
 from src.core.sound import *
 from src.core.component import Component
+from src.core.fonts import get_font_manager
 
 class Button(Component):
     def __init__(self, rect: pygame.Rect, style: Style, text: str = ""):
@@ -14,28 +15,37 @@ class Button(Component):
     def set_callback(self, callback):
         self.callback = callback
 
-    def draw(self, canvas):
-        # Draw the button background
-        pygame.draw.rect(canvas, self.style.colors["background"], self.rect)
-        # Draw the button text
-        font = self.style.colors.get("font", pygame.font.Font(None, 36))
+    def set_text(self, text):
+        self.text = text
+        self.mark_dirty()
+
+    def _text_style(self):
+        font = self.style.colors.get("font") or get_font_manager().font(None, 36)
         if "text" in self.style.colors:
             text_color = self.style.colors["text"]
-        elif "font" in self.style.colors:
-            text_color = self.style.colors["font"]
         elif "foreground" in self.style.colors:
             text_color = self.style.colors["foreground"]
         else:
             text_color = (255, 255, 255)
+        return font, text_color
 
-        text_surface = font.render(self.text, True, self.style.colors["text"])
-        text_rect = text_surface.get_rect(center=self.rect.center)
+    def appearance(self):
+        return (self.text, self.style.colors["background"]) + self._text_style()
+
+    def draw_appearance(self, canvas, area):
+        # Draw the button background
+        pygame.draw.rect(canvas, self.style.colors["background"], area)
+        # Draw the button text
+        font, text_color = self._text_style()
+        text_surface = self.style.render(self.text, text_color, font=font)
+        text_rect = text_surface.get_rect(center=area.center)
         canvas.blit(text_surface, text_rect)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left mouse button
             x,y = event.pos
             if self.rect.collidepoint(x,y):
+                self.mark_dirty()
                 if self.callback:
                     self.callback()
 
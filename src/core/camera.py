@@ -1,4 +1,5 @@
 import numpy as np
+from src.core.geometry import as_points
 
 class Camera:
     def __init__(self, mode=None, **kwargs):
@@ -8,11 +9,22 @@ class Camera:
         Args:
             mode: Camera mode (`None` for flat perspective, "ortho" for orthographic, "frustum" for perspective).
             kwargs: Parameters for the specific camera mode.
-                - Ortho: left, right, bottom, top, near, far.
-                - Frustum: near, far, fov (field of view in degrees).
+                - Ortho: left, right, bottom, top, near, far, optional aspect_ratio (width / height;
+                  the left/right extent is widened or narrowed around its center to match).
+                - Frustum: near, far, fov (field of view in degrees), optional aspect_ratio.
+
+        The camera holds a projection (`matrix`) and a view transform (`view_matrix`, see look_at).
+        Their product, `combined`, and the frustum planes derived from it are recomputed only
+        after one of them changes.
         """
         self.mode = mode
-        self.matrix = None
+        self.params = kwargs
+        self._matrix = None
+        self._view = None  # None is the identity
+        self._combined = None
+        self._planes = None
+        self._dirty = True
+        self._clip = None  # Homogeneous coordinates scratch buffer for apply_many
 
         if self.mode is None:
             # Flat perspective (no transformation matrix)
@@ -24,8 +36,31 @@ class Camera:
         else:
             raise ValueError(f"Unsupported mode: {self.mode}")
 
-    def _initialize_ortho(self, left, right, bottom, top, near, far):
+    @property
+    def matrix(self):
+        """The projection matrix (None for flat perspective)."""
+        return self._matrix
+
+    @matrix.setter
+    def matrix(self, matrix):
+        self._matrix = matrix
+        self._dirty = True
+
+    @property
+    def view_matrix(self):
+        """The world-to-camera matrix (None for the identity)."""
+        return self._view
+
+    @view_matrix.setter
+    def view_matrix(self, matrix):
+        self._view = None if matrix is None else np.asarray(matrix, dtype=np.float64)
+        self._dirty = True
+
+    def _initialize_ortho(self, left, right, bottom, top, near, far, aspect_ratio=None):
         """Sets up an orthographic projection matrix."""
+        if aspect_ratio is not None:
+            center, half_width = (left + right) / 2, (top - bottom) * aspect_ratio / 2
+            left, right = center - half_width, center + half_width
         self.matrix = np.array([
             [2 / (right - left), 0, 0, -(right + left) / (right - left)],
             [0, 2 / (top - bottom), 0, -(top + bottom) / (top - bottom)],
@@ -33,9 +68,8 @@ class Camera:
             [0, 0, 0, 1],
         ], dtype=np.float32)
 
-    def _initialize_frustum(self, near, far, fov):
+    def _initialize_frustum(self, near, far, fov, aspect_ratio=1.0):
         """Sets up a perspective projection matrix using a frustum."""
-        aspect_ratio = 1.0  # Default aspect ratio (can be modified later)
         f = 1 / np.tan(np.radians(fov) / 2)
         depth = far - near
 
@@ -50,16 +84,101 @@ class Camera:
         """Returns the current transformation matrix."""
         return self.matrix
 
+    def set_aspect_ratio(self, aspect_ratio):
+        """Rebuilds the projection for a new width / height ratio. No effect in flat perspective."""
+        if self.mode is None or self.params.get("aspect_ratio") == aspect_ratio:
+            return
+        self.params["aspect_ratio"] = aspect_ratio
+        if self.mode == "ortho":
+            self._initialize_ortho(**self.params)
+        else:
+            self._initialize_frustum(**self.params)
+
+    def fit(self, canvas):
+        """
+        Matches the aspect ratio to a pygame surface, e.g. a View's canvas.
+        Args:
+            canvas: Any object with get_size().
+        """
+        width, height = canvas.get_size()
+        if height:
+            self.set_aspect_ratio(width / height)
+
+    def look_at(self, eye, target, up=(0, 1, 0)):
+        """
+        Sets the view matrix so that the camera sits at `eye` looking towards `target`.
+        Args:
+            eye, target, up: Vectors or 3-element sequences in world coordinates.
+        """
+        eye, target, up = (np.array(getattr(v, "coords", v), dtype=np.float64) for v in (eye, target, up))
+        forward = target - eye
+        forward /= np.linalg.norm(forward)
+        side = np.cross(forward, up)
+        side /= np.linalg.norm(side)
+        true_up = np.cross(side, forward)
+        view = np.eye(4)
+        view[0, :3], view[1, :3], view[2, :3] = side, true_up, -forward
+        view[:3, 3] = -view[:3, :3] @ eye
+        self.view_matrix = view
+
+    @property
+    def combined(self):
+        """Projection times view as a float64 matrix, or None when neither is set. Cached until either changes."""
+        if self._dirty:
+            if self._matrix is None and self._view is None:
+                self._combined = None
+            elif self._view is None:
+                self._combined = self._matrix.astype(np.float64)
+            elif self._matrix is None:
+                self._combined = self._view
+            else:
+                self._combined = self._matrix.astype(np.float64) @ self._view
+            self._planes = None
+            self._dirty = False
+        return self._combined
+
+    def mvp(self, model=None):
+        """
+        Model-view-projection matrix for a shape.
+        Args:
+            model: A geometry Transform, 4 x 4 matrix or None (identity), e.g. Shape3D.transform.
+        """
+        combined = self.combined if self.combined is not None else np.eye(4)
+        if model is None:
+            return combined
+        return combined @ getattr(model, "matrix", model)
+
+    def frustum_planes(self):
+        """
+        The six clipping planes (left, right, bottom, top, near, far) in world coordinates,
+        extracted from the combined matrix. Each row (a, b, c, d) is normalized so that
+        a*x + b*y + c*z + d is the signed distance of a point, positive inside.
+
+        Returns:
+            A 6 x 4 array, or None in flat perspective.
+        """
+        combined = self.combined
+        if combined is None:
+            return None
+        if self._planes is None:
+            rows = combined
+            planes = np.array([rows[3] + rows[0], rows[3] - rows[0], rows[3] + rows[1],
+                               rows[3] - rows[1], rows[3] + rows[2], rows[3] - rows[2]])
+            planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+            self._planes = planes
+        return self._planes
+
     def apply(self, vector):
         """
-        Transforms a Vector using the camera's transformation matrix.
+        Transforms a Vector using the camera's combined view and projection matrix.
         Args:
             vector: A Vector object with 3D coordinates.
 
         Returns:
             Transformed Vector as a tuple of (x, y, z).
         """
-        if self.matrix is None:
+        combined = self.combined
+        if combined is None:
             # Flat perspective: no transformation
             return vector.coords
 
@@ -67,8 +186,8 @@ class Camera:
             raise ValueError("Camera transformations require 3D vectors.")
 
         # Apply the matrix transformation
-        vec = np.array([*vector.coords, 1], dtype=np.float32)  # Homogeneous coordinates
-        transformed = self.matrix @ vec
+        vec = np.array([*vector.coords, 1], dtype=np.float64)  # Homogeneous coordinates
+        transformed = combined @ vec
 
         # Normalize by the w-component (perspective division)
         if transformed[3] != 0:
@@ -76,5 +195,79 @@ class Camera:
 
         return tuple(transformed[:3])
 
+    def apply_many(self, points, out=None, viewport=None, clip=False, epsilon=1e-9):
+        """
+        Projects a whole array of points with one homogeneous matmul and a vectorized perspective divide.
+
+        Args:
+            points: N x 3 array, VectorArray or list of 3D Vectors.
+            out: Optional float array to write the result into; N x 3 (N x 2 for 2D points in
+                flat mode), or N x 2 with a viewport.
+            viewport: Optional (x, y, width, height) pixel rectangle. Normalized device x and y
+                in [-1, 1] are mapped onto it, with y pointing down, and only x and y are returned.
+            clip: If True, also return a mask of the points between the near and far planes.
+            epsilon: Points with |w| below this are left undivided (as in apply) and never visible.
+
+        Returns:
+            `out`, or (`out`, mask) when `clip` is True.
+        """
+        points = as_points(points)
+        count = len(points)
+        matrix = self.combined
+        if out is None:
+            if viewport is not None:
+                columns = 2
+            else:
+                columns = 3 if matrix is not None else points.shape[1]
+            out = np.empty((count, columns))
+        if matrix is None:
+            # Flat perspective: no transformation, every point is visible
+            if viewport is None:
+                np.copyto(out, points[:, :out.shape[1]])
+            else:
+                self._to_viewport(points[:, 0], points[:, 1], viewport, out)
+            return (out, np.ones(count, dtype=bool)) if clip else out
+
+        if points.shape[1] != 3:
+            raise ValueError("Camera transformations require 3D vectors.")
+        if self._clip is None or len(self._clip) < count:
+            self._clip = np.empty((count, 4))
+            self._magnitude = np.empty(count)
+            self._valid = np.empty(count, dtype=bool)
+        homogeneous = self._clip[:count]
+        magnitude = self._magnitude[:count]
+        valid = self._valid[:count]
+
+        np.matmul(points, matrix[:, :3].T, out=homogeneous)
+        homogeneous += matrix[:, 3]
+        w = homogeneous[:, 3]
+        np.abs(w, out=magnitude)
+        np.greater_equal(magnitude, epsilon, out=valid)
+        # Scale by 1 / w column by column; points with w near 0 keep a scale of 1
+        reciprocal = magnitude
+        reciprocal.fill(1.0)
+        np.divide(1.0, w, out=reciprocal, where=valid)
+        for axis in range(3):
+            homogeneous[:, axis] *= reciprocal
+
+        if viewport is None:
+            np.copyto(out, homogeneous[:, :3])
+        else:
+            self._to_viewport(homogeneous[:, 0], homogeneous[:, 1], viewport, out)
+        if not clip:
+            return out
+        z = homogeneous[:, 2]
+        mask = valid & (z >= -1) & (z <= 1)
+        return out, mask
+
+    @staticmethod
+    def _to_viewport(x, y, viewport, out):
+        """Maps normalized device x and y in [-1, 1] onto the pixel rectangle `viewport`, y pointing down."""
+        left, top, width, height = viewport
+        np.multiply(x, 0.5 * width, out=out[:, 0])
+        out[:, 0] += left + 0.5 * width
+        np.multiply(y, -0.5 * height, out=out[:, 1])
+        out[:, 1] += top + 0.5 * height
+
     def __repr__(self):
         return f"Camera(mode={self.mode}, matrix={self.matrix})"
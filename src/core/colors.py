@@ -1,6 +1,7 @@
 import numpy as np
 import colorsys
 import math
+from functools import lru_cache
 
 def rainbow(t, l, dtype=float):
 	def f(c):
@@ -34,3 +35,97 @@ def octaves(f, dtype=float):
 
 def note_color(f, l=0.5, dtype=float):
 	return rainbow(octaves(f, dtype) * math.tau, l, dtype)
+
+
+# Array versions. These take NumPy arrays (or anything broadcastable) for t, l and f and
+# return colours along a trailing axis of length 3, so a whole spectrum is coloured at once.
+
+_INT_TYPES = (int, np.int16, np.int32, np.uint8)
+_FLOAT_TYPES = (float, np.float32, np.float64)
+
+def _cast(c, dtype):
+	if dtype in _INT_TYPES:
+		return (255*c).astype(np.int64 if dtype is int else dtype)
+	if dtype in _FLOAT_TYPES:
+		return c.astype(dtype)
+	raise TypeError(f"Unsupported type: {dtype.__name__}")
+
+def rainbow_array(t, l, dtype=float):
+	"""rainbow() over arrays: returns an array of shape broadcast(t, l).shape + (3,)."""
+	t, l = np.broadcast_arrays(np.asarray(t, dtype=np.float64), np.asarray(l, dtype=np.float64))
+	rgb = np.sqrt(2/9)*(np.cos(t[..., None] + np.array([0, np.pi*2/3, np.pi*4/3])) + 1)
+	l = (1-2*l)[..., None]
+	dark = l >= 0
+	rgb = np.where(dark, (1-l)*rgb, -l + (1+l)*rgb)
+	return _cast(rgb, dtype)
+
+def _hue(rgb, maxc, rangec):
+	"""Hue shared by rgb_to_hls and rgb_to_hsv; rangec must be non-zero."""
+	r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+	rc, gc, bc = (maxc-r)/rangec, (maxc-g)/rangec, (maxc-b)/rangec
+	h = np.where(r == maxc, bc-gc, np.where(g == maxc, 2.0+rc-bc, 4.0+gc-rc))
+	return (h/6.0) % 1.0
+
+def rgb_to_hls_array(rgb):
+	"""colorsys.rgb_to_hls over an (..., 3) array of floats in [0, 1]."""
+	rgb = np.asarray(rgb, dtype=np.float64)
+	maxc, minc = rgb.max(axis=-1), rgb.min(axis=-1)
+	sumc, rangec = maxc+minc, maxc-minc
+	l = sumc/2.0
+	grey = minc == maxc
+	safe = np.where(grey, 1.0, rangec)
+	s = np.where(l <= 0.5, rangec/np.where(grey, 1.0, sumc), rangec/np.where(grey, 1.0, 2.0-maxc-minc))
+	h = _hue(rgb, maxc, safe)
+	return np.stack([np.where(grey, 0.0, h), l, np.where(grey, 0.0, s)], axis=-1)
+
+def rgb_to_hsv_array(rgb):
+	"""colorsys.rgb_to_hsv over an (..., 3) array of floats in [0, 1]."""
+	rgb = np.asarray(rgb, dtype=np.float64)
+	maxc, minc = rgb.max(axis=-1), rgb.min(axis=-1)
+	rangec = maxc-minc
+	grey = minc == maxc
+	safe = np.where(grey, 1.0, rangec)
+	s = rangec/np.where(grey, 1.0, maxc)
+	h = _hue(rgb, maxc, safe)
+	return np.stack([np.where(grey, 0.0, h), np.where(grey, 0.0, s), maxc], axis=-1)
+
+# colorsys functions accepted by rainbow_convert and their array counterparts
+VECTORIZED = {colorsys.rgb_to_hls: rgb_to_hls_array, colorsys.rgb_to_hsv: rgb_to_hsv_array}
+
+def rainbow_convert_array(t, l, dtype=float, fn=colorsys.rgb_to_hls):
+	"""rainbow_convert() over arrays; `fn` may be a colorsys function or an array function."""
+	converted = VECTORIZED.get(fn, fn)(rainbow_array(t, l, float))
+	return _cast(converted, dtype)
+
+def octaves_array(f):
+	"""Octaves above A0 (27.5 Hz). Non-positive frequencies, e.g. the DC bin, count as A0."""
+	f = np.asarray(f, dtype=np.float64)
+	return np.log2(np.where(f > 0, f, 27.5)/27.5)
+
+def note_color_array(f, l=0.5, dtype=float):
+	"""note_color() over an array of frequencies."""
+	return rainbow_array(octaves_array(f)*math.tau, l, dtype)
+
+@lru_cache(maxsize=None)
+def rainbow_lut(size=4096, l=0.5):
+	"""
+	Read-only (size, 3) uint8 table of rainbow colours over one turn of the hue circle,
+	entry i being rainbow(i/size * tau, l, int).
+	"""
+	lut = rainbow_array(np.arange(size)*(math.tau/size), l, np.uint8)
+	lut.flags.writeable = False
+	return lut
+
+def note_colors(f, l=0.5, size=4096, out=None):
+	"""
+	Constant-time per-bin colouring through rainbow_lut: the position within the octave
+	picks the nearest table entry.
+	:param f: Array of frequencies in Hz.
+	:param out: Optional f.shape + (3,) uint8 array to write into.
+	:return: uint8 RGB colours of shape f.shape + (3,).
+	"""
+	position = octaves_array(f)
+	position *= size
+	index = np.rint(position, out=position).astype(np.int64)
+	index %= size
+	return np.take(rainbow_lut(size, l), index, axis=0, out=out)
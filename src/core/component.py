@@ -1,7 +1,39 @@
+import itertools
 import pygame
 from src.core.style import Style
+from src.core.spatial import GridIndex, bounds_of
+from src.core.events import ROUTED_EVENTS
+
+_versions = itertools.count()
+
+class ChildList(list):
+    """
+    A list of children that stamps every edit with a new, process-wide unique `version`.
+    Containers remember the version their index was built from, so children edited
+    directly (append, item assignment, ...) instead of through add_child are re-indexed.
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = next(_versions)
+
+def _stamped(name):
+    edit = getattr(list, name)
+
+    def stamped(self, *args):
+        self.version = next(_versions)
+        return edit(self, *args)
+    stamped.__name__ = name
+    return stamped
+
+for _name in ("append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+              "__setitem__", "__delitem__", "__iadd__", "__imul__"):
+    setattr(ChildList, _name, _stamped(_name))
 
 class Component:
+    opaque = True  # draw_appearance() covers its whole area, so the cached surface needs no alpha
+    focusable = False  # Clicking it gives it keyboard focus
+    captures_pointer = False  # A button press on it captures the pointer until release
+
     def __init__(self, rect: pygame.Rect, style:Style = Style()):
         """
         Base class for UI components.
@@ -10,36 +42,152 @@ class Component:
         self.children = []  # List of child components
         self.rect = rect or pygame.Rect(0, 0, 100, 50)  # Default size and position
         self.style = style or Style()
+        self._cache = None  # Off-screen rendering of the appearance
+        self._cache_key = None
+        self._index = None  # Children by rect, for hit testing; built on first use
+        self._index_version = None  # children.version the index was built from
+
+    @property
+    def children(self):
+        return self._children
+
+    @children.setter
+    def children(self, children):
+        self._children = ChildList(children)
+
+    @property
+    def rect(self):
+        return self._rect
+
+    @rect.setter
+    def rect(self, rect):
+        """Assigning a new rect re-indexes the component in its parent and repaints both areas."""
+        old = getattr(self, "_rect", None)
+        self._rect = rect
+        if old is not None and getattr(self, "parent", None) is not None:
+            self.parent.move_child(self, old)
+
+    def update(self):
+        """
+        Called by the view once per frame before it redraws; override to poll time-based
+        state and call mark_dirty() when it changed. Components that only change in
+        response to events do not need it.
+        """
+        pass
+
+    def mark_dirty(self, rect=None):
+        """
+        Request a redraw on the next View.draw; call this after any change to what draw() shows.
+        :param rect: Area to repaint, in the same coordinates as self.rect; defaults to appearance_rect().
+        """
+        if self.parent is not None:
+            self.parent.invalidate(pygame.Rect(rect or self.appearance_rect()))
+
+    def invalidate(self, rect):
+        """
+        Pass a damaged area up to the view that owns this component.
+        :param rect: Area in the coordinates of this component's children, i.e. relative to its top-left corner.
+        """
+        if self.parent is not None:
+            self.parent.invalidate(pygame.Rect(rect).move(self.rect.topleft))
+
+    def appearance(self):
+        """
+        Hashable key of everything draw_appearance() depends on apart from position, e.g.
+        (text, colours, state). Override to have draw() reuse an off-screen rendering until
+        the key changes; None (the default) paints directly on every draw.
+        """
+        return None
+
+    def appearance_rect(self):
+        """Screen area draw_appearance() paints; the rect unless the component overhangs it."""
+        return self.rect
+
+    def draw_appearance(self, surface, area):
+        """
+        Paint the component. Override this in subclasses (or draw() itself for components
+        that manage their own rendering).
+        :param surface: The pygame surface to paint on.
+        :param area: Where appearance_rect() lies on `surface`.
+        """
+        pass
 
     def draw(self, surface):
         """
-        Draw the component to the given surface. Override this in subclasses.
+        Draw the component to the given surface, blitting the cached appearance when
+        appearance() is unchanged since it was rendered.
         :param surface: The pygame surface to draw on.
         """
-        pass
+        area = self.appearance_rect()
+        key = self.appearance()
+        if key is None:
+            self.draw_appearance(surface, area)
+            return
+        key = (key, area.size)
+        if key != self._cache_key:
+            self._cache = pygame.Surface(area.size, 0 if self.opaque else pygame.SRCALPHA)
+            self.draw_appearance(self._cache, self._cache.get_rect())
+            self._cache_key = key
+        surface.blit(self._cache, area)
 
     def handle_event(self, event):
         """
         Handle input events like mouse clicks or key presses. Override in subclasses.
+        Pointer and keyboard events are routed to a single component by the view's
+        EventDispatcher, so only the other events are passed on to the children.
         :param event: A pygame event.
         """
+        if event.type in ROUTED_EVENTS:
+            return
         for child in self.children:
             child.handle_event(event)
 
+    def child_index(self):
+        """GridIndex of the children by rect, in this component's coordinates; rebuilt if children was edited directly."""
+        if self._index is None or self._index_version != self.children.version:
+            # Cells about the size of a typical child keep few candidates per point query
+            sizes = [max(child.rect.width, child.rect.height) for child in self.children]
+            self._index = GridIndex(max(8, sum(sizes) / len(sizes)) if sizes else 64)
+            for child in self.children:
+                self._index.insert(child, bounds_of(child.rect))
+            self._index_version = self.children.version
+        return self._index
+
+    def move_child(self, child, old=None):
+        """
+        Refresh the index after `child`'s rect changed and repaint where it was and is.
+        :param old: Previous rect, if known.
+        """
+        if self._index is not None and child in self._index:
+            self._index.move(child, bounds_of(child.rect))
+        if old is not None:
+            self.invalidate(pygame.Rect(old))
+        child.mark_dirty()
+
     def add_child(self, component):
         """
         Add a child component to this component.
         :param component: The child component to add.
         """
+        synced = self._index is not None and self._index_version == self.children.version
         self.children.append(component)
         component.parent = self
+        if synced:
+            self._index.insert(component, bounds_of(component.rect))
+            self._index_version = self.children.version
+        component.mark_dirty()
 
     def remove_child(self, component):
         """
         Remove a child component from this component.
         :param component: The child component to remove.
         """
+        component.mark_dirty()
+        synced = self._index is not None and self._index_version == self.children.version
         self.children.remove(component)
+        if synced:
+            self._index.remove(component)
+            self._index_version = self.children.version
         component.parent = None
 
     def set_rect(self, x, y, width, height):
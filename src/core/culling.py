@@ -0,0 +1,144 @@
+import numpy as np
+from src.core.geometry import Shape3D
+from src.core.spatial import bounds_of
+
+# Box of items whose extent is unknown: never culled. Finite, so box centers stay defined.
+UNBOUNDED = np.array([-1e300, -1e300, -1e300, 1e300, 1e300, 1e300])
+_CHUNK = 4096  # Boxes per frustum-test step
+
+def box_of(item) -> np.ndarray:
+    """
+    World-space bounding box (min x, min y, min z, max x, max y, max z) of a shape or component.
+    Shape3D uses its (transformed) outline; 2D shapes and components lie in the z = 0 plane.
+    """
+    if isinstance(item, Shape3D):
+        try:
+            return item.box()
+        except NotImplementedError:
+            pass
+    try:
+        left, top, right, bottom = bounds_of(item)
+    except (TypeError, ValueError):
+        return UNBOUNDED
+    return np.array([left, top, 0.0, right, bottom, 0.0])
+
+# Batched tests take boxes column-major, as a 6 x N array whose rows are min x, min y, min z,
+# max x, max y and max z, so that every step works on contiguous rows.
+
+def in_viewport(columns, viewport) -> np.ndarray:
+    """
+    Mask of the boxes whose x/y extent overlaps `viewport`.
+    :param columns: 6 x N box array.
+    :param viewport: (x, y, width, height), e.g. a pygame.Rect.
+    """
+    x, y, width, height = viewport
+    mask = columns[0] <= x + width
+    mask &= columns[3] >= x
+    mask &= columns[1] <= y + height
+    mask &= columns[4] >= y
+    return mask
+
+def in_frustum(columns, planes) -> np.ndarray:
+    """
+    Mask of the boxes not entirely outside any of `planes` (Camera.frustum_planes()).
+    For each plane only the box corner furthest along its normal is tested, so this is
+    conservative: boxes near a frustum corner may be kept although they are outside.
+    """
+    # Distance of the furthest corner = normal . center + |normal| . half extent + d,
+    # evaluated in chunks so the 6 x chunk temporaries stay in cache
+    normals = planes[:, :3]
+    magnitudes = np.abs(normals)
+    offsets = planes[:, 3:]
+    count = columns.shape[1]
+    mask = np.empty(count, dtype=bool)
+    for start in range(0, count, _CHUNK):
+        chunk = columns[:, start:start + _CHUNK]
+        distance = normals @ (chunk[:3] + chunk[3:])
+        distance += magnitudes @ (chunk[3:] - chunk[:3])
+        distance *= 0.5
+        distance += offsets
+        visible = mask[start:start + _CHUNK]
+        np.greater_equal(distance[0], 0, out=visible)
+        for row in distance[1:]:
+            visible &= row >= 0
+    return mask
+
+def visible_mask(columns, camera=None, viewport=None) -> np.ndarray:
+    """
+    Mask of the visible boxes.
+    :param columns: 6 x N box array.
+    :param camera: If it has frustum planes, boxes are tested against them.
+    :param viewport: (x, y, width, height) tested against the x/y extent of each box.
+    """
+    mask = np.ones(columns.shape[1], dtype=bool)
+    planes = camera.frustum_planes() if camera is not None else None
+    if planes is not None:
+        mask &= in_frustum(columns, planes)
+    if viewport is not None:
+        mask &= in_viewport(columns, viewport)
+    return mask
+
+class Culler:
+    def __init__(self, items=()):
+        """
+        Keeps the bounding boxes of a collection of shapes or components in one array so that
+        visibility against a camera frustum or a 2D viewport is a single vectorized pass.
+        Call update() after an item moves.
+        """
+        self.items = []
+        self.rows = {}  # item -> column in the box array
+        self._columns = np.empty((6, 16))
+        for item in items:
+            self.add(item)
+
+    @property
+    def columns(self) -> np.ndarray:
+        """The 6 x N box array."""
+        return self._columns[:, :len(self.items)]
+
+    @property
+    def boxes(self) -> np.ndarray:
+        """N x 6 view of the boxes, one row per item."""
+        return self.columns.T
+
+    def add(self, item):
+        if item in self.rows:
+            return self.update(item)
+        if len(self.items) == self._columns.shape[1]:
+            self._columns = np.concatenate([self._columns, np.empty_like(self._columns)], axis=1)
+        self.rows[item] = len(self.items)
+        self._columns[:, len(self.items)] = box_of(item)
+        self.items.append(item)
+
+    def remove(self, item):
+        """Remove in O(1) by moving the last item into the freed column."""
+        row = self.rows.pop(item)
+        last = self.items.pop()
+        if last is not item:
+            self.items[row] = last
+            self.rows[last] = row
+            self._columns[:, row] = self._columns[:, len(self.items)]
+
+    def update(self, item):
+        self._columns[:, self.rows[item]] = box_of(item)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.rows
+
+    def visible_mask(self, camera=None, viewport=None) -> np.ndarray:
+        """Mask over self.items; see the module-level visible_mask."""
+        return visible_mask(self.columns, camera, viewport)
+
+    def visible(self, camera=None, viewport=None) -> list:
+        """The visible items, in the order they were added apart from swap-removals."""
+        items = self.items
+        return [items[i] for i in np.flatnonzero(self.visible_mask(camera, viewport))]
+
+def cull(items, camera=None, viewport=None) -> list:
+    """The visible subset of `items`, in order. Use a Culler to keep the boxes between frames."""
+    columns = np.array([box_of(item) for item in items]).reshape(-1, 6).T.copy()
+    mask = visible_mask(columns, camera, viewport)
+    return [item for item, shown in zip(items, mask) if shown]
@@ -1,4 +1,6 @@
 import math
+import numpy as np
+from scipy.signal import lfilter
 
 class Engine:
     def __init__(self, max_rpm=7000, friction=0.1, baseline_ratio=0.5):
@@ -30,8 +32,9 @@ class Engine:
         if not self.revs_forward and pedal_input < self.baseline_ratio:
             target_rpm = -target_rpm
 
-        # Smooth transition to target RPM
-        self.current_rpm += (target_rpm - self.current_rpm) * (1 - self.friction)
+        # Smooth transition to target RPM (written as the first-order recurrence
+        # rpm = friction * rpm + (1 - friction) * target, the form simulate() filters with)
+        self.current_rpm = self.friction * self.current_rpm + (1 - self.friction) * target_rpm
 
     def get_play_speed(self):
         """
@@ -39,3 +42,134 @@ class Engine:
         Positive values mean forward; negative values mean reverse.
         """
         return self.current_rpm / self.max_rpm
+
+    def rpm_trajectory(self, pedal_inputs):
+        """
+        Step the engine once per pedal input.
+        :param pedal_inputs: Sequence of pedal positions (0-1), one per control tick.
+        :return: Array of the RPM after each step.
+        """
+        rpm = Engine.simulate(pedal_inputs, self.max_rpm, self.friction, self.baseline_ratio,
+                              self.revs_forward, self.current_rpm)
+        if len(rpm):
+            self.current_rpm = rpm[-1]
+        return rpm
+
+    @staticmethod
+    def target_rpm(pedal_inputs, max_rpm=7000, baseline_ratio=0.5, revs_forward=True):
+        """
+        Vectorized pedal-to-target-RPM mapping used by update_rpm.
+        All arguments broadcast against each other.
+        """
+        pedal_inputs = np.asarray(pedal_inputs, dtype=np.float64)
+        baseline_rpm = max_rpm * baseline_ratio
+        below = pedal_inputs < baseline_ratio
+        with np.errstate(divide="ignore", invalid="ignore"):
+            target = np.where(below,
+                              baseline_rpm * (pedal_inputs / baseline_ratio),
+                              baseline_rpm + (pedal_inputs - baseline_ratio) * (max_rpm - baseline_rpm))
+        return np.where(below & ~np.asarray(revs_forward, dtype=bool), -target, target)
+
+    @staticmethod
+    def simulate(pedal_inputs, max_rpm=7000, friction=0.1, baseline_ratio=0.5, revs_forward=True, initial_rpm=0.0):
+        """
+        Run update_rpm over a whole pedal sequence, for one engine or a batch, in one call.
+        The smoothing recurrence is evaluated with scipy.signal.lfilter, which performs the
+        same floating-point operations as update_rpm, so results match it exactly.
+        :param pedal_inputs: Array of shape (steps,) or (engines, steps).
+        :param max_rpm: Scalar or one value per engine.
+        :param friction: Scalar or one value per engine.
+        :param baseline_ratio: Scalar or one value per engine.
+        :param revs_forward: Scalar or one value per engine.
+        :param initial_rpm: Scalar or one value per engine.
+        :return: RPM after every step, with the same shape as `pedal_inputs`.
+        """
+        pedal_inputs = np.asarray(pedal_inputs, dtype=np.float64)
+        pedals = np.atleast_2d(pedal_inputs)
+        engines = pedals.shape[0]
+
+        def column(value):
+            return np.broadcast_to(np.asarray(value), (engines,)).reshape(engines, 1)
+
+        friction = column(friction).astype(np.float64)
+        target = Engine.target_rpm(pedals, column(max_rpm), column(baseline_ratio), column(revs_forward))
+        rpm = np.empty_like(target)
+        initial = column(initial_rpm).astype(np.float64)
+        # lfilter takes one set of coefficients, so engines are filtered in groups of equal friction
+        for value in np.unique(friction):
+            rows = friction[:, 0] == value
+            rpm[rows], _ = lfilter([1 - value], [1, -value], target[rows], axis=1, zi=value * initial[rows])
+        return rpm.reshape(pedal_inputs.shape)
+
+    @staticmethod
+    def simulate_engines(engines, pedal_inputs):
+        """
+        Simulate a list of Engine objects, each with its own row of pedal inputs,
+        and leave every engine at its final RPM as if update_rpm had been called.
+        :param engines: Sequence of Engine.
+        :param pedal_inputs: Array of shape (len(engines), steps), or (steps,) shared by all.
+        :return: Array of shape (len(engines), steps).
+        """
+        pedal_inputs = np.broadcast_to(np.asarray(pedal_inputs, dtype=np.float64),
+                                       (len(engines), np.shape(pedal_inputs)[-1]))
+        rpm = Engine.simulate(
+            pedal_inputs,
+            [engine.max_rpm for engine in engines],
+            [engine.friction for engine in engines],
+            [engine.baseline_ratio for engine in engines],
+            [engine.revs_forward for engine in engines],
+            [engine.current_rpm for engine in engines],
+        )
+        if rpm.shape[1]:
+            for engine, final in zip(engines, rpm[:, -1]):
+                engine.current_rpm = final
+        return rpm
+
+class EngineModulator:
+    def __init__(self, engine, pedal=0.0, samplerate=44100, control_rate=60):
+        """
+        Turns an Engine into a per-sample playback speed curve for Sound.
+        The engine is stepped `control_rate` times per second of audio and the resulting
+        speed is interpolated linearly between ticks, so it changes smoothly inside a block
+        instead of jumping at block boundaries.
+        :param engine: The Engine to drive.
+        :param pedal: Pedal position (0-1), or a callable mapping an array of times in seconds
+                      to pedal positions.
+        :param samplerate: Output sample rate the speed curve is produced at.
+        :param control_rate: Engine steps per second.
+        """
+        self.engine = engine
+        self.pedal = pedal
+        self.samplerate = samplerate
+        self.period = samplerate / control_rate  # Frames between engine steps
+        self.elapsed = 0  # Frames produced so far
+        # Interpolation knots bracketing the start of the next block, relative to it
+        self._last = (0.0, engine.current_rpm)
+        self._next = (self.period, engine.rpm_trajectory(self._pedal_at(np.array([self.period])))[0])
+
+    def _pedal_at(self, offsets):
+        if callable(self.pedal):
+            return self.pedal((self.elapsed + offsets) / self.samplerate)
+        return np.full(len(offsets), self.pedal)
+
+    def __call__(self, frames):
+        """
+        Speed for each of the next `frames` output frames.
+        :return: Array of signed speeds (RPM / max RPM).
+        """
+        last_x, last_rpm = self._last
+        next_x, next_rpm = self._next
+        count = max(0, math.ceil((frames - next_x) / self.period))
+        ticks = next_x + self.period * np.arange(1, count + 1)
+        rpm = self.engine.rpm_trajectory(self._pedal_at(ticks))
+
+        knots_x = np.concatenate(([last_x, next_x], ticks))
+        knots_rpm = np.concatenate(([last_rpm, next_rpm], rpm))
+        speed = np.interp(np.arange(frames), knots_x, knots_rpm) / self.engine.max_rpm
+
+        # Keep the pair of knots around the end of this block for the next call
+        self._last = (knots_x[-2] - frames, knots_rpm[-2])
+        self._next = (knots_x[-1] - frames, knots_rpm[-1])
+        self.elapsed += frames
+        return speed
+
@@ -0,0 +1,107 @@
+import pygame
+
+# Events that go to one component instead of being broadcast
+POINTER_EVENTS = frozenset((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION))
+KEY_EVENTS = frozenset((pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING))
+ROUTED_EVENTS = POINTER_EVENTS | KEY_EVENTS
+
+class EventDispatcher:
+    def __init__(self, root):
+        """
+        Routes events through a component tree instead of broadcasting them.
+        Pointer events go to the topmost, deepest component under the cursor, found by
+        descending the tree through each container's child_index(), so dispatch costs
+        O(depth) rather than O(components). The target receives the event with `pos`
+        translated into the coordinates of its own rect, so nested components can test
+        it against self.rect. A component with `captures_pointer` set that receives a
+        left button press keeps all pointer events until the button is released (e.g. a
+        Slider being dragged). Keyboard events go to the focused component: the
+        last clicked one if it is `focusable`, or whichever set_focus() chose.
+        Everything else is broadcast to the root's children as before.
+        :param root: A View, or any object with `children` and child_index().
+        """
+        self.root = root
+        self.captured = None  # Component receiving all pointer events, if any
+        self.focused = None  # Component receiving keyboard events, if any
+        self.hovered = None  # Target of the last pointer event
+
+    def hit_test(self, x, y):
+        """
+        The topmost, deepest component containing (x, y), or None.
+        Child rects are relative to their parent's absolute position (see
+        Component.get_absolute_position); children of the root are in canvas coordinates.
+        """
+        container, target = self.root, None
+        origin_x = origin_y = 0
+        while getattr(container, "children", None):
+            local_x, local_y = x - origin_x, y - origin_y
+            hits = container.child_index().query_point(local_x, local_y)
+            if not hits:
+                break
+            target = container = hits[-1]
+            if not hasattr(target, "rect"):  # A bare shape: nothing below it
+                break
+            origin_x += target.rect.x
+            origin_y += target.rect.y
+        return target
+
+    def capture(self, component):
+        """Send every pointer event to `component` until release() (or the next button release)."""
+        self.captured = component
+
+    def release(self):
+        self.captured = None
+
+    def forget(self, component):
+        """Drop any capture, focus or hover held by `component`, e.g. when it is removed."""
+        if self.captured is component:
+            self.captured = None
+        if self.focused is component:
+            self.focused = None
+        if self.hovered is component:
+            self.hovered = None
+
+    def set_focus(self, component):
+        """Send keyboard events to `component`; None drops them."""
+        self.focused = component
+
+    def dispatch(self, event):
+        """
+        Deliver one event.
+        :return: The component it was routed to, None if nothing took it or it was broadcast.
+        """
+        if event.type in POINTER_EVENTS:
+            return self._dispatch_pointer(event)
+        if event.type in KEY_EVENTS:
+            if self.focused is not None:
+                self.focused.handle_event(event)
+            return self.focused
+        for component in self.root.children:
+            if hasattr(component, "handle_event"):
+                component.handle_event(event)
+        return None
+
+    @staticmethod
+    def _localize(target, event):
+        """`event` with its position relative to the parent of `target`, the frame target.rect is in."""
+        parent = getattr(target, "parent", None)
+        if not hasattr(parent, "get_absolute_position"):
+            return event
+        origin_x, origin_y = parent.get_absolute_position()
+        if not (origin_x or origin_y):
+            return event
+        x, y = event.pos
+        return pygame.event.Event(event.type, {**event.dict, "pos": (x - origin_x, y - origin_y)})
+
+    def _dispatch_pointer(self, event):
+        target = self.captured or self.hit_test(*event.pos)
+        self.hovered = target
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            self.focused = target if getattr(target, "focusable", False) else None
+            if event.button == 1 and getattr(target, "captures_pointer", False):
+                self.captured = target
+        if hasattr(target, "handle_event"):
+            target.handle_event(self._localize(target, event))
+        if event.type == pygame.MOUSEBUTTONUP and self.captured is not None:
+            self.captured = None
+        return target
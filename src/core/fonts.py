@@ -0,0 +1,91 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+import pygame
+
+class FontManager:
+    def __init__(self, text_cache_size=1024):
+        """
+        Process-wide registry of pygame fonts and rendered text.
+        Each (path, size) is loaded from disk once and the Font shared by every Style that
+        asks for it. Rendered text surfaces are kept in an LRU, so labels and readouts that
+        show the same strings again are blitted instead of re-rendered.
+        :param text_cache_size: Number of rendered text surfaces kept.
+        """
+        self.text_cache_size = text_cache_size
+        self.lock = threading.Lock()
+        self._fonts = {}
+        self._texts = OrderedDict()
+        self.loads = 0  # Fonts read from disk
+        self.hits = 0  # render() calls answered from the text cache
+        self.misses = 0  # render() calls that had to render
+
+    def _check_init(self):
+        """(Re)initialize pygame.font; fonts from before a pygame.font.quit() are unusable. Caller holds the lock."""
+        if not pygame.font.get_init():
+            pygame.font.init()
+            self._fonts.clear()
+            self._texts.clear()
+
+    def font(self, path=None, size=24):
+        """
+        Return the shared Font for `path` at `size`, loading it on first request.
+        :param path: Font file, or None for pygame's default font.
+        """
+        key = (None if path is None else str(path), size)
+        with self.lock:
+            self._check_init()
+            font = self._fonts.get(key)
+            if font is None:
+                if path is not None and not Path(path).exists():
+                    raise FileNotFoundError(f"Font file not found: {path}")
+                font = pygame.font.Font(key[0], size)
+                self._fonts[key] = font
+                self.loads += 1
+            return font
+
+    def render(self, font, text, antialias, color, background=None):
+        """
+        font.render() through the text cache. The returned surface is shared: blit it, don't draw on it.
+        :param font: A Font, preferably one from font() so equal fonts share cache entries.
+        """
+        key = (font, text, antialias, tuple(color), None if background is None else tuple(background))
+        with self.lock:
+            surface = self._texts.get(key)
+            if surface is not None:
+                self._texts.move_to_end(key)
+                self.hits += 1
+                return surface
+            self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        with self.lock:
+            self._texts[key] = surface
+            while len(self._texts) > self.text_cache_size:
+                self._texts.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Forget every font and rendered text; fonts still held by styles keep working."""
+        with self.lock:
+            self._fonts.clear()
+            self._texts.clear()
+
+    def stats(self):
+        return {
+            "fonts": len(self._fonts),
+            "texts": len(self._texts),
+            "loads": self.loads,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+_default_manager = None
+_default_lock = threading.Lock()
+
+def get_font_manager():
+    """Return the process-wide FontManager."""
+    global _default_manager
+    with _default_lock:
+        if _default_manager is None:
+            _default_manager = FontManager()
+        return _default_manager
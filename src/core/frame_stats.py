@@ -0,0 +1,54 @@
+from collections import deque
+import numpy as np
+
+class FrameStats:
+    def __init__(self, target_fps=60, window=600):
+        """
+        Rolling frame-time statistics of a render loop.
+        A frame's time is the work done for it (event handling, updates and drawing), not the
+        time spent sleeping or waiting for events, so idle periods never count as slow frames.
+        :param target_fps: Frame rate the loop is paced to; a frame longer than its period is dropped.
+        :param window: Number of most recent frames the statistics cover.
+        """
+        self.target_fps = target_fps
+        self.times = deque(maxlen=window)
+        self.frames = 0  # Frames recorded since the last reset
+        self.dropped = 0  # Of those, frames that overran the frame period
+
+    @property
+    def budget(self):
+        """Seconds available per frame, or None when the loop is not paced."""
+        return 1 / self.target_fps if self.target_fps else None
+
+    def record(self, seconds):
+        self.times.append(seconds)
+        self.frames += 1
+        budget = self.budget
+        if budget is not None and seconds > budget:
+            self.dropped += 1
+
+    def reset(self):
+        self.times.clear()
+        self.frames = 0
+        self.dropped = 0
+
+    def summary(self):
+        """
+        :return: Dict with the frame count, dropped frames, and the mean, 95th percentile,
+                 99th percentile and worst frame time in seconds over the window.
+        """
+        times = np.array(self.times)
+        if len(times):
+            mean = float(times.mean())
+            p95, p99 = (float(p) for p in np.percentile(times, [95, 99]))
+            worst = float(times.max())
+        else:
+            mean = p95 = p99 = worst = 0.0
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped,
+            "mean": mean,
+            "p95": p95,
+            "p99": p99,
+            "max": worst,
+        }
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
 import math
 from typing import Union, List, Optional
 import numpy as np
@@ -7,6 +8,8 @@ def matrices_equal_with_tolerance(mat1, mat2, tol=1e-6):
     return np.allclose(mat1, mat2, atol=tol)
 
 class Vector:
+    __slots__ = ("coords",)
+
     def __init__(self, *coords: Union[float, int]):
         if len(coords) not in [2, 3]:
             raise ValueError("Vector must be 2D or 3D.")
@@ -33,21 +36,234 @@ class Vector:
         return f"Vector({', '.join(map(str, self.coords))})"
 
     def __add__(self, other: 'Vector') -> 'Vector':
+        if isinstance(other, VectorArray):
+            return NotImplemented  # Broadcast over the array instead
         if len(self.coords) != len(other.coords):
             raise ValueError("Vectors must have the same dimensions.")
         return Vector(*(a + b for a, b in zip(self.coords, other.coords)))
 
     def __sub__(self, other: 'Vector') -> 'Vector':
+        if isinstance(other, VectorArray):
+            return NotImplemented
         if len(self.coords) != len(other.coords):
             raise ValueError("Vectors must have the same dimensions.")
         return Vector(*(a - b for a, b in zip(self.coords, other.coords)))
 
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self.coords, dtype=dtype or np.float64)
+
+class VectorArray:
+    """
+    N 2D or 3D vectors stored as one contiguous N x 2 / N x 3 float64 array.
+    Arithmetic, length and projection run over the whole batch at once, and a
+    single Vector operand is broadcast against every row.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        if data.ndim != 2 or data.shape[1] not in [2, 3]:
+            raise ValueError("VectorArray must be N x 2 or N x 3.")
+        self.data = data
+
+    @classmethod
+    def from_vectors(cls, vectors: List[Vector]) -> 'VectorArray':
+        return cls([v.coords for v in vectors])
+
+    def to_vectors(self) -> List[Vector]:
+        return [Vector(*row) for row in self.data.tolist()]
+
+    @property
+    def dims(self) -> int:
+        return self.data.shape[1]
+
+    def x(self) -> np.ndarray:
+        return self.data[:, 0]
+
+    def y(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    def z(self) -> np.ndarray:
+        if self.dims < 3:
+            raise AttributeError("These vectors do not have a z-coordinate.")
+        return self.data[:, 2]
+
+    def project_to_2d(self) -> 'VectorArray':
+        return VectorArray(self.data[:, :2])
+
+    def length(self) -> np.ndarray:
+        return np.sqrt(np.einsum("ij,ij->i", self.data, self.data))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index):
+        """An integer gives a Vector; a slice or mask gives a VectorArray (a view for slices)."""
+        if isinstance(index, (int, np.integer)):
+            return Vector(*self.data[index])
+        return VectorArray(self.data[index])
+
+    def __iter__(self):
+        return iter(self.to_vectors())
+
+    def __array__(self, dtype=None, copy=None):
+        return self.data if dtype is None else self.data.astype(dtype)
+
+    def __repr__(self):
+        return f"VectorArray({len(self)}x{self.dims})"
+
+    def _operand(self, other):
+        if isinstance(other, VectorArray):
+            other = other.data
+        elif isinstance(other, Vector):
+            other = np.array(other.coords)
+        else:
+            other = np.asarray(other, dtype=np.float64)
+        if other.shape[-1] != self.dims:
+            raise ValueError("Vectors must have the same dimensions.")
+        return other
+
+    def __add__(self, other) -> 'VectorArray':
+        return VectorArray(self.data + self._operand(other))
 
+    __radd__ = __add__
+
+    def __sub__(self, other) -> 'VectorArray':
+        return VectorArray(self.data - self._operand(other))
+
+    def __rsub__(self, other) -> 'VectorArray':
+        return VectorArray(self._operand(other) - self.data)
+
+    def __iadd__(self, other) -> 'VectorArray':
+        self.data += self._operand(other)
+        return self
+
+    def __isub__(self, other) -> 'VectorArray':
+        self.data -= self._operand(other)
+        return self
+
+
+
+class Transform:
+    """
+    Affine transform stored as a homogeneous matrix: 3 x 3 for 2D points, 4 x 4 for 3D points.
+    Compose with `a @ b` (b is applied first); the inverse is computed once, on first use.
+    """
+    __slots__ = ("matrix", "dims", "_inverse")
+
+    def __init__(self, matrix):
+        matrix = np.array(matrix, dtype=np.float64)
+        if matrix.shape not in [(3, 3), (4, 4)]:
+            raise ValueError("Transform matrices must be 3 x 3 or 4 x 4.")
+        self.matrix = matrix
+        self.dims = len(matrix) - 1
+        self._inverse = None
+
+    @classmethod
+    def of(cls, mat, dims=3) -> 'Transform':
+        """
+        Coerce `mat` to a Transform on `dims`-dimensional points.
+        :param mat: A Transform, a homogeneous (dims + 1) x (dims + 1) matrix or a dims x dims linear map.
+        """
+        if isinstance(mat, Transform):
+            if mat.dims != dims:
+                raise ValueError(f"Expected a {dims}D transform.")
+            return mat
+        mat = np.asarray(mat, dtype=np.float64)
+        if mat.shape == (dims + 1, dims + 1):
+            return cls(mat)
+        if mat.shape == (dims, dims):
+            matrix = np.eye(dims + 1)
+            matrix[:dims, :dims] = mat
+            return cls(matrix)
+        raise ValueError(f"A {dims}D transform needs a {dims} x {dims} or {dims + 1} x {dims + 1} matrix.")
+
+    @classmethod
+    def identity(cls, dims=3) -> 'Transform':
+        return cls(np.eye(dims + 1))
+
+    @classmethod
+    def translation(cls, *offset) -> 'Transform':
+        matrix = np.eye(len(offset) + 1)
+        matrix[:-1, -1] = offset
+        return cls(matrix)
+
+    @classmethod
+    def scale(cls, *factors) -> 'Transform':
+        return cls(np.diag([*factors, 1.0]))
+
+    @classmethod
+    def rotation(cls, angle, axis="z", dims=3) -> 'Transform':
+        """Counter-clockwise rotation by `angle` radians about `axis` ("x", "y" or "z"; 2D rotations ignore it)."""
+        c, s = math.cos(angle), math.sin(angle)
+        plane = {"x": (1, 2), "y": (2, 0), "z": (0, 1)}[axis] if dims == 3 else (0, 1)
+        matrix = np.eye(dims + 1)
+        i, j = plane
+        matrix[i, i], matrix[i, j], matrix[j, i], matrix[j, j] = c, -s, s, c
+        return cls(matrix)
+
+    @property
+    def inverse(self) -> 'Transform':
+        if self._inverse is None:
+            self._inverse = Transform(np.linalg.inv(self.matrix))
+            self._inverse._inverse = self
+        return self._inverse
+
+    def apply(self, points):
+        """
+        Transform a Vector, a VectorArray or an N x k array of points (k <= dims; missing
+        coordinates are taken as 0). Returns the same kind of object, with dims coordinates.
+        """
+        if isinstance(points, Vector):
+            return Vector(*self._apply_array(np.array([points.coords]))[0])
+        if isinstance(points, VectorArray):
+            return VectorArray(self._apply_array(points.data))
+        return self._apply_array(np.asarray(points, dtype=np.float64))
+
+    def _apply_array(self, points):
+        dims, given = self.dims, points.shape[1]
+        if given > dims:
+            raise ValueError(f"Cannot apply a {dims}D transform to {given}D points.")
+        # Missing coordinates are 0, so only the matching columns of the linear part contribute
+        out = points @ self.matrix[:dims, :given].T
+        out += self.matrix[:dims, dims]
+        return out
+
+    def __matmul__(self, other):
+        if isinstance(other, Transform):
+            if other.dims != self.dims:
+                raise ValueError("Transforms must have the same dimensions.")
+            return Transform(self.matrix @ other.matrix)
+        return self.apply(other)
+
+    def __repr__(self):
+        return f"Transform({self.matrix.tolist()})"
+
+def as_points(points) -> np.ndarray:
+    """Return a VectorArray, array or list of Vectors as an N x 2 / N x 3 float64 array."""
+    if isinstance(points, VectorArray):
+        return points.data
+    if isinstance(points, (list, tuple)) and points and isinstance(points[0], Vector):
+        return VectorArray.from_vectors(points).data
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] not in [2, 3]:
+        raise ValueError("Points must be N x 2 or N x 3.")
+    return points
 
 class Shape(ABC):
+    # Names of cached_property values derived from the public attributes; assigning any
+    # public attribute discards them. Mutating a Vector list in place does not.
+    _derived = ()
+
     def __init__(self):
         self.style = None  # Placeholder for style
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            for derived in self._derived:
+                self.__dict__.pop(derived, None)
+
     @abstractmethod
     def bounds(self):
         pass
@@ -56,6 +272,26 @@ class Shape(ABC):
     def contains(self, x, y, z=None, mat=None) -> bool:
         pass
 
+    def contains_many(self, points) -> np.ndarray:
+        """
+        Vectorized contains() over many points.
+        :param points: VectorArray, N x 2 / N x 3 array or list of Vectors.
+        :return: Boolean mask of length N.
+        """
+        return self.bounds().contains_many(points)
+
+    def contains_grid(self, xs, ys) -> np.ndarray:
+        """
+        contains_many() over every (x, y) pair of a grid, e.g. pixel centers.
+        :param xs: 1D array of x coordinates (columns).
+        :param ys: 1D array of y coordinates (rows).
+        :return: Boolean mask of shape (len(ys), len(xs)).
+        """
+        points = np.empty((len(ys), len(xs), 2))
+        points[..., 0] = xs
+        points[..., 1] = np.asarray(ys)[:, None]
+        return self.contains_many(points.reshape(-1, 2)).reshape(len(ys), len(xs))
+
 class Shape2D(Shape):
     def __init__(self):
         super().__init__()
@@ -67,10 +303,63 @@ class Shape2D(Shape):
         return self.bounds().contains(x, y)
 
 class Shape3D(Shape):
+    _derived = ("transform", "_box")
+
     def __init__(self):
         super().__init__()
-        self.rotation_matrix = None  # Placeholder for rotation
-        self.translation_vector = None  # Placeholder for translation
+        self.rotation_matrix = None  # 3 x 3 linear map, 4 x 4 matrix or Transform, applied first
+        self.translation_vector = None  # Offset applied after the rotation
+
+    @cached_property
+    def transform(self) -> Optional[Transform]:
+        """Shape-to-world transform, or None when the shape is untransformed."""
+        if self.rotation_matrix is None and self.translation_vector is None:
+            return None
+        transform = Transform.identity(3)
+        if self.rotation_matrix is not None:
+            transform = Transform.of(self.rotation_matrix, 3)
+        if self.translation_vector is not None:
+            transform = Transform.translation(*self.translation_vector.coords) @ transform
+        return transform
+
+    def _to_local(self, mat=None) -> Optional[Transform]:
+        """
+        The single transform taking a query point, after the optional `mat`, into the shape's
+        own coordinates; None if no transform applies.
+        """
+        local = self.transform.inverse if self.transform is not None else None
+        if mat is None:
+            return local
+        mat = Transform.of(mat, 3)
+        return mat if local is None else local @ mat
+
+    def _local_point(self, x, y, z, mat=None) -> Vector:
+        point = Vector(x, y, z or 0.0)
+        local = self._to_local(mat)
+        return point if local is None else local.apply(point)
+
+    def _local_points(self, points, mat=None) -> np.ndarray:
+        points = as_points(points)
+        local = self._to_local(mat)
+        return points if local is None else local.apply(points)
+
+    def _outline(self) -> np.ndarray:
+        """Points in shape coordinates whose world-space bounding box bounds the shape."""
+        raise NotImplementedError("Must be implemented in subclasses.")
+
+    @cached_property
+    def _box(self) -> np.ndarray:
+        outline = self._outline()
+        points = outline if self.transform is None else self.transform.apply(outline)
+        return np.concatenate((points.min(axis=0), points.max(axis=0)))
+
+    def box(self) -> np.ndarray:
+        """World-space bounding box as (min x, min y, min z, max x, max y, max z)."""
+        return self._box
+
+    def _world_bounds(self) -> 'Rect':
+        box = self._box
+        return Rect(Vector(box[0], box[1]), Vector(box[3] - box[0], box[4] - box[1]))
 
     def bounds(self):
         raise NotImplementedError("Must be implemented in subclasses.")
@@ -95,6 +384,16 @@ class Rect(Shape2D):
             self.top_left.coords[1] <= y <= self.top_left.coords[1] + self.height
         )
 
+    def contains_many(self, points) -> np.ndarray:
+        points = as_points(points)
+        left, top = self.top_left.coords[0], self.top_left.coords[1]
+        x, y = points[:, 0], points[:, 1]
+        mask = x >= left
+        mask &= x <= left + self.width
+        mask &= y >= top
+        mask &= y <= top + self.height
+        return mask
+
     def to_pygame_rect(self):
         from pygame import Rect as PygameRect
         return PygameRect(
@@ -105,6 +404,8 @@ class Rect(Shape2D):
         )
 
 class Rect3D(Shape3D):
+    _derived = Shape3D._derived + ("_projected",)
+
     def __init__(self, plane_origin: Vector, dims: Vector):
         super().__init__()
         self.plane_origin = plane_origin
@@ -112,15 +413,35 @@ class Rect3D(Shape3D):
         self.height = dims.coords[1]
 
     def bounds(self):
+        if self.transform is not None:
+            return self._world_bounds()
+        return self._projected
+
+    @cached_property
+    def _projected(self) -> 'Rect':
         # Project the plane onto the XY plane and return a Rect
         projected_top_left = Vector(self.plane_origin.coords[0], self.plane_origin.coords[1])
         return Rect(projected_top_left, Vector(self.width, self.height))
 
+    def _outline(self) -> np.ndarray:
+        x, y = self.plane_origin.coords[0], self.plane_origin.coords[1]
+        z = self.plane_origin.coords[2] if len(self.plane_origin.coords) > 2 else 0.0
+        return np.array([[x, y, z], [x + self.width, y, z], [x, y + self.height, z],
+                         [x + self.width, y + self.height, z]])
+
     def contains(self, x, y, z=None, mat=None) -> bool:
         # Apply transformation to determine containment
-        return self.bounds().contains(x, y)
+        if self.transform is None and mat is None:
+            return self._projected.contains(x, y)
+        point = self._local_point(x, y, z, mat)
+        return self._projected.contains(point.coords[0], point.coords[1])
+
+    def contains_many(self, points, mat=None) -> np.ndarray:
+        return self._projected.contains_many(self._local_points(points, mat))
 
 class Ellipse(Shape2D):
+    _derived = ("_radii",)
+
     def __init__(self, center: Vector, radii_x: Vector, radii_y: Vector):
         super().__init__()
         self.center = center
@@ -132,17 +453,38 @@ class Ellipse(Shape2D):
         if z is not None or mat is not None:
             raise ValueError("Ellipses are 2D shapes; z and mat are not applicable.")
 
-        # Transform the point if necessary
         point = Vector(x, y)
-        if mat:
-            point = mat @ point
 
         # Ellipse equation: ((x - h)/a)^2 + ((y - k)/b)^2 <= 1
-        rx = self.radii_x.length()
-        ry = self.radii_y.length()
+        rx, ry = self._radii
         relative = point - self.center
         return (relative.coords[0]/rx) ** 2 + (relative.coords[1]/ ry) ** 2 <= 1
 
+    @cached_property
+    def _radii(self):
+        return self.radii_x.length(), self.radii_y.length()
+
+    def contains_many(self, points) -> np.ndarray:
+        points = as_points(points)
+        if points.shape[1] != 2:
+            raise ValueError("Ellipses are 2D shapes; z and mat are not applicable.")
+        rx, ry = self._radii
+        u = (points[:, 0] - self.center.coords[0]) / rx
+        v = (points[:, 1] - self.center.coords[1]) / ry
+        u *= u
+        v *= v
+        u += v
+        return u <= 1
+
+    def contains_grid(self, xs, ys) -> np.ndarray:
+        # The quadratic form separates into a row term plus a column term
+        rx, ry = self._radii
+        u = (np.asarray(xs, dtype=np.float64) - self.center.coords[0]) / rx
+        v = (np.asarray(ys, dtype=np.float64) - self.center.coords[1]) / ry
+        u *= u
+        v *= v
+        return np.add(v[:, None], u) <= 1
+
     def bounds(self) -> Rect:
         """Returns the bounding rectangle of the ellipse."""
         top_left = self.center - Vector(self.radii_x.length(), self.radii_y.length())
@@ -150,72 +492,92 @@ class Ellipse(Shape2D):
         return Rect(top_left, bottom_right - top_left)
 
 class Ellipse3D(Shape3D):
+    _derived = Shape3D._derived + ("_projected",)
+
     def __init__(self, center: Vector, radii_x: Vector, radii_y: Vector):
         super().__init__()
         self.center = center
         self.radii_x = radii_x
         self.radii_y = radii_y
-    def bounds(self) -> Rect:
-        """
-        Return the 2D bounding rectangle of the projected ellipse.
-        """
-        # Project center and radii onto the 2D plane
-        projected_center = self.center.project_to_2d()
-        radii_x_2d = self.radii_x.project_to_2d()
-        radii_y_2d = self.radii_y.project_to_2d()
-
-        # Calculate top-left and dimensions of the bounding box
-        radii_x_length = radii_x_2d.length()
-        radii_y_length = radii_y_2d.length()
-        top_left = projected_center - Vector(radii_x_length, radii_y_length)
-        dimensions = Vector(2 * radii_x_length, 2 * radii_y_length)
 
-        return Rect(top_left, dimensions)
+    @cached_property
+    def _projected(self) -> Ellipse:
+        """The ellipse projected onto the XY plane."""
+        return Ellipse(self.center.project_to_2d(), self.radii_x.project_to_2d(), self.radii_y.project_to_2d())
 
     def contains(self, x: float, y: float, z: float, mat=None) -> bool:
         """Check if a 3D point is inside the ellipse's plane."""
-        point = Vector(x, y, z)
-        if mat:
-            point = mat @ point
+        point = self._local_point(x, y, z, mat)
 
         # Project the point onto the ellipse's plane and test using 2D logic
-        projected_center = self.center.project_to_2d()
-        radii_x_2d = self.radii_x.project_to_2d()
-        radii_y_2d = self.radii_y.project_to_2d()
-        ellipse_2d = Ellipse(projected_center, radii_x_2d, radii_y_2d)
-        return ellipse_2d.contains(point.coords[0], point.coords[1])
+        return self._projected.contains(point.coords[0], point.coords[1])
+
+    def contains_many(self, points, mat=None) -> np.ndarray:
+        return self._projected.contains_many(self._local_points(points, mat)[:, :2])
+
+    def contains_grid(self, xs, ys) -> np.ndarray:
+        if self.transform is None:
+            return self._projected.contains_grid(xs, ys)
+        return super().contains_grid(xs, ys)
+
+    def _outline(self) -> np.ndarray:
+        """Corners of the box around the projected ellipse that contains() tests, in the plane of the center."""
+        rx, ry = self._projected._radii
+        x, y = self.center.coords[0], self.center.coords[1]
+        z = self.center.coords[2] if len(self.center.coords) > 2 else 0.0
+        return np.array([[x - rx, y - ry, z], [x + rx, y - ry, z], [x - rx, y + ry, z], [x + rx, y + ry, z]])
 
     def bounds(self) -> Rect:
         """Return the 2D bounding rectangle of the projected ellipse."""
-        # Project the center and radii to 2D
-        projected_center = self.center.project_to_2d()
-        radii_x_2d = self.radii_x.project_to_2d()
-        radii_y_2d = self.radii_y.project_to_2d()
-        
-        # Calculate the furthest extents along x and y axes
-        top_left = projected_center - Vector(abs(radii_x_2d.coords[0]), abs(radii_y_2d.coords[1]))
-        bottom_right = projected_center + Vector(abs(radii_x_2d.coords[0]), abs(radii_y_2d.coords[1]))
-        
-        # Compute dimensions
-        dimensions = bottom_right - top_left
-        
-        # Return the bounding Rect
-        return Rect(top_left, dimensions)
+        if self.transform is not None:
+            return self._world_bounds()
+        return self._projected.bounds()
 
 
 class Triangle(Shape2D):
+    _derived = ("_edges",)
+
     def __init__(self, v1: Vector, v2: Vector, v3: Vector):
         super().__init__()
         self.vertices = [v1, v2, v3]
 
+    @cached_property
+    def _edges(self):
+        """Per edge (a, b): b.x, b.y, a.y - b.y and a.x - b.x, the constant terms of the sign test."""
+        edges = []
+        for a, b in zip(self.vertices, self.vertices[1:] + self.vertices[:1]):
+            ax, ay, bx, by = a.coords[0], a.coords[1], b.coords[0], b.coords[1]
+            edges.append((bx, by, ay - by, ax - bx))
+        return edges
+
+    def contains_many(self, points) -> np.ndarray:
+        """Barycentric sign test for every point at once."""
+        points = as_points(points)
+        if points.shape[1] != 2:
+            raise ValueError("Triangles are 2D shapes; z and mat are not applicable.")
+        x, y = points[:, 0], points[:, 1]
+        signs = []
+        for bx, by, dy, dx in self._edges:
+            # (p.x - b.x) * (a.y - b.y) - (a.x - b.x) * (p.y - b.y) < 0, as in contains()
+            side = (x - bx) * dy
+            side -= dx * (y - by)
+            signs.append(side < 0)
+        b1, b2, b3 = signs
+        return (b1 == b2) & (b2 == b3)
+
+    def contains_grid(self, xs, ys) -> np.ndarray:
+        # Each edge function is a column term minus a row term
+        xs, ys = np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+        signs = [np.subtract((xs - bx) * dy, (dx * (ys - by))[:, None]) < 0 for bx, by, dy, dx in self._edges]
+        b1, b2, b3 = signs
+        return (b1 == b2) & (b2 == b3)
+
     def contains(self, x: float, y: float, z=None, mat=None) -> bool:
         """Check if a point (x, y) is inside the triangle."""
         if z is not None or mat is not None:
             raise ValueError("Triangles are 2D shapes; z and mat are not applicable.")
 
         point = Vector(x, y)
-        if mat:
-            point = mat @ point
 
         def sign(p1, p2, p3):
             return (p1.coords[0] - p3.coords[0]) * (p2.coords[1] - p3.coords[1]) \
@@ -235,25 +597,38 @@ class Triangle(Shape2D):
         return Rect(top_left, Vector(width, height))
 
 class Triangle3D(Shape3D):
+    _derived = Shape3D._derived + ("_projected",)
+
     def __init__(self, v1: Vector, v2: Vector, v3: Vector):
         super().__init__()
         self.vertices = [v1, v2, v3]
 
+    @cached_property
+    def _projected(self) -> Triangle:
+        """The triangle projected onto the XY plane."""
+        return Triangle(*(v.project_to_2d() for v in self.vertices))
+
     def contains(self, x: float, y: float, z: float, mat=None) -> bool:
         """Check if a 3D point is inside the triangle's plane."""
-        point = Vector(x, y, z)
-        if mat:
-            point = mat @ point
+        point = self._local_point(x, y, z, mat)
 
         # Project the triangle onto a 2D plane and test using 2D logic
-        vertices_2d = [v.project_to_2d() for v in self.vertices]
-        point_2d = point.project_to_2d()
-        triangle_2d = Triangle(*vertices_2d)
-        return triangle_2d.contains(point_2d.coords[0], point_2d.coords[1])
+        return self._projected.contains(point.coords[0], point.coords[1])
+
+    def contains_many(self, points, mat=None) -> np.ndarray:
+        return self._projected.contains_many(self._local_points(points, mat)[:, :2])
+
+    def contains_grid(self, xs, ys) -> np.ndarray:
+        if self.transform is None:
+            return self._projected.contains_grid(xs, ys)
+        return super().contains_grid(xs, ys)
+
+    def _outline(self) -> np.ndarray:
+        return np.array([v.coords + (0.0,) * (3 - len(v.coords)) for v in self.vertices])
 
     def bounds(self) -> Rect:
         """Return the 2D bounding rectangle of the projected triangle."""
-        vertices_2d = [v.project_to_2d() for v in self.vertices]
-        triangle_2d = Triangle(*vertices_2d)
-        return triangle_2d.bounds()
+        if self.transform is not None:
+            return self._world_bounds()
+        return self._projected.bounds()
 
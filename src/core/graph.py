@@ -0,0 +1,265 @@
+import time
+from collections import deque
+import numpy as np
+from scipy.signal import sosfilt, sosfilt_zi
+from src.core.resample import Resampler
+
+def _head(buffer, frames):
+    """First `frames` rows of a buffer, without creating a view when the whole buffer is used."""
+    return buffer if frames == len(buffer) else buffer[:frames]
+
+class Node:
+    _instances = 0
+    def __init__(self, channels=2, name=None):
+        """
+        Base class for audio graph nodes.
+        Each node owns one preallocated (blocksize, channels) output buffer that it
+        overwrites in process(); downstream nodes read it directly.
+        :param channels: Output channel count.
+        :param name: Label used in profiling reports.
+        """
+        self.channels = channels
+        self.name = name or f"{type(self).__name__} ({Node._instances})"
+        Node._instances += 1
+        self.inputs = []
+        self.output = None
+
+    def prepare(self, blocksize):
+        """Allocate buffers for blocks of up to `blocksize` frames. Called by Graph on edits."""
+        self.output = np.zeros((blocksize, self.channels), dtype=np.float32)
+
+    def process(self, frames):
+        """Fill the first `frames` rows of self.output. Override in subclasses."""
+        raise NotImplementedError("Must be implemented in subclasses.")
+
+    def __repr__(self):
+        return self.name
+
+class SourceNode(Node):
+    def __init__(self, producer, channels=2, name=None):
+        """
+        Pulls blocks from a producer callable (e.g. Sound._generate_chunk or Mixer.render).
+        Mono producers are spread over every output channel.
+        """
+        super().__init__(channels, name)
+        self.producer = producer
+
+    def process(self, frames):
+        block = self.producer(frames)
+        out = _head(self.output, frames)
+        if block is None:
+            out.fill(0)
+            return
+        n = min(len(block), frames)
+        out[:n] = block[:n]
+        out[n:] = 0
+
+class ResampleNode(Node):
+    def __init__(self, source, speed=1.0, quality="linear", name=None):
+        """
+        Variable-speed reader over a looping array (or StreamingSource).
+        :param source: Array of shape (length, channels).
+        :param speed: Scalar speed, or a callable returning one speed per frame (e.g. EngineModulator).
+        :param quality: Resampler quality.
+        """
+        super().__init__(source.shape[1], name)
+        self.source = source
+        self.speed = speed
+        self.quality = quality
+        self.resampler = None
+
+    def prepare(self, blocksize):
+        super().prepare(blocksize)
+        position = self.resampler.position if self.resampler else 0.0
+        self.resampler = Resampler(self.quality, self.channels, blocksize)
+        self.resampler.position = position
+
+    def process(self, frames):
+        speed = self.speed(frames) if callable(self.speed) else self.speed
+        np.copyto(_head(self.output, frames), self.resampler.process(self.source, speed, frames))
+
+class GainNode(Node):
+    def __init__(self, gain=1.0, channels=2, name=None):
+        super().__init__(channels, name)
+        self.gain = gain
+
+    def process(self, frames):
+        np.multiply(_head(self.inputs[0].output, frames), self.gain, out=_head(self.output, frames))
+
+class FilterNode(Node):
+    def __init__(self, sos, channels=2, name=None):
+        """
+        IIR filter made of second-order sections, e.g. scipy.signal.butter(..., output="sos").
+        The filter state persists between blocks, so block boundaries are inaudible.
+        """
+        super().__init__(channels, name)
+        self.sos = np.asarray(sos, dtype=np.float64)
+        self.zi = np.zeros((len(self.sos), 2, channels))
+
+    def reset(self, level=0.0):
+        """Set the state to the steady state for a constant input at `level`."""
+        self.zi = sosfilt_zi(self.sos)[:, :, None] * level * np.ones(self.channels)
+
+    def process(self, frames):
+        # sosfilt has no output argument, so this copy is the node's only per-block allocation
+        filtered, self.zi = sosfilt(self.sos, _head(self.inputs[0].output, frames), axis=0, zi=self.zi)
+        np.copyto(_head(self.output, frames), filtered)
+
+class MixNode(Node):
+    def __init__(self, channels=2, name=None):
+        """Sums all of its inputs, each scaled by an optional per-input gain (see set_gain)."""
+        super().__init__(channels, name)
+        self.gains = {}
+
+    def set_gain(self, node, gain):
+        self.gains[node] = gain
+
+    def prepare(self, blocksize):
+        super().prepare(blocksize)
+        self._scratch = np.zeros((blocksize, self.channels), dtype=np.float32)
+
+    def process(self, frames):
+        out = _head(self.output, frames)
+        if not self.inputs:
+            out.fill(0)
+            return
+        scratch = _head(self._scratch, frames)
+        first = self.inputs[0]
+        np.multiply(_head(first.output, frames), self.gains.get(first, 1.0), out=out)
+        for node in self.inputs[1:]:
+            np.multiply(_head(node.output, frames), self.gains.get(node, 1.0), out=scratch)
+            out += scratch
+
+class SinkNode(Node):
+    def __init__(self, consumer=None, channels=2, name=None):
+        """
+        Graph output. Copies its input into its own buffer and optionally hands each block
+        to `consumer` (e.g. RingBuffer.write or SoundFile.write).
+        """
+        super().__init__(channels, name)
+        self.consumer = consumer
+
+    def process(self, frames):
+        out = _head(self.output, frames)
+        np.copyto(out, _head(self.inputs[0].output, frames))
+        if self.consumer is not None:
+            self.consumer(out)
+
+class Graph:
+    def __init__(self, blocksize=1024):
+        """
+        Block-based audio graph.
+        Nodes are sorted topologically once per edit and then evaluated in that order
+        for every block, each writing into its preallocated output buffer.
+        :param blocksize: Largest block the graph will be asked for.
+        """
+        self.blocksize = blocksize
+        self.nodes = []
+        self.sink = None
+        self.order = None  # Cached evaluation order, None after an edit
+        self.profiling = False
+        self.timings = {}
+
+    def add(self, node):
+        """Add a node; a SinkNode becomes the graph output. Returns the node."""
+        if node not in self.nodes:
+            self.nodes.append(node)
+            self.order = None
+        if isinstance(node, SinkNode):
+            self.sink = node
+        return node
+
+    def remove(self, node):
+        self.nodes.remove(node)
+        for other in self.nodes:
+            while node in other.inputs:
+                other.inputs.remove(node)
+            if isinstance(other, MixNode):
+                other.gains.pop(node, None)
+        if self.sink is node:
+            self.sink = None
+        self.order = None
+
+    def connect(self, source, destination):
+        """Feed `source`'s output into `destination`, adding either node if needed."""
+        self.add(source)
+        self.add(destination)
+        destination.inputs.append(source)
+        self.order = None
+        return destination
+
+    def disconnect(self, source, destination):
+        destination.inputs.remove(source)
+        if isinstance(destination, MixNode) and source not in destination.inputs:
+            destination.gains.pop(source, None)
+        self.order = None
+
+    def chain(self, *nodes):
+        """Connect the nodes in sequence; returns the last one."""
+        for source, destination in zip(nodes, nodes[1:]):
+            self.connect(source, destination)
+        return nodes[-1]
+
+    def _sort(self):
+        """Kahn's algorithm over the current edges; also (re)allocates every node's buffers."""
+        pending = {node: len(node.inputs) for node in self.nodes}
+        consumers = {node: [] for node in self.nodes}
+        for node in self.nodes:
+            for source in node.inputs:
+                consumers[source].append(node)
+        ready = deque(node for node in self.nodes if pending[node] == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for consumer in consumers[node]:
+                pending[consumer] -= 1
+                if pending[consumer] == 0:
+                    ready.append(consumer)
+        if len(order) != len(self.nodes):
+            raise ValueError("Audio graph contains a cycle.")
+        for node in order:
+            node.prepare(self.blocksize)
+        self.order = order
+        self.timings = {node: 0.0 for node in order}
+
+    def render(self, frames=None):
+        """
+        Process one block through every node.
+        :param frames: Block length, at most `blocksize` unless the graph is re-prepared.
+        :return: The sink's (frames, channels) buffer, reused between calls.
+        """
+        frames = frames or self.blocksize
+        if frames > self.blocksize:
+            self.blocksize = frames
+            self.order = None
+        if self.order is None:
+            self._sort()
+        if self.profiling:
+            for node in self.order:
+                start = time.perf_counter()
+                node.process(frames)
+                self.timings[node] += time.perf_counter() - start
+        else:
+            for node in self.order:
+                node.process(frames)
+        output = self.sink if self.sink is not None else self.order[-1]
+        return _head(output.output, frames)
+
+    __call__ = render
+
+    def profile(self, blocks=1000, frames=None):
+        """
+        Render `blocks` blocks and report the mean cost of each node.
+        :return: Dict of node name to mean seconds per block, in evaluation order.
+        """
+        if self.order is None:
+            self._sort()
+        self.timings = {node: 0.0 for node in self.order}
+        self.profiling = True
+        try:
+            for _ in range(blocks):
+                self.render(frames)
+        finally:
+            self.profiling = False
+        return {node.name: total / blocks for node, total in self.timings.items()}
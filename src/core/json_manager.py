@@ -15,14 +15,15 @@ class JSONManager:
     @staticmethod
     def save_json(data, file_path):
         """Saves JSON data to the specified file."""
-        with os.path.open(f"{file_path}", "w", encoding="utf-8") as file:
+        with Path(file_path).open("w", encoding="utf-8") as file:
             json.dump(data, file, indent=4)
 
 class ViewConfig:
     DEFAULTS = {
         "default_width": 800,
         "default_height": 600,
-        "default_delay": 60,
+        "target_fps": 60,
+        "idle_wait": True,
     }
 
     def __init__(self, config_path: Path):
@@ -32,7 +33,7 @@ class ViewConfig:
     def load_config(self):
         if not os.path.exists(f"{self.config_path}"):
             self.config = self.DEFAULTS
-            JSONManager.save_json(f"{self.config_path}", self.config)
+            JSONManager.save_json(self.config, self.config_path)
         else:
             self.config = JSONManager.load_json(self.config_path)
 
@@ -45,5 +46,44 @@ class ViewConfig:
         return self.config.get("default_height", self.DEFAULTS["default_height"])
 
     @property
-    def default_delay(self):
-        return self.config.get("default_delay", self.DEFAULTS["default_delay"])
\ No newline at end of file
+    def target_fps(self):
+        return self.config.get("target_fps", self.DEFAULTS["target_fps"])
+
+    @property
+    def idle_wait(self):
+        return self.config.get("idle_wait", self.DEFAULTS["idle_wait"])
+
+class SoundConfig:
+    DEFAULTS = {
+        "default_sample_rate": 44100,
+        "default_channels": 2,
+        "default_dtype": "float32",
+        "pcm_cache_dir": ".cache/pcm",
+        "pcm_cache_max_bytes": 1 << 30,
+    }
+
+    def __init__(self, config_path: Path):
+        self.config_path = config_path
+        self.load_config()
+
+    def load_config(self):
+        if not os.path.exists(f"{self.config_path}"):
+            self.config = dict(self.DEFAULTS)
+        else:
+            self.config = JSONManager.load_json(self.config_path)
+
+    @property
+    def default_sample_rate(self):
+        return self.config.get("default_sample_rate", self.DEFAULTS["default_sample_rate"])
+
+    @property
+    def default_channels(self):
+        return self.config.get("default_channels", self.DEFAULTS["default_channels"])
+
+    @property
+    def pcm_cache_dir(self):
+        return self.config.get("pcm_cache_dir", self.DEFAULTS["pcm_cache_dir"])
+
+    @property
+    def pcm_cache_max_bytes(self):
+        return self.config.get("pcm_cache_max_bytes", self.DEFAULTS["pcm_cache_max_bytes"])
\ No newline at end of file
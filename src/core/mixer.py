@@ -0,0 +1,172 @@
+import math
+import threading
+import numpy as np
+from src.core.playback import PlaybackEngine
+from src.core.render import render_to_file
+
+class Voice:
+    def __init__(self, producer, gain=1.0, pan=0.0):
+        """
+        One input of a Mixer.
+        :param producer: Callable taking a frame count and returning a (frames, channels) block,
+                         or None once the voice has finished.
+        :param gain: Linear gain, applied to every output channel.
+        :param pan: Stereo position from -1 (left) to 1 (right), applied to the first two channels.
+        """
+        self.producer = producer
+        self.index = None  # Slot in the mixer's voice list, None when not registered
+        self.gains = None
+        self.set_gain_pan(gain, pan)
+
+    def set_gain_pan(self, gain=None, pan=None):
+        """Update gain and/or pan; per-channel gains are recomputed once here, not per block."""
+        if gain is not None:
+            self.gain = gain
+        if pan is not None:
+            self.pan = max(-1.0, min(1.0, pan))
+        # Constant-power pan law, normalised so a centred voice passes through at unity gain
+        angle = (self.pan + 1) * math.pi / 4
+        self.gains = (self.gain * math.sqrt(2) * math.cos(angle),
+                      self.gain * math.sqrt(2) * math.sin(angle))
+
+class Mixer:
+    def __init__(self, samplerate=44100, channels=2, blocksize=1024, buffer_blocks=4, stream_factory=None, offline=False):
+        """
+        Sums any number of voices into a single shared output stream.
+        :param samplerate: Output sample rate in Hz.
+        :param channels: Output channel count (pan is applied to the first two). Mono voices
+                         feed every channel; other voices are down-mixed to mono or fill
+                         as many channels as they have.
+        :param blocksize: Frames mixed per block.
+        :param buffer_blocks: Output ring buffer depth in blocks.
+        :param stream_factory: Passed through to PlaybackEngine.
+        :param offline: If True, start() never opens a stream; output is only pulled by
+                        render() / render_to_file().
+        """
+        self.samplerate = samplerate
+        self.channels = channels
+        self.blocksize = blocksize
+        self.offline = offline
+        self.voices = []
+        self.lock = threading.Lock()
+        self.engine = PlaybackEngine(self.render, samplerate, channels, blocksize, buffer_blocks, stream_factory)
+        self._allocate(16, blocksize)
+
+    def _allocate(self, capacity, frames):
+        # Channel-major layout turns the weighted sum over voices into one batched
+        # (1 x voices) @ (voices x frames) product per channel
+        self._capacity = capacity
+        self._frames = frames
+        self._stack = np.zeros((self.channels, capacity, frames), dtype=np.float32)
+        self._gains = np.ones((self.channels, 1, capacity), dtype=np.float32)
+        self._mix = np.zeros((self.channels, 1, frames), dtype=np.float32)
+        self._out = self._mix.reshape(self.channels, frames).T  # (frames, channels) view
+
+    def add_voice(self, producer, gain=1.0, pan=0.0):
+        """
+        Register a producer as a new voice in O(1).
+        :return: The Voice handle, needed to remove it or change its gain/pan.
+        """
+        voice = producer if isinstance(producer, Voice) else Voice(producer, gain, pan)
+        with self.lock:
+            if voice.index is None:
+                voice.index = len(self.voices)
+                self.voices.append(voice)
+        return voice
+
+    def remove_voice(self, voice):
+        """Unregister a voice in O(1) by moving the last voice into its slot."""
+        with self.lock:
+            if voice.index is None:
+                return
+            last = self.voices.pop()
+            if last is not voice:
+                self.voices[voice.index] = last
+                last.index = voice.index
+            voice.index = None
+
+    def render(self, frames):
+        """
+        Mix one block from every active voice.
+        :param frames: Number of frames to produce.
+        :return: A (frames, channels) array, reused between calls.
+        """
+        with self.lock:
+            voices = list(self.voices)
+        count = len(voices)
+        if count > self._capacity:
+            self._allocate(max(count, 2 * self._capacity), frames)
+        elif frames != self._frames:
+            self._allocate(self._capacity, frames)
+        if count == 0:
+            self._out.fill(0)
+            return self._out
+
+        stack = self._stack[:, :count]
+        gains = self._gains[:, :, :count]
+        panned = 2 if self.channels >= 2 else 0
+        finished = []
+        for i, voice in enumerate(voices):
+            block = voice.producer(frames)
+            if block is None:
+                stack[:, i] = 0
+                finished.append(voice)
+                continue
+            self._place(stack[:, i], block[:frames])
+            gains[:panned, 0, i] = voice.gains[:panned]
+            gains[panned:, 0, i] = voice.gain
+        np.matmul(gains, stack, out=self._mix)
+
+        for voice in finished:
+            self.remove_voice(voice)
+        return self._out
+
+    @staticmethod
+    def _place(slot, block):
+        """
+        Copy a (frames, channels) block into a (channels, frames) stack slot, zero-padding
+        short blocks and matching the slot's channel count.
+        """
+        n = len(block)
+        if block.ndim == 1 or block.shape[1] == 1:
+            slot[:, :n] = block.reshape(n, -1)[:, 0]
+        elif len(slot) == 1:
+            slot[0, :n] = block.mean(axis=1)
+        else:
+            used = min(block.shape[1], len(slot))
+            slot[:used, :n] = block[:, :used].T
+            slot[used:, :n] = 0
+        slot[:, n:] = 0
+
+    def start(self):
+        """Start the shared output stream if it is not already running."""
+        if not self.offline:
+            self.engine.start()
+
+    def render_to_file(self, file_path, seconds=None, frames=None, **kwargs):
+        """
+        Mix the current voices offline into a file; see render.render_to_file.
+        :return: The render report.
+        """
+        return render_to_file(self.render, file_path, seconds, frames, self.samplerate, self.channels,
+                              kwargs.pop("blocksize", self.blocksize), **kwargs)
+
+    def stop(self):
+        self.engine.stop()
+
+    def close(self):
+        self.engine.close()
+
+_default_mixer = None
+_default_lock = threading.Lock()
+
+def get_mixer(**kwargs):
+    """
+    Return the process-wide Mixer, creating it on first use.
+    :param kwargs: Mixer arguments, only honoured by the call that creates it.
+    """
+    global _default_mixer
+    with _default_lock:
+        if _default_mixer is None:
+            _default_mixer = Mixer(**kwargs)
+        return _default_mixer
@@ -0,0 +1,140 @@
+import hashlib
+import os
+import threading
+from math import gcd
+from pathlib import Path
+import numpy as np
+import soundfile as sf
+from scipy.signal import resample_poly
+from src.core.json_manager import JSONManager, SoundConfig
+
+# Containers that already hold raw PCM; decoding them is as cheap as reading a cache file
+UNCOMPRESSED_FORMATS = ("WAV", "WAVEX", "AIFF", "RAW", "W64", "RF64", "CAF")
+
+def is_compressed(file_path):
+    """True if decoding `file_path` costs more than copying its samples."""
+    return sf.info(f"{file_path}").format not in UNCOMPRESSED_FORMATS
+
+class PCMCache:
+    def __init__(self, directory, max_bytes=1 << 30):
+        """
+        On-disk cache of decoded audio as raw float32 frames, served as read-only memmaps.
+        Entries are keyed by source path, mtime, size and target sample rate, so edited
+        files are decoded again. Because every load maps the same file, Sounds built from
+        the same source share their pages in the OS cache.
+        :param directory: Where cache files are written.
+        :param max_bytes: Total size of cached PCM above which least recently used entries are evicted.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, file_path, samplerate=None):
+        """Cache key for `file_path` decoded at `samplerate` (None keeps the native rate)."""
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        ident = f"{path}|{stat.st_mtime_ns}|{stat.st_size}|{samplerate}"
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+    def _paths(self, key):
+        return self.directory / f"{key}.f32", self.directory / f"{key}.json"
+
+    def load(self, file_path, samplerate=None):
+        """
+        Decoded frames of `file_path`, transcoding into the cache on first use.
+        :param file_path: Any file soundfile can read.
+        :param samplerate: Target rate; None keeps the file's own rate.
+        :return: (read-only np.memmap of shape (frames, channels), sample rate)
+        """
+        key = self.key(file_path, samplerate)
+        data_path, meta_path = self._paths(key)
+        with self.lock:
+            if data_path.exists() and meta_path.exists():
+                self.hits += 1
+                os.utime(data_path)  # Mark as recently used for eviction
+            else:
+                self.misses += 1
+                self._transcode(file_path, samplerate, data_path, meta_path)
+                self.evict(keep=data_path)
+            # Still under the lock, so another thread's eviction cannot remove the entry meanwhile
+            meta = JSONManager.load_json(meta_path)
+            shape = (meta["frames"], meta["channels"])
+            if meta["frames"] == 0:
+                return np.zeros(shape, dtype=np.float32), meta["samplerate"]
+            return np.memmap(data_path, dtype=np.float32, mode="r", shape=shape), meta["samplerate"]
+
+    def _transcode(self, file_path, samplerate, data_path, meta_path):
+        data, rate = sf.read(f"{file_path}", dtype="float32", always_2d=True)
+        if samplerate and samplerate != rate:
+            divisor = gcd(int(samplerate), int(rate))
+            data = resample_poly(data, samplerate // divisor, rate // divisor, axis=0).astype(np.float32)
+            rate = samplerate
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write under temporary names and rename so readers never see a partial entry
+        tmp_data = data_path.with_suffix(".f32.tmp")
+        tmp_meta = meta_path.with_suffix(".json.tmp")
+        np.ascontiguousarray(data).tofile(tmp_data)
+        JSONManager.save_json({"source": f"{file_path}", "frames": len(data),
+                               "channels": data.shape[1], "samplerate": rate}, tmp_meta)
+        os.replace(tmp_data, data_path)
+        os.replace(tmp_meta, meta_path)
+
+    def size(self):
+        """Total bytes of cached PCM."""
+        return sum(path.stat().st_size for path in self.directory.glob("*.f32"))
+
+    @staticmethod
+    def _delete(path):
+        """
+        Delete the entry whose data file is `path`.
+        :return: False if the data file is still memory-mapped somewhere and the OS refuses
+                 to delete it (Windows); the entry is left for a later eviction.
+        """
+        try:
+            path.unlink()
+        except PermissionError:
+            return False
+        path.with_suffix(".json").unlink(missing_ok=True)
+        return True
+
+    def evict(self, keep=None):
+        """
+        Delete least recently used entries until the cache fits in max_bytes.
+        Memmaps already handed out stay valid: POSIX keeps a deleted file's pages until it is
+        unmapped, and entries Windows will not delete while mapped are skipped.
+        """
+        if not self.directory.exists():
+            return
+        entries = sorted(self.directory.glob("*.f32"), key=lambda path: path.stat().st_mtime_ns)
+        total = sum(path.stat().st_size for path in entries)
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            size = path.stat().st_size
+            if self._delete(path):
+                total -= size
+
+    def clear(self):
+        """Remove every cache entry, apart from ones still mapped on Windows."""
+        with self.lock:
+            for path in self.directory.glob("*.f32"):
+                self._delete(path)
+            for path in self.directory.glob("*.json"):
+                if not path.with_suffix(".f32").exists():
+                    path.unlink()
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+def get_pcm_cache(config_path=Path("config") / "sound.json"):
+    """Return the process-wide PCMCache configured from `config/sound.json`."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            config = SoundConfig(config_path)
+            _default_cache = PCMCache(config.pcm_cache_dir, config.pcm_cache_max_bytes)
+        return _default_cache
@@ -0,0 +1,250 @@
+import threading
+import time
+from collections import deque
+import numpy as np
+
+class RingBuffer:
+    def __init__(self, capacity, channels, dtype=np.float32):
+        """
+        Bounded single-producer/single-consumer queue of audio frames.
+        The producer only ever advances the write counter and the consumer only
+        the read counter, so neither side needs a lock.
+        :param capacity: Maximum number of frames held at once.
+        :param channels: Number of channels per frame.
+        :param dtype: Sample type of the backing array.
+        """
+        self.capacity = int(capacity)
+        self.channels = channels
+        self.buffer = np.zeros((self.capacity, channels), dtype=dtype)
+        self._read = 0  # Total frames consumed
+        self._write = 0  # Total frames produced
+
+    def available(self):
+        """Number of frames ready to be read."""
+        return self._write - self._read
+
+    def free(self):
+        """Number of frames that can be written without overwriting unread data."""
+        return self.capacity - (self._write - self._read)
+
+    def write(self, frames):
+        """
+        Copy as many frames as fit into the buffer.
+        :param frames: Array of shape (n, channels) or (n, 1).
+        :return: Number of frames written.
+        """
+        n = min(len(frames), self.free())
+        start = self._write % self.capacity
+        first = min(n, self.capacity - start)
+        self.buffer[start:start + first] = frames[:first]
+        self.buffer[:n - first] = frames[first:n]
+        self._write += n
+        return n
+
+    def read_into(self, out):
+        """
+        Fill `out` with the oldest buffered frames.
+        :param out: Preallocated array of shape (n, channels).
+        :return: Number of frames copied; the rest of `out` is left untouched.
+        """
+        n = min(len(out), self._write - self._read)
+        start = self._read % self.capacity
+        first = min(n, self.capacity - start)
+        out[:first] = self.buffer[start:start + first]
+        out[first:n] = self.buffer[:n - first]
+        self._read += n
+        return n
+
+    def skip(self, n):
+        """
+        Discard up to `n` of the oldest frames without copying them (consumer side).
+        :return: Number of frames discarded.
+        """
+        n = min(n, self._write - self._read)
+        self._read += n
+        return n
+
+def sounddevice_stream(**kwargs):
+    """Open a real `sounddevice.OutputStream`; imported lazily so headless code never needs PortAudio."""
+    import sounddevice as sd
+    return sd.OutputStream(**kwargs)
+
+class FakeOutputStream:
+    def __init__(self, samplerate, channels, blocksize, callback, dtype="float32", realtime=False):
+        """
+        Headless stand-in for `sounddevice.OutputStream`.
+        Every block handed to the callback is recorded so tests can inspect the exact output.
+        :param realtime: If True, `start()` drives the callback from a timer thread at the
+                         nominal block period; otherwise blocks are delivered by `pump()`.
+        """
+        self.samplerate = samplerate
+        self.channels = channels
+        self.blocksize = blocksize
+        self.callback = callback
+        self.dtype = dtype
+        self.realtime = realtime
+        self.active = False
+        self.closed = False
+        self.recorded = []
+        self._outdata = np.zeros((blocksize, channels), dtype=dtype)
+        self._thread = None
+
+    def start(self):
+        self.active = True
+        if self.realtime and (self._thread is None or not self._thread.is_alive()):
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self.active = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def close(self):
+        self.stop()
+        self.closed = True
+
+    def pump(self, blocks=1):
+        """Invoke the callback `blocks` times, recording what it wrote."""
+        for _ in range(blocks):
+            self.callback(self._outdata, self.blocksize, None, None)
+            self.recorded.append(self._outdata.copy())
+
+    def frames(self):
+        """All frames delivered so far as one (n, channels) array."""
+        if not self.recorded:
+            return np.zeros((0, self.channels), dtype=self.dtype)
+        return np.concatenate(self.recorded)
+
+    def _run(self):
+        period = self.blocksize / self.samplerate
+        deadline = time.perf_counter()
+        while self.active:
+            self.pump(1)
+            deadline += period
+            delay = deadline - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+class PlaybackEngine:
+    def __init__(self, producer, samplerate, channels, blocksize=1024, buffer_blocks=4,
+                 stream_factory=None, dtype="float32"):
+        """
+        Persistent callback-driven output.
+        A producer thread keeps a ring buffer topped up with blocks from `producer`, and the
+        audio callback of one long-lived output stream drains it.
+        :param producer: Callable taking a frame count and returning an array of that many frames.
+        :param samplerate: Output sample rate in Hz.
+        :param channels: Number of output channels.
+        :param blocksize: Frames per callback and per producer call.
+        :param buffer_blocks: Ring buffer depth in blocks (latency vs. underrun safety).
+        :param stream_factory: Callable accepting OutputStream keyword arguments;
+                               defaults to a real sounddevice stream.
+        """
+        self.producer = producer
+        self.samplerate = samplerate
+        self.channels = channels
+        self.blocksize = blocksize
+        self.dtype = dtype
+        self.stream_factory = stream_factory or sounddevice_stream
+        self.ring = RingBuffer(blocksize * buffer_blocks, channels, dtype)
+        self.stream = None
+        self.stop_flag = threading.Event()
+        self.space = threading.Event()
+        self.producer_thread = None
+
+        self.callbacks = 0
+        self.frames_delivered = 0
+        self.underruns = 0
+        self._last_callback = None
+        self._intervals = deque(maxlen=1024)
+
+    def _fill(self):
+        """Produce blocks until the ring buffer has no room for another one."""
+        while self.ring.free() >= self.blocksize:
+            self.ring.write(self.producer(self.blocksize))
+
+    def _produce_loop(self):
+        while not self.stop_flag.is_set():
+            self.space.clear()
+            if self.ring.free() < self.blocksize:
+                self.space.wait(self.blocksize / self.samplerate)
+                continue
+            self._fill()
+
+    def _callback(self, outdata, frames, time_info, status):
+        now = time.perf_counter()
+        if self._last_callback is not None:
+            self._intervals.append(now - self._last_callback)
+        self._last_callback = now
+
+        n = self.ring.read_into(outdata)
+        if n < frames:
+            outdata[n:] = 0
+            self.underruns += 1
+        self.callbacks += 1
+        self.frames_delivered += frames
+        self.space.set()
+
+    def is_playing(self):
+        return self.producer_thread is not None and self.producer_thread.is_alive()
+
+    def start(self):
+        """Prefill the buffer, start the producer thread and (re)start the stream."""
+        if self.is_playing():
+            return
+        if self.stream is None:
+            self.stream = self.stream_factory(
+                samplerate=self.samplerate,
+                channels=self.channels,
+                blocksize=self.blocksize,
+                callback=self._callback,
+                dtype=self.dtype,
+            )
+        self.stop_flag.clear()
+        self._fill()
+        self._last_callback = None
+        self.producer_thread = threading.Thread(target=self._produce_loop, daemon=True)
+        self.producer_thread.start()
+        self.stream.start()
+
+    def stop(self):
+        """Stop producing and pause the stream; the stream itself stays open for the next start()."""
+        self.stop_flag.set()
+        self.space.set()
+        if self.producer_thread is not None and self.producer_thread.is_alive():
+            self.producer_thread.join()
+        self.producer_thread = None
+        if self.stream is not None:
+            self.stream.stop()
+
+    def close(self):
+        """Stop playback and release the output stream."""
+        self.stop()
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def stats(self):
+        """
+        Delivery statistics.
+        :return: Dict with callback/frame/underrun counts and callback jitter in seconds
+                 (deviation of the measured callback interval from the nominal block period).
+        """
+        period = self.blocksize / self.samplerate
+        intervals = np.array(self._intervals)
+        if len(intervals):
+            deviation = intervals - period
+            jitter_std = float(np.std(deviation))
+            jitter_max = float(np.max(np.abs(deviation)))
+        else:
+            jitter_std = jitter_max = 0.0
+        return {
+            "callbacks": self.callbacks,
+            "frames_delivered": self.frames_delivered,
+            "underruns": self.underruns,
+            "period": period,
+            "jitter_std": jitter_std,
+            "jitter_max": jitter_max,
+        }
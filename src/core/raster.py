@@ -0,0 +1,108 @@
+import math
+import numpy as np
+import pygame
+from src.core.geometry import Shape, Rect
+from src.core.spatial import bounds_of
+
+# Pixel (column i, row j) covers [i, i + 1) x [j, j + 1); without antialiasing it is
+# inside a shape when its center (i + 0.5, j + 0.5) is, exactly as Shape.contains decides.
+
+def _pixel_range(low, high, limit):
+    """Pixels in [0, limit) that overlap [low, high]."""
+    return max(0, math.floor(low)), min(limit, math.ceil(high))
+
+def region(shape, width, height, antialias=False, samples=4):
+    """
+    Coverage of `shape` over the pixels of its bounding box, clipped to a width x height canvas.
+    :param antialias: If True, coverage is the fraction of the pixel inside the shape: exact for
+                      Rect, estimated from samples x samples points per pixel otherwise.
+    :return: (x, y, coverage) where coverage is a (rows, columns) float32 array whose top-left
+             pixel is (x, y), or None if the shape is off the canvas.
+    """
+    left, top, right, bottom = bounds_of(shape)
+    x0, x1 = _pixel_range(left, right, width)
+    y0, y1 = _pixel_range(top, bottom, height)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    if isinstance(shape, Rect):
+        return x0, y0, _rect_coverage(left, top, right, bottom, x0, x1, y0, y1, antialias)
+
+    steps = samples if antialias else 1
+    offsets = (np.arange(steps) + 0.5) / steps
+    xs = (np.arange(x0, x1)[:, None] + offsets).ravel()
+    ys = (np.arange(y0, y1)[:, None] + offsets).ravel()
+    inside = shape.contains_grid(xs, ys)
+    if steps == 1:
+        return x0, y0, inside.astype(np.float32)
+    # Average each steps x steps block: sum the sample rows, then the sample columns
+    rows = inside.reshape(y1 - y0, steps, len(xs))
+    summed = rows[:, 0].astype(np.float32)
+    for k in range(1, steps):
+        summed += rows[:, k]
+    coverage = summed[:, 0::steps].copy()
+    for k in range(1, steps):
+        coverage += summed[:, k::steps]
+    coverage *= 1 / (steps * steps)
+    return x0, y0, coverage
+
+def _rect_coverage(left, top, right, bottom, x0, x1, y0, y1, antialias):
+    """Separable coverage: a rectangle's area inside a pixel is its x overlap times its y overlap."""
+    def axis(low, high, first, last):
+        edges = np.arange(first, last, dtype=np.float64)
+        if antialias:
+            return np.clip(np.minimum(edges + 1, high) - np.maximum(edges, low), 0, 1)
+        centers = edges + 0.5
+        return ((centers >= low) & (centers <= high)).astype(np.float64)
+    return np.outer(axis(top, bottom, y0, y1), axis(left, right, x0, x1)).astype(np.float32)
+
+def coverage(shapes, size, antialias=False, samples=4, out=None):
+    """
+    Rasterize shapes into one coverage mask; overlapping shapes take the larger coverage.
+    :param shapes: A shape or an iterable of shapes (2D, or 3D ones by their XY projection).
+    :param size: (width, height) of the mask.
+    :param out: Optional (height, width) float32 array to draw into; cleared if omitted.
+    :return: The (height, width) float32 mask, values in [0, 1].
+    """
+    width, height = size
+    if out is None:
+        out = np.zeros((height, width), dtype=np.float32)
+    for shape in _iterate(shapes):
+        found = region(shape, width, height, antialias, samples)
+        if found is not None:
+            x, y, cover = found
+            target = out[y:y + cover.shape[0], x:x + cover.shape[1]]
+            np.maximum(target, cover, out=target)
+    return out
+
+def fill(surface, shapes, color, antialias=False, samples=4):
+    """
+    Paint shapes onto a 24 or 32-bit pygame surface through pygame.surfarray, blending
+    `color` over the existing pixels by coverage.
+    :param color: RGB tuple, or one RGB tuple per shape.
+    """
+    shapes = list(_iterate(shapes))
+    colors = np.asarray(color, dtype=np.float32).reshape(-1, 3)
+    width, height = surface.get_size()
+    pixels = pygame.surfarray.pixels3d(surface)  # (width, height, 3) view; locks the surface
+    try:
+        for index, shape in enumerate(shapes):
+            found = region(shape, width, height, antialias, samples)
+            if found is None:
+                continue
+            x, y, cover = found
+            paint = colors[index % len(colors)]
+            target = pixels[x:x + cover.shape[1], y:y + cover.shape[0]]
+            alpha = cover.T
+            if not antialias:
+                target[alpha > 0] = paint
+                continue
+            blended = target.astype(np.float32)
+            blended += (paint - blended) * alpha[..., None]
+            np.rint(blended, out=blended)
+            target[...] = blended
+    finally:
+        del pixels
+    return surface
+
+def _iterate(shapes):
+    return [shapes] if isinstance(shapes, Shape) else shapes
@@ -0,0 +1,44 @@
+import time
+import soundfile as sf
+
+def render_to_file(producer, file_path, seconds=None, frames=None, samplerate=44100, channels=2,
+                   blocksize=4096, format=None, subtype=None):
+    """
+    Render audio offline, as fast as the producer allows, straight to a file.
+    Blocks are written as they are produced, so memory use does not grow with the length.
+    :param producer: Callable taking a frame count and returning a (frames, channels) block,
+                     or None when finished (e.g. Sound._generate_chunk or Mixer.render).
+    :param file_path: Output path; the format is taken from the extension unless `format` is given.
+    :param seconds: Length to render; ignored if `frames` is given.
+    :param frames: Exact number of frames to render.
+    :param samplerate: Sample rate written to the file.
+    :param channels: Channel count written to the file.
+    :param blocksize: Frames requested from the producer per block.
+    :param format: soundfile format name, e.g. "WAV" or "FLAC".
+    :param subtype: soundfile subtype, e.g. "PCM_16" or "FLOAT".
+    :return: Dict with frames written, rendered seconds, wall-clock seconds and real-time factor.
+    """
+    if frames is None:
+        if seconds is None:
+            raise ValueError("Either seconds or frames must be given.")
+        frames = int(round(seconds * samplerate))
+
+    written = 0
+    start = time.perf_counter()
+    with sf.SoundFile(f"{file_path}", "w", samplerate, channels, subtype=subtype, format=format) as output:
+        while written < frames:
+            block = producer(min(blocksize, frames - written))
+            if block is None:
+                break
+            block = block[:frames - written]
+            output.write(block)
+            written += len(block)
+    elapsed = time.perf_counter() - start
+
+    rendered = written / samplerate
+    return {
+        "frames": written,
+        "seconds": rendered,
+        "elapsed": elapsed,
+        "realtime_factor": rendered / elapsed if elapsed > 0 else float("inf"),
+    }
@@ -0,0 +1,161 @@
+import numpy as np
+
+QUALITIES = ("nearest", "linear", "cubic", "sinc")
+
+# Weight functions write through `out=` into preallocated float32 buffers so that a block
+# allocates no temporaries; `scratch` is a (4, frames) float32 work area.
+
+def _linear_weights(frac, out, scratch):
+    np.subtract(1, frac, out=out[:, 0])
+    np.copyto(out[:, 1], frac)
+
+def _cubic_weights(frac, out, scratch):
+    """Catmull-Rom weights for the samples at i-1, i, i+1, i+2."""
+    t2, t3, a, b = scratch
+    np.multiply(frac, frac, out=t2)
+    np.multiply(t2, frac, out=t3)
+    # -0.5 t^3 + t^2 - 0.5 t
+    np.multiply(t3, -0.5, out=a)
+    a += t2
+    np.multiply(frac, 0.5, out=b)
+    np.subtract(a, b, out=out[:, 0])
+    # 1.5 t^3 - 2.5 t^2 + 1
+    np.multiply(t3, 1.5, out=a)
+    np.multiply(t2, 2.5, out=b)
+    a -= b
+    np.add(a, 1, out=out[:, 1])
+    # -1.5 t^3 + 2 t^2 + 0.5 t
+    np.multiply(t3, -1.5, out=a)
+    np.multiply(t2, 2, out=b)
+    a += b
+    np.multiply(frac, 0.5, out=b)
+    np.add(a, b, out=out[:, 2])
+    # 0.5 t^3 - 0.5 t^2
+    np.subtract(t3, t2, out=a)
+    np.multiply(a, 0.5, out=out[:, 3])
+
+def _gather(source, indices, out):
+    """Fancy-index `source` along its first axis into `out`, without materialising lazy sources."""
+    if isinstance(source, np.ndarray):
+        np.take(source, indices, axis=0, out=out, mode="clip")  # "raise" would buffer `out`
+    else:
+        out[...] = source[indices]
+
+def sinc_table(taps, phases, cutoff=1.0):
+    """
+    Blackman-windowed sinc kernel sampled at `phases + 1` fractional offsets.
+    :param taps: Kernel length (even).
+    :param phases: Number of fractional steps between two source samples.
+    :param cutoff: Low-pass cutoff as a fraction of the source Nyquist rate.
+    :return: Array of shape (phases + 1, taps) whose rows each sum to one.
+    """
+    frac = np.arange(phases + 1)[:, None] / phases
+    distance = np.arange(taps)[None, :] - (taps // 2 - 1) - frac
+    window = 0.42 + 0.5 * np.cos(2 * np.pi * distance / taps) + 0.08 * np.cos(4 * np.pi * distance / taps)
+    table = cutoff * np.sinc(cutoff * distance) * window
+    return table / table.sum(axis=1, keepdims=True)
+
+class Resampler:
+    def __init__(self, quality="linear", channels=1, max_frames=1024, taps=16, phases=256):
+        """
+        Variable-speed reader over a looping source that keeps its sub-sample phase between blocks.
+        :param quality: One of "nearest", "linear", "cubic" or "sinc".
+        :param channels: Channel count of the sources that will be read.
+        :param max_frames: Initial size of the preallocated block buffers.
+        :param taps: Kernel length for "sinc" quality.
+        :param phases: Fractional resolution of the "sinc" kernel table.
+        """
+        if quality not in QUALITIES:
+            raise ValueError(f"Unsupported quality: {quality}")
+        self.quality = quality
+        self.channels = channels
+        self.taps = {"nearest": 1, "linear": 2, "cubic": 4, "sinc": taps}[quality]
+        self.phases = phases
+        self.position = 0.0  # Fractional read position into the source
+        self._tables = {}
+        # Offset of each tap relative to floor(position)
+        first = {"nearest": 0, "linear": 0, "cubic": -1, "sinc": -(taps // 2 - 1)}[quality]
+        self._tap_offsets = np.arange(first, first + self.taps)
+        self._allocate(max_frames)
+
+    def _allocate(self, frames):
+        self.max_frames = frames
+        self._ramp = np.arange(frames, dtype=np.float64)
+        self._pos = np.empty(frames, dtype=np.float64)
+        self._frac = np.empty(frames, dtype=np.float64)
+        self._base = np.empty(frames, dtype=np.int64)
+        self._indices = np.empty((frames, self.taps), dtype=np.int64)
+        self._phase = np.empty(frames, dtype=np.int64)
+        self._weights = np.empty((frames, 1, self.taps), dtype=np.float32)
+        self._samples = np.empty((frames, self.taps, self.channels), dtype=np.float32)
+        self._out = np.empty((frames, 1, self.channels), dtype=np.float32)
+        self._frac32 = np.empty(frames, dtype=np.float32)
+        self._scratch = np.empty((4, frames), dtype=np.float32)
+
+    def _sinc_table(self, speed):
+        # Lower the cutoff when reading faster than the source rate to avoid aliasing
+        cutoff = round(min(1.0, 1.0 / max(abs(speed), 1e-9)), 2)
+        if cutoff not in self._tables:
+            self._tables[cutoff] = sinc_table(self.taps, self.phases, cutoff).astype(np.float32)
+        return self._tables[cutoff]
+
+    def process(self, source, speed, frames):
+        """
+        Read `frames` output frames from `source`, advancing `speed` source samples per frame.
+        Negative speeds read backwards; the read position wraps around the source.
+        :param source: Array of shape (length, channels), or any object supporting integer-array
+                       indexing along its first axis (e.g. a StreamingSource).
+        :param speed: Source samples advanced per output frame, either a scalar or an array with
+                      one (possibly time-varying) speed per output frame.
+        :param frames: Number of output frames.
+        :return: A (frames, channels) view of an internal buffer, valid until the next call.
+        """
+        if frames > self.max_frames:
+            self._allocate(frames)
+        length = len(source)
+        pos, frac, base = self._pos[:frames], self._frac[:frames], self._base[:frames]
+        out = self._out[:frames]
+
+        if np.ndim(speed):
+            # Position of each frame is the running sum of the speeds before it
+            speed = speed[:frames]
+            np.cumsum(speed, out=pos)
+            pos -= speed
+            pos += self.position
+            self.position = (pos[-1] + speed[-1]) % length
+        else:
+            np.multiply(self._ramp[:frames], speed, out=pos)
+            pos += self.position
+            self.position = (self.position + speed * frames) % length
+        np.floor(pos, out=frac)
+        np.copyto(base, frac, casting="unsafe")
+        np.subtract(pos, frac, out=frac)
+
+        if self.quality == "nearest":
+            np.mod(base, length, out=base)
+            _gather(source, base, out[:, 0])
+            return out[:, 0]
+
+        indices = self._indices[:frames]
+        weights = self._weights[:frames]
+        # Per-tap loops avoid broadcasting, which makes numpy allocate iteration buffers
+        for k, offset in enumerate(self._tap_offsets):
+            np.add(base, offset, out=indices[:, k])
+        np.mod(indices, length, out=indices)
+        if self.quality in ("linear", "cubic"):
+            frac32 = self._frac32[:frames]
+            np.copyto(frac32, frac)
+            weigh = _linear_weights if self.quality == "linear" else _cubic_weights
+            weigh(frac32, weights[:, 0], self._scratch[:, :frames])
+        else:
+            phase = self._phase[:frames]
+            np.multiply(frac, self.phases, out=frac)
+            np.rint(frac, out=frac)
+            np.copyto(phase, frac, casting="unsafe")
+            fastest = np.abs(np.asarray(speed)).max()
+            np.take(self._sinc_table(fastest), phase, axis=0, out=weights[:, 0], mode="clip")
+
+        samples = self._samples[:frames]
+        _gather(source, indices, samples)
+        np.matmul(weights, samples, out=out)
+        return out[:, 0]
@@ -0,0 +1,118 @@
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+import numpy as np
+import soundfile as sf
+from src.core.pcm_cache import get_pcm_cache, is_compressed
+
+class Sample:
+    def __init__(self, key, data, samplerate):
+        """
+        Decoded audio shared between any number of Sounds.
+        The buffer is made read-only; playback state belongs to each Sound, never to the Sample.
+        """
+        self.key = key
+        self.data = data
+        self.data.flags.writeable = False
+        self.samplerate = samplerate
+        self.nbytes = data.nbytes
+
+    def __repr__(self):
+        return f"Sample({self.key[0]}, {self.samplerate} Hz, {self.data.shape})"
+
+def load_sample(file_path, samplerate=None, dtype="float32", cache=None):
+    """
+    Decode `file_path` into a (frames, channels) array.
+    Compressed float32 sources go through the PCM cache unless `cache` is False.
+    :return: (data, sample rate)
+    """
+    if cache is not False and np.dtype(dtype) == np.float32 and (samplerate or is_compressed(file_path)):
+        return (cache or get_pcm_cache()).load(file_path, samplerate)
+    data, rate = sf.read(f"{file_path}", dtype=np.dtype(dtype).name, always_2d=True)
+    if samplerate and samplerate != rate:
+        raise ValueError(f"Resampling {file_path} to {samplerate} Hz requires the PCM cache.")
+    return data, rate
+
+class SampleBank:
+    def __init__(self, memory_budget=256 << 20):
+        """
+        Registry that hands out one shared Sample per (file, sample rate, dtype).
+        Samples are held weakly, so they are freed once no Sound uses them, except that the
+        most recently requested ones are kept alive (LRU) while they fit in `memory_budget`,
+        and pinned ones are kept until unpinned.
+        :param memory_budget: Bytes of otherwise-unreferenced samples to keep warm.
+        """
+        self.memory_budget = memory_budget
+        self.lock = threading.Lock()
+        self._samples = weakref.WeakValueDictionary()
+        self._recent = OrderedDict()
+        self._recent_bytes = 0
+        self._pinned = {}
+        self.hits = 0
+        self.loads = 0
+
+    @staticmethod
+    def key(file_path, samplerate=None, dtype="float32"):
+        return (str(Path(file_path).resolve()), samplerate, np.dtype(dtype).name)
+
+    def get(self, file_path, samplerate=None, dtype="float32", cache=None, pin=False):
+        """
+        Return the shared Sample for `file_path`, loading it on first request.
+        :param samplerate: Target rate, or None for the file's own rate.
+        :param cache: Passed to load_sample.
+        :param pin: Keep the sample alive even when unused and over budget.
+        """
+        key = self.key(file_path, samplerate, dtype)
+        with self.lock:
+            sample = self._samples.get(key)
+            if sample is None:
+                data, rate = load_sample(file_path, samplerate, dtype, cache)
+                sample = Sample(key, data, rate)
+                self._samples[key] = sample
+                self.loads += 1
+            else:
+                self.hits += 1
+            if pin:
+                self._pinned[key] = sample
+            self._retain(sample)
+        return sample
+
+    def _retain(self, sample):
+        """Move `sample` to the front of the keep-warm LRU and trim it to the budget. Caller holds the lock."""
+        if sample.key in self._recent:
+            self._recent.move_to_end(sample.key)
+        else:
+            self._recent[sample.key] = sample
+            self._recent_bytes += sample.nbytes
+        while self._recent_bytes > self.memory_budget and len(self._recent) > 1:
+            _, evicted = self._recent.popitem(last=False)
+            self._recent_bytes -= evicted.nbytes
+
+    def unpin(self, sample):
+        with self.lock:
+            self._pinned.pop(sample.key, None)
+
+    def clear(self):
+        """Drop every strong reference held by the bank; samples still used by Sounds survive."""
+        with self.lock:
+            self._recent.clear()
+            self._recent_bytes = 0
+            self._pinned.clear()
+
+    def __contains__(self, key):
+        return key in self._samples
+
+    def __len__(self):
+        return len(self._samples)
+
+_default_bank = None
+_default_lock = threading.Lock()
+
+def get_sample_bank():
+    """Return the process-wide SampleBank."""
+    global _default_bank
+    with _default_lock:
+        if _default_bank is None:
+            _default_bank = SampleBank()
+        return _default_bank
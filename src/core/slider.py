@@ -3,6 +3,9 @@ from src.core.style import Style
 import pygame
 
 class Slider(Component):
+    opaque = False  # The handle overhangs the track
+    captures_pointer = True  # Keep receiving motion while dragged outside the track
+
     def __init__(self, current = 511, min_val=0, max_val=1023, rect:pygame.Rect = pygame.Rect(0, 0, 100, 50), style:Style = Style()):
         super().__init__(rect, style)
         self.value = current
@@ -11,39 +14,29 @@ class Slider(Component):
         self.max_val = max_val
         self.dragging = False
 
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left-click
-            if self.contains_point(event.pos[0], event.pos[1]):
-                self.dragging = True
-                self.update_value(event.pos[0])
+    def _colors(self):
+        return self.style.colors.get("foreground", (255, 255, 255)), self.style.colors.get("background", (80, 80, 80))
 
-        elif event.type == pygame.MOUSEMOTION and event.buttons[0] == 1:  # Drag
-            if self.dragging:
-                self.update_value(event.pos[0])
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            self.dragging = False
-            self.update_value(event.pos[0])
+    def _handle_offset(self):
+        """Handle center relative to the left end of the track, in whole pixels."""
+        return int((self.current - self.min_val) / (self.max_val - self.min_val) * self.rect.width)
 
-    def draw(self, surface):
-        if "foreground" in self.style.colors:
-            foreground = self.style.colors["foreground"]
-        else:
-            foreground = (255, 255, 255)
-        if "background" in self.style.colors:
-            background = self.style.colors["background"]
-        else:
-            background = (80, 80, 80)
-        slider_width = self.rect.width
-        handle_x = self.rect.x + int(
-            (self.current - self.min_val) / (self.max_val - self.min_val) * slider_width
-        )
-        handle_y = self.rect.y + self.rect.height // 2
-        handle_width = self.rect.height  # Handle is a square
+    def appearance(self):
+        return self._colors(), self._handle_offset(), self.dragging
+
+    def appearance_rect(self):
+        """The handle is centred on the value, so it overhangs the rect by half its width at either end."""
+        return self.rect.inflate(self.rect.height, 0)
+
+    def draw_appearance(self, surface, area):
+        foreground, background = self._colors()
+        track = pygame.Rect(area.x + self.rect.x - self.appearance_rect().x, area.y, self.rect.width, self.rect.height)
+        handle_width = track.height  # Handle is a square
         handle_rect = pygame.Rect(
-            handle_x - handle_width // 2, self.rect.y, handle_width, self.rect.height
+            track.x + self._handle_offset() - handle_width // 2, track.y, handle_width, track.height
         )
 
-        pygame.draw.rect(surface, background, self.rect)
+        pygame.draw.rect(surface, background, track)
         if self.dragging:
             pygame.draw.rect(surface, (255, 0, 0), handle_rect)
         else:
@@ -62,7 +55,7 @@ class Slider(Component):
         # Update current value based on position
         proportion = (mouse_x - slider_start)/(slider_end-slider_start)
         self.current = max(self.min_val, min(self.max_val, self.min_val + proportion*(self.max_val-self.min_val)))
-        print(f"current={self.current}, proportion={proportion}, mouse_x={mouse_x}")
+        self.mark_dirty()
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -71,10 +64,10 @@ class Slider(Component):
                 self.dragging = True
                 self.update_value(x)
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            self.dragging = False
+            if self.dragging:
+                self.dragging = False
+                self.mark_dirty()
         elif event.type == pygame.MOUSEMOTION and self.dragging:
-            mouse_x = event.pos[0]
-            mouse_x = max(self.rect.left, min(mouse_x, self.rect.right))
-            self.current = self.min_val + ((mouse_x - self.rect.left) * (self.max_val - self.min_val))
+            self.update_value(event.pos[0])
         return
 
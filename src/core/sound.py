@@ -1,67 +1,130 @@
 from pathlib import Path
 import soundfile as sf
-import sounddevice as sd
 import numpy as np
 from scipy.signal import resample
 from src.core.json_manager import JSONManager
 from src.core.engine import Engine
+from src.core.mixer import get_mixer
+from src.core.resample import Resampler
+from src.core.source import StreamingSource
+from src.core.sample_bank import get_sample_bank
+from src.core.render import render_to_file
 import os
 
-import threading
-import soundfile as sf
-import sounddevice as sd
-import numpy as np
-
 class Sound:
-    def __init__(self, file_path, speed=1.0, chunk_size=1024):
+    def __init__(self, file_path, speed=1.0, chunk_size=1024, mixer=None, gain=1.0, pan=0.0, quality="linear", streaming=False, cache=None, bank=None):
         self.file_path = file_path
         self.speed = speed  # Speed multiplier (-1.0 for reverse, 0 for pause, 1.0 for normal)
         self.chunk_size = chunk_size
-        self.stop_flag = threading.Event()
-        self.play_thread = None
+        self.mixer = mixer  # None means the shared process-wide mixer
+        self.gain = gain
+        self.pan = pan
+        self.voice = None
+        self.modulator = None  # Optional callable giving a per-frame speed curve
+        self.tap = None  # Optional callable receiving every generated chunk, e.g. a SpectrumAnalyzer
 
-        # Load the audio file
-        self.audio_data, self.sample_rate = sf.read(f"{file_path}", dtype='float32')
-        self.current_position = 0
+        # Load the audio file (always 2D so mono and stereo files share one code path).
+        # Streaming sources decode blocks on demand instead of reading the whole file;
+        # otherwise the decoded buffer is shared through the sample bank, and compressed
+        # files are decoded once into the PCM cache (cache=False disables it).
+        self.sample = None
+        if streaming:
+            self.audio_data = StreamingSource(file_path)
+            self.sample_rate = self.audio_data.samplerate
+        else:
+            self.sample = (bank if bank is not None else get_sample_bank()).get(file_path, cache=cache)
+            self.audio_data, self.sample_rate = self.sample.data, self.sample.samplerate
+        self.resampler = Resampler(quality, self.audio_data.shape[1], chunk_size)
+        self.rate_ratio = 1.0  # Source rate / output rate, set when a mixer is attached
+
+    @property
+    def current_position(self):
+        """Fractional read position into audio_data."""
+        return self.resampler.position
+
+    @current_position.setter
+    def current_position(self, position):
+        self.resampler.position = position
 
     def set_speed(self, speed):
         """Set the playback speed dynamically."""
         self.speed = speed
 
-    def _generate_chunk(self):
-        """Generate the next chunk of audio based on the current speed."""
-        if self.speed == 0:  # Pause
-            return np.zeros((self.chunk_size, self.audio_data.shape[1]))
+    def set_modulator(self, modulator):
+        """
+        Drive the speed from a per-frame curve instead of the scalar speed.
+        :param modulator: Callable taking a frame count and returning that many speeds
+                          (e.g. an EngineModulator), or None to go back to `speed`.
+        """
+        self.modulator = modulator
 
-        # Calculate step size based on speed
-        step = self.speed
-        indices = np.arange(self.current_position, 
-                            self.current_position + step * self.chunk_size, 
-                            step)
+    def set_tap(self, tap):
+        """
+        Observe the generated audio without altering it.
+        :param tap: Callable taking each (frames, channels) chunk, or None to remove it. It runs on
+                    the audio producer thread, so it must return quickly and never block
+                    (SpectrumAnalyzer.feed only copies into a ring buffer).
+        """
+        self.tap = tap
 
-        # Wrap indices if they go out of bounds
-        indices = np.mod(indices, len(self.audio_data)).astype(int)
+    def set_gain_pan(self, gain=None, pan=None):
+        """Set gain and/or stereo pan; takes effect from the next mixed block."""
+        if gain is not None:
+            self.gain = gain
+        if pan is not None:
+            self.pan = pan
+        if self.voice is not None:
+            self.voice.set_gain_pan(gain, pan)
 
-        # Update current position
-        self.current_position = indices[-1]
-
-        return self.audio_data[indices]
-
-    def _play_loop(self):
-        """Continuously stream audio chunks."""
-        while not self.stop_flag.is_set():
-            chunk = self._generate_chunk()
-            sd.play(chunk, samplerate=self.sample_rate, blocking=True)
+    def _generate_chunk(self, frames=None):
+        """Generate the next chunk of audio based on the current speed."""
+        frames = frames or self.chunk_size
+        if self.modulator is not None:
+            speed = self.modulator(frames)
+            if self.rate_ratio != 1.0:
+                speed = speed * self.rate_ratio
+            chunk = self.resampler.process(self.audio_data, speed, frames)
+        elif self.speed == 0:  # Pause
+            chunk = np.zeros((frames, self.audio_data.shape[1]), dtype=self.audio_data.dtype)
+        else:
+            # The resampler keeps the sub-sample phase between chunks
+            chunk = self.resampler.process(self.audio_data, self.speed * self.rate_ratio, frames)
+        if self.tap is not None:
+            self.tap(chunk)
+        return chunk
 
     def play(self):
-        """Start playback in a separate thread."""
-        self.stop_flag.clear()
-        if not self.play_thread or not self.play_thread.is_alive():
-            self.play_thread = threading.Thread(target=self._play_loop)
-            self.play_thread.start()
+        """Start playback as a voice on the shared mixer."""
+        if self.mixer is None:
+            self.mixer = get_mixer()
+        self.rate_ratio = self.sample_rate / self.mixer.samplerate
+        if self.voice is None:
+            self.voice = self.mixer.add_voice(self._generate_chunk, self.gain, self.pan)
+        self.mixer.start()
 
     def stop(self):
         """Stop playback."""
-        self.stop_flag.set()
-        if self.play_thread and self.play_thread.is_alive():
-            self.play_thread.join()
\ No newline at end of file
+        if self.voice is not None:
+            self.mixer.remove_voice(self.voice)
+            self.voice = None
+
+    def close(self):
+        """
+        Stop playback and release what this Sound holds: a streaming source's file and
+        read-ahead thread, and the mixer's output stream once no other voice is playing
+        (the next play() on that mixer reopens it).
+        """
+        self.stop()
+        if isinstance(self.audio_data, StreamingSource):
+            self.audio_data.close()
+        if self.mixer is not None and not self.mixer.voices:
+            self.mixer.close()
+
+    def render_to_file(self, file_path, seconds=None, frames=None, **kwargs):
+        """
+        Render this Sound alone, at its own sample rate, into a file without a device.
+        Playback state (position, modulator) advances exactly as during live playback.
+        :return: The render report from render.render_to_file.
+        """
+        return render_to_file(self._generate_chunk, file_path, seconds, frames, self.sample_rate,
+                              self.audio_data.shape[1], kwargs.pop("blocksize", self.chunk_size), **kwargs)
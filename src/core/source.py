@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+import soundfile as sf
+
+class StreamingSource:
+    def __init__(self, file_path, block_frames=65536, cache_blocks=8, dtype="float32", read_ahead=True):
+        """
+        Array-like view of an audio file that decodes fixed-size blocks on demand.
+        Only the header is read up front and at most `cache_blocks` blocks are held in memory,
+        so start-up time and memory stay constant regardless of file length.
+        :param file_path: Path of any file soundfile can seek in.
+        :param block_frames: Frames decoded per block.
+        :param cache_blocks: Maximum number of decoded blocks kept (least recently used evicted).
+        :param dtype: Sample type returned by indexing.
+        :param read_ahead: If True, a background thread decodes the block after the one last read.
+        """
+        self.file_path = file_path
+        self.file = sf.SoundFile(f"{file_path}")
+        self.samplerate = self.file.samplerate
+        self.channels = self.file.channels
+        self.frames = self.file.frames
+        self.shape = (self.frames, self.channels)
+        self.ndim = 2
+        self.dtype = np.dtype(dtype)
+        self.block_frames = block_frames
+        self.cache_blocks = max(2, cache_blocks)
+        self.num_blocks = -(-self.frames // block_frames)
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()  # Guards the cache; never held while decoding
+        self.file_lock = threading.Lock()  # Guards the file handle (seek + read)
+
+        self._next_block = None
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = None
+        if read_ahead:
+            self._thread = threading.Thread(target=self._read_ahead_loop, daemon=True)
+            self._thread.start()
+
+    def __len__(self):
+        return self.frames
+
+    def _cached(self, index):
+        with self.lock:
+            block = self.cache.get(index)
+            if block is not None:
+                self.cache.move_to_end(index)
+            return block
+
+    def _load(self, index):
+        """
+        Return block `index`, decoding it if it is not cached. Decoding only holds file_lock,
+        so a reader whose block is cached never waits for a decode on another thread.
+        """
+        block = self._cached(index)
+        if block is not None:
+            return block
+        with self.file_lock:
+            block = self._cached(index)  # Decoded by the other thread while we waited
+            if block is not None:
+                return block
+            self.file.seek(index * self.block_frames)
+            block = self.file.read(self.block_frames, dtype=self.dtype.name, always_2d=True)
+        with self.lock:
+            self.cache[index] = block
+            while len(self.cache) > self.cache_blocks:
+                self.cache.popitem(last=False)
+        return block
+
+    def _read_ahead_loop(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            index = self._next_block
+            if index is not None and not self._closed:
+                self._load(index)
+
+    def __getitem__(self, key):
+        """
+        Index with an integer, a slice or an integer array along the frame axis.
+        :return: Array of shape index.shape + (channels,).
+        """
+        if isinstance(key, slice):
+            key = np.arange(*key.indices(self.frames))
+        indices = np.asarray(key)
+        if indices.dtype.kind not in "iu":
+            raise TypeError("StreamingSource only supports integer indexing.")
+        indices = np.where(indices < 0, indices + self.frames, indices)
+        blocks = indices // self.block_frames
+        out = np.empty(indices.shape + (self.channels,), dtype=self.dtype)
+        if out.size == 0:
+            return out
+
+        first = int(blocks.flat[0])
+        if blocks.min() == blocks.max():
+            out[...] = self._load(first)[indices - first * self.block_frames]
+        else:
+            for index in np.unique(blocks):
+                mask = blocks == index
+                out[mask] = self._load(int(index))[indices[mask] - index * self.block_frames]
+
+        # Prefetch the block after the last one read, in the direction of travel along the first axis
+        if self._thread is not None:
+            rows = indices.reshape(len(indices), -1)[:, 0] if indices.ndim else indices.reshape(1)
+            step = -1 if len(rows) > 1 and rows[-1] < rows[-2] else 1
+            self._next_block = (int(rows[-1]) // self.block_frames + step) % self.num_blocks
+            self._wake.set()
+        return out
+
+    def close(self):
+        """Stop the read-ahead thread and close the file."""
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self.file_lock:
+            self.file.close()
+        with self.lock:
+            self.cache.clear()
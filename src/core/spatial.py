@@ -0,0 +1,155 @@
+import math
+import numpy as np
+from src.core.geometry import Shape, Rect
+
+def bounds_of(item):
+    """
+    Axis-aligned bounds of a Shape, component, pygame.Rect, geometry Rect or (x, y, width, height) tuple.
+    Components are bounded by their rect together with the bounds of all their children,
+    whose rects are relative to the component's top-left corner.
+    :return: (left, top, right, bottom)
+    """
+    if isinstance(item, Rect):
+        x, y = item.top_left.coords[0], item.top_left.coords[1]
+        left, right = sorted((x, x + item.width))
+        top, bottom = sorted((y, y + item.height))
+        return left, top, right, bottom
+    if isinstance(item, Shape):
+        return bounds_of(item.bounds())
+    if hasattr(item, "rect"):
+        left, top, right, bottom = bounds_of(item.rect)
+        x, y = left, top
+        for child in getattr(item, "children", ()):
+            child_left, child_top, child_right, child_bottom = bounds_of(child)
+            left, top = min(left, x + child_left), min(top, y + child_top)
+            right, bottom = max(right, x + child_right), max(bottom, y + child_bottom)
+        return left, top, right, bottom
+    x, y, width, height = item
+    return x, y, x + width, y + height
+
+class GridIndex:
+    def __init__(self, cell_size=64):
+        """
+        Uniform-grid spatial index over the bounding boxes of shapes or components.
+        Each item is registered in every cell its bounds overlap, so a point query only
+        looks at the items of one cell and a rect query at the cells under the rect.
+        Results come back in insertion order, i.e. the last item is the topmost.
+        :param cell_size: Cell edge length; about the size of a typical item works best.
+        """
+        self.cell_size = cell_size
+        self.cells = {}  # (column, row) -> {item: None}, used as an insertion-ordered set
+        self.items = {}  # item -> (bounds, cell range, insertion number)
+        self._count = 0
+
+    def _cell_range(self, bounds):
+        left, top, right, bottom = bounds
+        size = self.cell_size
+        return (math.floor(left / size), math.floor(top / size),
+                math.floor(right / size), math.floor(bottom / size))
+
+    def _cells(self, cell_range):
+        first_column, first_row, last_column, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                yield column, row
+
+    def insert(self, item, bounds=None):
+        """
+        Add `item`, or update it if it is already indexed.
+        :param bounds: (left, top, right, bottom); computed with bounds_of(item) if omitted.
+        """
+        if item in self.items:
+            return self.move(item, bounds)
+        if bounds is None:
+            bounds = bounds_of(item)
+        cell_range = self._cell_range(bounds)
+        for cell in self._cells(cell_range):
+            self.cells.setdefault(cell, {})[item] = None
+        self.items[item] = (bounds, cell_range, self._count)
+        self._count += 1
+
+    def remove(self, item):
+        _, cell_range, _ = self.items.pop(item)
+        for cell in self._cells(cell_range):
+            members = self.cells[cell]
+            del members[item]
+            if not members:
+                del self.cells[cell]
+
+    def move(self, item, bounds=None):
+        """Re-register `item` after its bounds changed. Only the cells it left or entered are touched."""
+        if bounds is None:
+            bounds = bounds_of(item)
+        _, old_range, number = self.items[item]
+        cell_range = self._cell_range(bounds)
+        if cell_range != old_range:
+            old_cells = set(self._cells(old_range))
+            new_cells = set(self._cells(cell_range))
+            for cell in old_cells - new_cells:
+                members = self.cells[cell]
+                del members[item]
+                if not members:
+                    del self.cells[cell]
+            for cell in new_cells - old_cells:
+                self.cells.setdefault(cell, {})[item] = None
+        self.items[item] = (bounds, cell_range, number)
+
+    def clear(self):
+        self.cells.clear()
+        self.items.clear()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.items
+
+    def _ordered(self, items):
+        return sorted(items, key=lambda item: self.items[item][2])
+
+    def query_point(self, x, y, exact=True):
+        """
+        Items under the point (x, y), bottom to top.
+        :param exact: If True, also test each candidate's own shape (Shape.contains_many or
+                      Component.contains_point); otherwise bounding boxes only.
+        """
+        column, row = math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+        hits = []
+        for item in self.cells.get((column, row), ()):
+            left, top, right, bottom = self.items[item][0]
+            if left <= x <= right and top <= y <= bottom and (not exact or self._contains(item, x, y)):
+                hits.append(item)
+        return self._ordered(hits)
+
+    @staticmethod
+    def _contains(item, x, y):
+        if isinstance(item, Shape):
+            return bool(item.contains_many(np.array([[x, y]], dtype=np.float64))[0])
+        if hasattr(item, "contains_point"):
+            return item.contains_point(x, y)
+        return True
+
+    def query_rect(self, rect):
+        """
+        Items whose bounding boxes intersect `rect`, bottom to top.
+        :param rect: Anything bounds_of accepts.
+        """
+        bounds = bounds_of(rect)
+        left, top, right, bottom = bounds
+        cell_range = self._cell_range(bounds)
+        first_column, first_row, last_column, last_row = cell_range
+        if (last_column - first_column + 1) * (last_row - first_row + 1) > len(self.cells):
+            # Fewer occupied cells than cells under the rect: scan the occupied ones instead
+            cells = [members for (column, row), members in self.cells.items()
+                     if first_column <= column <= last_column and first_row <= row <= last_row]
+        else:
+            cells = [self.cells.get(cell, ()) for cell in self._cells(cell_range)]
+        found = set()
+        for members in cells:
+            for item in members:
+                if item in found:
+                    continue
+                item_left, item_top, item_right, item_bottom = self.items[item][0]
+                if item_left <= right and left <= item_right and item_top <= bottom and top <= item_bottom:
+                    found.add(item)
+        return self._ordered(found)
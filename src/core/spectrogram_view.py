@@ -0,0 +1,67 @@
+import numpy as np
+import pygame
+from src.core.colors import note_colors
+from src.core.component import Component
+from src.core.style import Style
+
+class SpectrogramView(Component):
+    def __init__(self, analyzer, rect: pygame.Rect, style: Style = None, floor_db=-80.0,
+                 min_frequency=27.5, lightness=0.5):
+        """
+        Scrolling spectrogram of a SpectrumAnalyzer: one column per spectrum, newest on the
+        right, log-frequency rows from `min_frequency` (bottom) to Nyquist (top). Each row is
+        tinted with the note colour of its frequency and scaled by its level.
+        :param floor_db: Level (dB relative to a full-scale sine) drawn as black.
+        """
+        super().__init__(rect, style)
+        self.analyzer = analyzer
+        self.floor_db = floor_db
+        self.min_frequency = min_frequency
+        self.lightness = lightness
+        self._size = None
+        self._drawn = None  # analyzer.frames when the cached surface was last rendered
+
+    def _layout(self):
+        """Allocate the buffers for the current rect and map its rows to FFT bins."""
+        width, height = self._size = self.rect.size
+        analyzer = self.analyzer
+        nyquist = analyzer.samplerate / 2
+        frequencies = np.geomspace(min(self.min_frequency, nyquist), nyquist, height)[::-1]
+        step = analyzer.samplerate / analyzer.size
+        self._bins = np.clip(np.rint(frequencies / step).astype(np.intp), 0, analyzer.bins - 1)
+        self._colors = note_colors(frequencies, self.lightness).astype(np.float32)
+        self._spectra = np.empty((width, analyzer.bins), dtype=np.float32)
+        self._levels = np.empty((width, height), dtype=np.float32)
+        self._pixels = np.zeros((width, height, 3), dtype=np.uint8)
+        self._surface = pygame.Surface((width, height))
+        self._drawn = None
+
+    def _render(self):
+        width = self._size[0]
+        spectra = self.analyzer.latest(width, out=self._spectra)
+        count = len(spectra)
+        levels = self._levels[:count]
+        np.take(spectra, self._bins, axis=1, out=levels)
+        # Magnitude -> dB -> [0, 1] between floor_db and 0 dB
+        np.maximum(levels, 1e-12, out=levels)
+        np.log10(levels, out=levels)
+        levels *= 20 / -self.floor_db
+        levels += 1
+        np.clip(levels, 0, 1, out=levels)
+        pixels = self._pixels
+        pixels[:width - count] = self.style.colors.get("background", (0, 0, 0))
+        np.multiply(levels[..., None], self._colors, out=pixels[width - count:], casting="unsafe")
+        pygame.surfarray.blit_array(self._surface, pixels)
+
+    def update(self):
+        """Repaint whenever the analyzer has produced new spectra."""
+        if self._drawn != self.analyzer.frames:
+            self.mark_dirty()
+
+    def draw(self, surface):
+        if self._size != self.rect.size:
+            self._layout()
+        if self._drawn != self.analyzer.frames:
+            self._drawn = self.analyzer.frames
+            self._render()
+        surface.blit(self._surface, self.rect)
@@ -0,0 +1,145 @@
+import threading
+import numpy as np
+from src.core.playback import RingBuffer
+
+class SpectrumAnalyzer:
+    def __init__(self, samplerate=44100, size=2048, hop=512, history=256, channels=2,
+                 buffer_frames=None, max_backlog=4):
+        """
+        Windowed short-time FFT of an audio stream, computed off the audio path.
+        feed() only copies chunks into a lock-free ring buffer; a background thread (or
+        explicit process() calls) turns every `hop` new frames into one spectrum over the
+        last `size` frames and stores it in a ring-buffered spectrogram.
+        Under load analysis frames are dropped, never audio: feed() discards a chunk that
+        does not fit, and process() skips ahead when more than `max_backlog` hops are pending.
+        :param samplerate: Sample rate of the fed audio in Hz.
+        :param size: FFT window length in frames.
+        :param hop: Frames between successive spectra (size - hop frames of overlap).
+        :param history: Number of spectra kept in the spectrogram.
+        :param channels: Channels per fed chunk; mono chunks are broadcast, chunks with another
+                         channel count are down-mixed to mono, spectra use the channel mean.
+        :param buffer_frames: Ring buffer capacity in frames; defaults to 4 * size.
+        :param max_backlog: Pending hops tolerated before the oldest ones are skipped.
+        """
+        if not 0 < hop <= size:
+            raise ValueError("hop must be between 1 and size.")
+        self.samplerate = samplerate
+        self.size = size
+        self.hop = hop
+        self.history = history
+        self.channels = channels
+        self.max_backlog = max_backlog
+        self.ring = RingBuffer(buffer_frames or 4 * size, channels, np.float32)
+        self.frequencies = np.fft.rfftfreq(size, 1 / samplerate)
+        self.bins = len(self.frequencies)
+        self.spectrogram = np.zeros((history, self.bins), dtype=np.float32)  # Row frames % history is the newest
+        self.frames = 0  # Spectra computed so far
+        self.frames_dropped = 0  # Hops skipped because analysis fell behind
+        self.chunks_dropped = 0  # Fed chunks rejected because the ring buffer was full
+
+        # Hann window scaled so that a full-scale sine peaks at magnitude 1
+        self._window = np.hanning(size)
+        self._window *= 2 / self._window.sum()
+        self._weights = np.full(channels, 1 / channels, dtype=np.float32)
+        self._block = np.zeros((hop, channels), dtype=np.float32)
+        self._samples = np.zeros(size)  # The last `size` mono frames
+        self._windowed = np.zeros(size)
+        self._spectrum = np.zeros(self.bins, dtype=np.complex128)
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def feed(self, chunk):
+        """
+        Queue a chunk for analysis; safe to call from the audio thread (usable as a Sound tap).
+        :param chunk: Array of shape (frames, channels), (frames, 1) or (frames,); other channel
+                      counts are down-mixed to mono rather than raising on the audio thread.
+        :return: True if the chunk was queued, False if it was dropped.
+        """
+        if chunk.ndim == 1:
+            chunk = chunk[:, None]
+        elif chunk.shape[1] not in (1, self.channels):
+            chunk = chunk.mean(axis=1, keepdims=True)
+        if len(chunk) > self.ring.free():
+            self.chunks_dropped += 1
+            return False
+        self.ring.write(chunk)
+        if self.ring.available() >= self.hop:
+            self._wake.set()
+        return True
+
+    def process(self):
+        """
+        Analyze every complete hop that is queued (consumer side).
+        :return: Number of spectra computed.
+        """
+        hop = self.hop
+        pending = self.ring.available() // hop
+        if pending > self.max_backlog:
+            skipped = pending - self.max_backlog
+            self.ring.skip(skipped * hop)
+            self.frames_dropped += skipped
+        computed = 0
+        samples = self._samples
+        while self.ring.available() >= hop:
+            self.ring.read_into(self._block)
+            samples[:-hop] = samples[hop:]
+            np.matmul(self._block, self._weights, out=samples[-hop:])
+            np.multiply(samples, self._window, out=self._windowed)
+            np.fft.rfft(self._windowed, out=self._spectrum)
+            np.abs(self._spectrum, out=self.spectrogram[self.frames % self.history])
+            self.frames += 1
+            computed += 1
+        return computed
+
+    def latest(self, count=None, out=None):
+        """
+        The most recent spectra, oldest first.
+        :param count: Number of spectra wanted; fewer are returned if fewer have been computed.
+        :param out: Optional (count, bins) float32 array to copy into.
+        :return: A (n, bins) array of magnitudes, n <= count.
+        """
+        frames = self.frames
+        count = min(self.history if count is None else count, frames, self.history)
+        if out is None:
+            out = np.empty((count, self.bins), dtype=np.float32)
+        out = out[:count]
+        start = (frames - count) % self.history
+        first = min(count, self.history - start)
+        out[:first] = self.spectrogram[start:start + first]
+        out[first:] = self.spectrogram[:count - first]
+        return out
+
+    def _run(self):
+        period = self.hop / self.samplerate
+        while not self._stop.is_set():
+            self._wake.wait(period)
+            self._wake.clear()
+            self.process()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the background analysis thread."""
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "frames_dropped": self.frames_dropped,
+            "chunks_dropped": self.chunks_dropped,
+            "pending": self.ring.available(),
+        }
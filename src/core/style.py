@@ -1,5 +1,5 @@
 from pathlib import Path
-import pygame
+from src.core.fonts import get_font_manager
 
 class Style:
     def __init__(self, font_path="LiberationMono-Regular.ttf", font_size=24, **colors):
@@ -7,9 +7,12 @@ class Style:
         self.font_size = font_size
         self.colors = {label: value for label, value in colors.items()}
 
-        # Initialize pygame font
-        pygame.font.init()
-        if self.font_path.exists():
-            self.font = pygame.font.Font(str(self.font_path), self.font_size)
-        else:
-            raise FileNotFoundError(f"Font file not found: {self.font_path}")
+        # Fonts are loaded once per (path, size) and shared between styles
+        self.font = get_font_manager().font(self.font_path, self.font_size)
+
+    def render(self, text, color, antialias=True, font=None):
+        """
+        Render `text` in this style's font (or `font`) through the shared text cache.
+        :return: A shared surface; blit it, don't draw on it.
+        """
+        return get_font_manager().render(font or self.font, text, antialias, color)
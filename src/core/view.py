@@ -1,9 +1,16 @@
+import math
+import threading
+import time
 import pygame
 from typing import List
 from src.core.style import Style
 from collections.abc import Callable
 from pathlib import Path
 from src.core.json_manager import *
+from src.core.spatial import GridIndex, bounds_of
+from src.core.component import Component, ChildList
+from src.core.frame_stats import FrameStats
+from src.core.events import EventDispatcher
 
 class View:
     def __init__(self, canvas=None, config_path=Path("config")/"view.json"):
@@ -12,24 +19,231 @@ class View:
         # Use the configuration values
         self.width = self.view_config.default_width
         self.height = self.view_config.default_height
-        self.delay = self.view_config.default_delay
+        self.target_fps = self.view_config.target_fps
+        self.idle_wait = self.view_config.idle_wait
+        self.idle_timeout = 500  # ms between wake-ups while idle, so invalidate() from other threads is picked up
 
         # Initialize canvas
         self.canvas = canvas or pygame.display.set_mode((self.width, self.height))
         self.children = []
         self.running = True
+        self.index = GridIndex()  # Child bounds, used to route mouse clicks and find what to repaint
+        self._synced = self.children.version  # children.version the index matches
+        self.unbounded = []  # Children without bounds: never culled and never hit
+        self.camera = None
+        self.background = (0, 0, 0)
+        self.dirty_rects = []  # Screen areas to repaint on the next draw
+        self.full_redraw = True  # Repaint everything on the next draw (first frame, resize)
+        self.dirty_lock = threading.Lock()  # Guards dirty_rects and full_redraw against invalidate() from other threads
+        self.animated = []  # Children overriding Component.update, polled once per frame
+        self.stats = FrameStats(self.target_fps)
+        self.dispatcher = EventDispatcher(self)  # Routes pointer and keyboard events to one child
 
+    @property
+    def children(self):
+        return self._children
+
+    @children.setter
+    def children(self, children):
+        self._children = ChildList(children)
 
     def add_child(self, child: 'View'):
         """Add a child component to this view."""
+        synced = self._synced == self.children.version
         self.children.append(child)
+        self._adopt(child)
+        if synced:
+            self._synced = self.children.version
 
-    def draw(self):
-        """Draw the view and its children."""
-        self.canvas.fill((0,0,0))
+    def _adopt(self, child):
+        try:
+            bounds = bounds_of(child)
+        except (TypeError, ValueError):
+            self.unbounded.append(child)
+        else:
+            self.index.insert(child, bounds)
+            self._damage(*bounds)
+        if hasattr(child, "parent"):
+            child.parent = self
+        if getattr(type(child), "update", None) not in (None, Component.update):
+            self.animated.append(child)
+
+    def get_absolute_position(self):
+        """Children of a view are positioned in canvas coordinates."""
+        return 0, 0
+
+    def invalidate(self, rect=None):
+        """
+        Schedule a repaint of `rect` on the next draw.
+        :param rect: Anything bounds_of accepts (a child component repaints its bounds);
+                     None repaints the whole canvas.
+        """
+        if rect is None:
+            with self.dirty_lock:
+                self.full_redraw = True
+        else:
+            self._damage(*bounds_of(rect))
+
+    def _damage(self, left, top, right, bottom):
+        left, top = math.floor(left), math.floor(top)
+        rect = pygame.Rect(left, top, math.ceil(right) - left, math.ceil(bottom) - top)
+        with self.dirty_lock:
+            self.dirty_rects.append(rect)
+
+    def set_camera(self, camera):
+        """Use `camera` for this view; its aspect ratio follows the canvas size."""
+        self.camera = camera
+        camera.fit(self.canvas)
+
+    def remove_child(self, child):
+        """Remove a child component from this view."""
+        synced = self._synced == self.children.version
+        self.invalidate(child)
+        self.children.remove(child)
+        self._forget(child)
+        if synced:
+            self._synced = self.children.version
+
+    def _forget(self, child):
+        if child in self.index:
+            self.index.remove(child)
+        if child in self.unbounded:
+            self.unbounded.remove(child)
+        if child in self.animated:
+            self.animated.remove(child)
+        if getattr(child, "parent", None) is self:
+            child.parent = None
+        self.dispatcher.forget(child)
+
+    def move_child(self, child, old=None):
+        """
+        Refresh the index after `child`'s rect (or one of its children's) has changed,
+        and repaint both where it was and where it is now.
+        :param old: Previous bounds; taken from the index if omitted.
+        """
+        if child in self.unbounded:
+            return
+        if old is not None:
+            self.invalidate(old)
+        elif child in self.index:
+            self._damage(*self.index.items[child][0])
+        self.index.insert(child)
+        self.invalidate(child)
+
+    def child_index(self):
+        """The index of the children, synced with self.children; used for hit testing."""
+        self._sync_index()
+        return self.index
+
+    def _sync_index(self):
+        """
+        Bring the index in line with self.children after it was edited directly (append,
+        item assignment, ...): index new children, drop removed ones and restore the stacking order.
+        """
+        if self._synced == self.children.version:
+            return
+        children = set(self.children)
+        for child in [item for item in [*self.index.items, *self.unbounded] if item not in children]:
+            if child in self.index:
+                self._damage(*self.index.items[child][0])
+            self._forget(child)
         for child in self.children:
-            child.draw(self.canvas)
-        pygame.display.flip()
+            if child not in self.index and child not in self.unbounded:
+                self._adopt(child)
+        indexed = [child for child in self.children if child in self.index]
+        if list(self.index.items) != indexed:
+            # Reordered: re-inserting puts each child on top of the ones before it
+            for child in indexed:
+                bounds = self.index.items[child][0]
+                self.index.remove(child)
+                self.index.insert(child, bounds)
+            self.invalidate()
+        self._synced = self.children.version
+
+    def draw(self):
+        """
+        Repaint what changed since the last draw and present only those areas.
+        Children report changes through mark_dirty(); everything is repainted on the first
+        frame, after a resize or after invalidate() without a rect.
+        :return: The list of repainted rects (empty when nothing changed).
+        """
+        self._sync_index()
+        for child in self.animated:
+            child.update()
+        canvas_rect = self.canvas.get_rect()
+        with self.dirty_lock:
+            dirty, self.dirty_rects = self.dirty_rects, []
+            full, self.full_redraw = self.full_redraw, False
+        rects = [canvas_rect] if full else self._merge(dirty, canvas_rect)
+        if not rects:
+            return rects
+
+        if rects == [canvas_rect]:
+            self.canvas.fill(self.background)
+            for child in self.visible_children():
+                child.draw(self.canvas)
+        else:
+            for rect in rects:
+                # Clipping keeps children that overlap the rect from painting outside it
+                self.canvas.set_clip(rect)
+                self.canvas.fill(self.background, rect)
+                for child in self._children_in(rect):
+                    child.draw(self.canvas)
+            self.canvas.set_clip(None)
+        self._present(rects, canvas_rect)
+        return rects
+
+    @staticmethod
+    def _merge(rects, canvas_rect, full_fraction=0.5, max_rects=16, gap=16):
+        """
+        Clip the dirty rects to the canvas and union the ones that overlap or lie within `gap`
+        pixels of each other: every rect costs a clip, fill and index query, so one slightly
+        larger repaint beats several small ones.
+        Falls back to the whole canvas once they cover more than `full_fraction` of it or more
+        than `max_rects` separate rects remain.
+        """
+        merged = []  # Grown by gap / 2 on every side, so near neighbours collide
+        for rect in rects:
+            rect = rect.clip(canvas_rect)
+            if not rect.width or not rect.height:
+                continue
+            rect.inflate_ip(gap, gap)
+            hit = rect.collidelist(merged)
+            while hit != -1:
+                rect.union_ip(merged.pop(hit))
+                hit = rect.collidelist(merged)
+            merged.append(rect)
+            if len(merged) > max_rects:
+                return [canvas_rect]
+        merged = [rect.inflate(-gap, -gap) for rect in merged]
+        if sum(rect.width * rect.height for rect in merged) > full_fraction * canvas_rect.width * canvas_rect.height:
+            return [canvas_rect]
+        return merged
+
+    def _present(self, rects, canvas_rect):
+        """Push the repainted rects to the window; off-screen canvases need no presenting."""
+        if self.canvas is not pygame.display.get_surface():
+            return
+        if rects == [canvas_rect]:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def visible_children(self):
+        """
+        Children whose bounds overlap the canvas, bottom to top; the rest are skipped when drawing.
+        Answered by the index, so only the cells under the canvas are visited.
+        """
+        self._sync_index()
+        return self._children_in(self.canvas.get_rect())
+
+    def _children_in(self, rect):
+        """Children whose bounds overlap `rect` plus every unbounded child, bottom to top."""
+        found = self.index.query_rect(rect)
+        if self.unbounded:
+            shown = set(found).union(self.unbounded)
+            found = [child for child in self.children if child in shown]
+        return found
 
     def handle_event(self, event):
         if event.type == pygame.QUIT:
@@ -41,18 +255,41 @@ class View:
             self.running = False
             return  # Don't delegate further
 
-        # Delegate to child components
-        for component in self.children:
-            if hasattr(component, "handle_event"):
-                component.handle_event(event)
+        if event.type == pygame.VIDEORESIZE:
+            self.invalidate()
+            if self.camera is not None:
+                self.camera.fit(self.canvas)
 
-    def mainloop(self):
-        """Run the main event loop for the view."""
-        running = True
-        while running:
-            for event in pygame.event.get():
-                self.handle_event(event)
-            self.draw()
+        # Pointer events go to the component under the cursor (or the one capturing the
+        # pointer), keyboard events to the focused one, the rest to every child
+        self.dispatcher.dispatch(event)
+
+    def is_idle(self):
+        """True when the next frame would repaint nothing and no child animates."""
+        return not (self.animated or self.dirty_rects or self.full_redraw)
 
-        pygame.quit()
+    def mainloop(self, quit=True):
+        """
+        Run the event loop until handle_event clears self.running (window closed, Escape).
+        Frames are paced to target_fps with a pygame Clock. With idle_wait, the loop blocks in
+        pygame.event.wait while there is nothing to repaint instead of ticking at full rate.
+        The timings of frames that repainted something are collected in self.stats.
+        :param quit: Shut pygame down on exit.
+        """
+        clock = pygame.time.Clock()
+        self.stats.target_fps = self.target_fps
+        self.running = True
+        while self.running:
+            if self.idle_wait and self.is_idle():
+                events = [pygame.event.wait(self.idle_timeout)] + pygame.event.get()
+            else:
+                events = pygame.event.get()
+            start = time.perf_counter()
+            for event in events:
+                self.handle_event(event)
+            if self.running and self.draw():
+                self.stats.record(time.perf_counter() - start)
+            clock.tick(self.target_fps or 0)
 
+        if quit:
+            pygame.quit()
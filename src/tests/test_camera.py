@@ -1,6 +1,8 @@
 import numpy as np
+import pygame
 from src.core.geometry import Vector, matrices_equal_with_tolerance
 from src.core.camera import Camera
+from src.core.view import View
 from src.core.log import log
 
 def test_camera(indent="", verbose=True) -> bool:
@@ -36,6 +38,48 @@ def test_camera(indent="", verbose=True) -> bool:
         assert len(transformed_frustum) == 3, "Frustum transformation failed."
         log("Frustum Projection test passed.", indent + "  ", verbose)
 
+        # Batched Projection Test
+        log("Testing Batched Projection...", indent + "  ", verbose)
+        points = np.random.default_rng(0).uniform(-5, 5, (500, 3))
+        for camera in (camera_flat, camera_ortho, camera_frustum):
+            expected = np.array([camera.apply(Vector(*p)) for p in points])
+            assert np.allclose(camera.apply_many(points), expected, atol=1e-5), f"apply_many failed for {camera.mode}."
+        projected, visible = camera_frustum.apply_many(points, clip=True)
+        assert np.array_equal(visible, (np.abs(projected[:, 2]) <= 1)), "Near/far clipping mask failed."
+        pixels = np.empty((500, 2))
+        result = camera_frustum.apply_many(points, out=pixels, viewport=(0, 0, 800, 600))
+        assert result is pixels, "apply_many did not write into the output buffer."
+        assert np.allclose(pixels[:, 0], (projected[:, 0] + 1) * 400), "Viewport x mapping failed."
+        assert np.allclose(pixels[:, 1], (1 - projected[:, 1]) * 300), "Viewport y mapping failed."
+        flat_pixels = camera_flat.apply_many(points[:, :2] / 5, viewport=(0, 0, 800, 600))
+        assert np.allclose(flat_pixels, np.column_stack([(points[:, 0] / 5 + 1) * 400, (1 - points[:, 1] / 5) * 300])), \
+            "Flat mode ignored the viewport."
+        assert camera_flat.apply_many(points[:, :2]).shape == (500, 2), "Flat mode output was not sized from 2D input."
+        _, visible = camera_frustum.apply_many([Vector(0, 0, 0)], clip=True)
+        assert not visible[0], "A point with w = 0 was reported visible."
+        log("Batched Projection test passed.", indent + "  ", verbose)
+
+        # View Matrix, Aspect Ratio and Frustum Planes Test
+        log("Testing View Matrix and Frustum Planes...", indent + "  ", verbose)
+        camera = Camera(mode="frustum", near=1, far=10, fov=90)
+        combined = camera.combined
+        assert camera.combined is combined, "Combined matrix was recomputed without changes."
+        camera.fit(pygame.Surface((800, 400)))
+        assert camera.combined is not combined and np.isclose(camera.matrix[1, 1] / camera.matrix[0, 0], 2), "Aspect ratio was not applied."
+        camera.look_at(Vector(10, 0, 0), Vector(0, 0, 0))
+        assert np.allclose(camera.view_matrix @ [0, 0, 0, 1], [0, 0, -10, 1]), "look_at failed."
+        unmoved = Camera(mode="frustum", near=1, far=10, fov=90, aspect_ratio=2)
+        assert np.allclose(camera.apply(Vector(0, 0, 0)), unmoved.apply(Vector(0, 0, -10))), "Combined matrix ignores the view."
+        planes = camera.frustum_planes()
+        points = np.random.default_rng(1).uniform(-12, 12, (500, 3))
+        _, visible = camera.apply_many(points, clip=True)
+        inside = (points @ planes[:, :3].T + planes[:, 3] >= 0).all(axis=1)
+        assert np.array_equal(inside, visible & (np.abs(camera.apply_many(points)[:, :2]) <= 1).all(axis=1)), "Frustum planes disagree with projection."
+        view = View(pygame.Surface((300, 600)))
+        view.set_camera(camera)
+        assert np.isclose(camera.params["aspect_ratio"], 0.5), "Camera did not fit the View canvas."
+        log("View Matrix and Frustum Planes test passed.", indent + "  ", verbose)
+
         log("All Camera tests passed successfully.", indent, verbose)
         return True
     except Exception as e:
@@ -0,0 +1,49 @@
+import colorsys
+import numpy as np
+from src.core.colors import *
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_colors(indent="", verbose=True) -> bool:
+    try:
+        log("Testing colors...", indent, verbose)
+        rng = np.random.default_rng(0)
+        t, l = rng.uniform(-10, 10, 300), rng.uniform(0, 1, 300)
+
+        # Array versions match the scalar functions
+        log("Testing array colour functions...", indent + "  ", verbose)
+        for dtype in (float, int, np.float32):
+            expected = [rainbow(a, b, dtype) for a, b in zip(t, l)]
+            assert np.array_equal(rainbow_array(t, l, dtype), expected), f"rainbow_array failed for {dtype.__name__}."
+        for fn in (colorsys.rgb_to_hls, colorsys.rgb_to_hsv):
+            expected = [rainbow_convert(a, b, float, fn) for a, b in zip(t, l)]
+            assert np.allclose(rainbow_convert_array(t, l, float, fn), expected), f"rainbow_convert_array failed for {fn.__name__}."
+        rgb = rng.uniform(0, 1, (300, 3))
+        rgb[:20] = 0.25  # Greys take a separate branch
+        assert np.allclose(rgb_to_hls_array(rgb), [colorsys.rgb_to_hls(*c) for c in rgb]), "rgb_to_hls_array failed."
+        assert np.allclose(rgb_to_hsv_array(rgb), [colorsys.rgb_to_hsv(*c) for c in rgb]), "rgb_to_hsv_array failed."
+        frequencies = rng.uniform(20, 20000, 300)
+        assert np.allclose(note_color_array(frequencies, 0.3), [note_color(f, 0.3) for f in frequencies]), "note_color_array failed."
+        assert rainbow_array(t.reshape(20, 15), 0.5).shape == (20, 15, 3), "rainbow_array lost the input shape."
+        log("Array colour function tests passed.", indent + "  ", verbose)
+
+        # The lookup table is within one step of the exact colour
+        log("Testing colour LUT...", indent + "  ", verbose)
+        out = np.empty((300, 3), dtype=np.uint8)
+        colours = note_colors(frequencies, out=out)
+        assert colours is out and colours.dtype == np.uint8, "note_colors did not fill the output buffer."
+        assert np.abs(colours.astype(int) - note_color_array(frequencies, 0.5, int)).max() <= 2, "LUT colours are off."
+        assert rainbow_lut() is rainbow_lut() and len(rainbow_lut()) == 4096, "rainbow_lut is not cached."
+        assert np.array_equal(note_colors(np.array([0.0])), note_colors(np.array([27.5]))), "DC bin colour failed."
+        log("Colour LUT tests passed.", indent + "  ", verbose)
+
+        log("Colors tests passed.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Colors tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -0,0 +1,75 @@
+import numpy as np
+import pygame
+from src.core.geometry import Vector, Rect, Triangle3D, Ellipse3D, Transform
+from src.core.camera import Camera
+from src.core.culling import Culler, cull, box_of
+from src.core.component import Component
+from src.core.view import View
+from src.core.style import Style
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_culling(indent="", verbose=True) -> bool:
+    try:
+        log("Testing culling...", indent, verbose)
+        rng = np.random.default_rng(0)
+
+        # Frustum culling never drops a shape with a visible vertex
+        log("Testing frustum culling...", indent + "  ", verbose)
+        camera = Camera(mode="frustum", near=1, far=50, fov=60)
+        camera.look_at(Vector(0, 0, 10), Vector(0, 0, 0))
+        shapes = [Triangle3D(Vector(*c), Vector(*(c + 1)), Vector(*(c + [1, 0, 0.5])))
+                  for c in rng.uniform(-60, 60, (500, 3))]
+        culler = Culler(shapes)
+        visible = culler.visible(camera)
+        assert 0 < len(visible) < len(shapes), "Frustum culling kept everything or nothing."
+        for shape in shapes:
+            _, inside = camera.apply_many(np.array([v.coords for v in shape.vertices]), clip=True)
+            projected = camera.apply_many(np.array([v.coords for v in shape.vertices]))
+            if (inside & (np.abs(projected[:, :2]) <= 1).all(axis=1)).any():
+                assert shape in visible, "A visible shape was culled."
+        assert cull(shapes, camera) == [s for s in shapes if s in visible], "cull() disagrees with Culler."
+        log("Frustum culling tests passed.", indent + "  ", verbose)
+
+        # Edits and transformed shapes
+        log("Testing updates...", indent + "  ", verbose)
+        ellipse = Ellipse3D(Vector(0, 0, 0), Vector(1, 0, 0), Vector(0, 1, 0))
+        culler.add(ellipse)
+        assert ellipse in culler.visible(camera), "Centered shape was culled."
+        ellipse.translation_vector = Vector(0, 0, 100)  # Behind the camera
+        culler.update(ellipse)
+        assert ellipse not in culler.visible(camera), "Moved shape was not culled."
+        ellipse.rotation_matrix = Transform.rotation(np.pi, "x")
+        culler.update(ellipse)
+        assert np.allclose(box_of(ellipse)[[2, 5]], 100) and ellipse not in culler.visible(camera), "Rotated box failed."
+        culler.remove(shapes[0])
+        assert shapes[0] not in culler and len(culler) == len(shapes), "Culler.remove() failed."
+        assert np.array_equal(culler.boxes, [box_of(item) for item in culler.items]), "Culler rows out of sync."
+        log("Update tests passed.", indent + "  ", verbose)
+
+        # 2D viewport culling of view children
+        log("Testing viewport culling...", indent + "  ", verbose)
+        flat = [Rect(Vector(x, y), Vector(20, 20)) for x, y in rng.uniform(-200, 1000, (300, 2))]
+        expected = [r for r in flat if r.top_left.x() <= 800 and r.top_left.x() + 20 >= 0
+                    and r.top_left.y() <= 600 and r.top_left.y() + 20 >= 0]
+        assert cull(flat, viewport=(0, 0, 800, 600)) == expected, "Viewport culling failed."
+        view = View(pygame.Surface((400, 300)))
+        shown, hidden = Component(pygame.Rect(10, 10, 50, 50), Style()), Component(pygame.Rect(500, 10, 50, 50), Style())
+        view.add_child(shown)
+        view.add_child(hidden)
+        view.children.append(object())  # Children without bounds are never culled
+        assert view.visible_children() == [shown, view.children[2]], "View.visible_children() failed."
+        hidden.set_rect(300, 10, 50, 50)
+        assert view.visible_children() == [shown, hidden, view.children[2]], "Moved child was not shown."
+        log("Viewport culling tests passed.", indent + "  ", verbose)
+
+        log("Culling tests passed.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Culling tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -0,0 +1,65 @@
+import numpy as np
+from src.core.engine import Engine, EngineModulator
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_engine(indent="", verbose=True) -> bool:
+    try:
+        log("Testing Engine...", indent, verbose)
+
+        # rpm_trajectory is the scalar update_rpm stepped once per input
+        log("Testing rpm_trajectory...", indent + "  ", verbose)
+        pedals = np.linspace(0, 1, 50) ** 2
+        scalar = Engine(friction=0.3)
+        expected = []
+        for pedal in pedals:
+            scalar.update_rpm(pedal)
+            expected.append(scalar.current_rpm)
+        engine = Engine(friction=0.3)
+        assert np.allclose(engine.rpm_trajectory(pedals), expected), "rpm_trajectory differs from update_rpm."
+        assert engine.current_rpm == scalar.current_rpm, "rpm_trajectory left the engine in the wrong state."
+        log("rpm_trajectory tests passed.", indent + "  ", verbose)
+
+        # Batch simulation reproduces update_rpm bit for bit, per engine
+        log("Testing batch simulation...", indent + "  ", verbose)
+        rng = np.random.default_rng(0)
+        engines = [Engine(max_rpm, friction, ratio) for max_rpm, friction, ratio in
+                   zip([7000, 5000, 9000, 7000], [0.1, 0.5, 0.1, 0.95], [0.5, 0.3, 0.6, 0.5])]
+        engines[1].revs_forward = False
+        engines[2].current_rpm = 2500.0
+        pedals = rng.uniform(0, 1, (len(engines), 300))
+        expected = np.empty_like(pedals)
+        for i, engine in enumerate(engines):
+            clone = Engine(engine.max_rpm, engine.friction, engine.baseline_ratio)
+            clone.revs_forward, clone.current_rpm = engine.revs_forward, engine.current_rpm
+            for step, pedal in enumerate(pedals[i]):
+                clone.update_rpm(pedal)
+                expected[i, step] = clone.current_rpm
+        batch = Engine.simulate_engines(engines, pedals)
+        assert np.array_equal(batch, expected), "Batch simulation differs from update_rpm."
+        assert [engine.current_rpm for engine in engines] == list(expected[:, -1]), "Engines were not left at their final RPM."
+        single = Engine.simulate(pedals[0], 7000, 0.1, 0.5)
+        assert single.shape == (300,) and np.array_equal(single, expected[0]), "1D simulation failed."
+        log("Batch simulation tests passed.", indent + "  ", verbose)
+
+        # The modulator's speed curve is continuous and independent of block size
+        log("Testing EngineModulator...", indent + "  ", verbose)
+        pedal = lambda t: 0.5 + 0.5 * np.sin(2 * np.pi * t)
+        whole = EngineModulator(Engine(), pedal, samplerate=1000, control_rate=50)(3000)
+        blocks = EngineModulator(Engine(), pedal, samplerate=1000, control_rate=50)
+        split = np.concatenate([blocks(n) for n in (7, 500, 1024, 1469)])
+        assert np.allclose(split, whole), "Speed curve depends on block boundaries."
+        assert np.max(np.abs(np.diff(whole))) < 0.05, "Speed curve has discontinuities."
+        assert whole[0] == 0 and whole.max() > 0.5, "Speed curve does not follow the pedal."
+        log("EngineModulator tests passed.", indent + "  ", verbose)
+
+        log("All Engine tests passed successfully.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Engine tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -0,0 +1,122 @@
+import pygame
+from src.core.component import Component
+from src.core.slider import Slider
+from src.core.button import Button
+from src.core.spatial import bounds_of
+from src.core.style import Style
+from src.core.view import View
+from src.core.log import log
+import traceback as tb
+import sys
+
+class _Recorder(Component):
+    def __init__(self, rect, focusable=False):
+        super().__init__(rect)
+        self.focusable = focusable
+        self.events = []
+
+    def handle_event(self, event):
+        self.events.append(event.type)
+        super().handle_event(event)
+
+def _motion(x, y, buttons=(0, 0, 0)):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), buttons=buttons, rel=(0, 0))
+
+def _button(kind, x, y, button=1):
+    return pygame.event.Event(kind, pos=(x, y), button=button)
+
+def test_events(indent="", verbose=True) -> bool:
+    try:
+        log("Testing event dispatch...", indent, verbose)
+        view = View(pygame.Surface((400, 400)))
+        panel = _Recorder(pygame.Rect(100, 100, 200, 200))
+        lower = _Recorder(pygame.Rect(10, 10, 50, 50), focusable=True)
+        upper = _Recorder(pygame.Rect(30, 30, 50, 50))
+        inner = _Recorder(pygame.Rect(5, 5, 10, 10))
+        view.add_child(panel)
+        panel.add_child(lower)
+        panel.add_child(upper)
+        upper.add_child(inner)
+        other = _Recorder(pygame.Rect(0, 0, 50, 50))
+        view.children.append(other)  # Appended without add_child, as some callers do
+        dispatcher = view.dispatcher
+
+        # Child rects are relative to their parent; the topmost, deepest component wins
+        log("Testing hit testing...", indent + "  ", verbose)
+        assert dispatcher.hit_test(137, 137) is inner, "Nested child was not found."
+        assert dispatcher.hit_test(115, 115) is lower, "Child was not found."
+        assert dispatcher.hit_test(145, 145) is upper, "Overlapping children: the upper one must win."
+        assert dispatcher.hit_test(250, 250) is panel, "Container background was not hit."
+        assert dispatcher.hit_test(10, 10) is other and dispatcher.hit_test(350, 20) is None, "Top-level hit test failed."
+        upper.set_rect(120, 120, 50, 50)
+        assert dispatcher.hit_test(145, 145) is lower and dispatcher.hit_test(250, 250) is upper, "Moved child was not re-indexed."
+        log("Hit testing tests passed.", indent + "  ", verbose)
+
+        log("Testing routing...", indent + "  ", verbose)
+        view.handle_event(_motion(250, 250))
+        assert upper.events == [pygame.MOUSEMOTION], "Motion did not reach the component under the pointer."
+        assert panel.events == lower.events == inner.events == other.events == [], "Motion was broadcast."
+        view.handle_event(pygame.event.Event(pygame.USEREVENT))
+        assert panel.events == other.events == [pygame.USEREVENT] and upper.events[-1] == pygame.USEREVENT, \
+            "Other events were not broadcast."
+        log("Routing tests passed.", indent + "  ", verbose)
+
+        # Targets get the position in the coordinates of their own rect
+        log("Testing nested targets...", indent + "  ", verbose)
+        nested = View(pygame.Surface((400, 400)))
+        box = Component(pygame.Rect(100, 100, 100, 100))
+        button = Button(pygame.Rect(10, 10, 40, 20), Style(), "OK")
+        clicks = []
+        button.set_callback(lambda: clicks.append(True))
+        nested.add_child(box)
+        box.add_child(button)
+        assert bounds_of(box) == (100, 100, 200, 200), "Child rects were not taken as relative to their parent."
+        assert nested.dispatcher.dispatch(_button(pygame.MOUSEBUTTONDOWN, 120, 120)) is button, "Nested button was not hit."
+        assert clicks == [True], "Nested button rejected its own click."
+        nested.dirty_rects.clear()
+        button.set_text("Yes")
+        assert nested.dirty_rects == [pygame.Rect(110, 110, 40, 20)], "Nested repaint was not moved to canvas coordinates."
+        log("Nested target tests passed.", indent + "  ", verbose)
+
+        # Clicking a focusable component gives it the keyboard; clicking elsewhere takes it away
+        log("Testing keyboard focus...", indent + "  ", verbose)
+        key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=0, unicode="a", scancode=4)
+        view.handle_event(_button(pygame.MOUSEBUTTONDOWN, 115, 115))
+        view.handle_event(key)
+        assert dispatcher.focused is lower and lower.events[-1] == pygame.KEYDOWN, "Key did not reach the focused component."
+        assert pygame.KEYDOWN not in panel.events + other.events, "Key was broadcast."
+        view.handle_event(_button(pygame.MOUSEBUTTONDOWN, 250, 250))
+        assert dispatcher.focused is None, "Click elsewhere did not clear the focus."
+        dispatcher.set_focus(other)
+        view.handle_event(key)
+        assert other.events[-1] == pygame.KEYDOWN, "set_focus() did not redirect keys."
+        log("Keyboard focus tests passed.", indent + "  ", verbose)
+
+        # A dragged slider keeps the pointer until the button is released
+        log("Testing pointer capture...", indent + "  ", verbose)
+        slider = Slider(0, 0, 100, pygame.Rect(20, 350, 100, 20))
+        view.add_child(slider)
+        view.handle_event(_button(pygame.MOUSEBUTTONDOWN, 30, 360, button=3))
+        assert dispatcher.captured is None, "A right click captured the pointer."
+        view.handle_event(_button(pygame.MOUSEBUTTONDOWN, 30, 360))
+        assert dispatcher.captured is slider and slider.dragging, "Slider did not capture the pointer."
+        view.handle_event(_motion(380, 120, (1, 0, 0)))
+        assert slider.current == 100 and upper.events[-1] != pygame.MOUSEMOTION, "Captured motion went elsewhere."
+        view.handle_event(_button(pygame.MOUSEBUTTONUP, 380, 120))
+        assert dispatcher.captured is None and not slider.dragging, "Button release did not end the capture."
+        view.handle_event(_motion(70, 360, (1, 0, 0)))
+        assert slider.current == 100, "Slider kept following the pointer after release."
+        view.handle_event(_button(pygame.MOUSEBUTTONDOWN, 30, 360))
+        view.remove_child(slider)
+        assert dispatcher.captured is None, "Removed component kept the pointer."
+        log("Pointer capture tests passed.", indent + "  ", verbose)
+
+        log("Event dispatch tests passed.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Event dispatch tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -0,0 +1,48 @@
+from src.core.fonts import FontManager, get_font_manager
+from src.core.style import Style
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_fonts(indent="", verbose=True) -> bool:
+    try:
+        log("Testing font manager...", indent, verbose)
+
+        log("Testing shared fonts...", indent + "  ", verbose)
+        manager = get_font_manager()
+        first = Style()
+        loads = manager.loads
+        styles = [Style(background=(i, i, i)) for i in range(200)]
+        assert manager.loads == loads, "Creating styles reloaded the font."
+        assert all(style.font is first.font for style in styles), "Styles do not share their font."
+        assert Style(font_size=12).font is not first.font and manager.loads == loads + 1, "Font sizes were not kept apart."
+        try:
+            Style(font_path="missing.ttf")
+            raise AssertionError("Missing font file did not raise.")
+        except FileNotFoundError:
+            pass
+        log("Shared font tests passed.", indent + "  ", verbose)
+
+        log("Testing the text cache...", indent + "  ", verbose)
+        manager = FontManager(text_cache_size=3)
+        font = manager.font(None, 20)
+        assert manager.font(None, 20) is font and manager.loads == 1, "FontManager.font() loaded twice."
+        label = manager.render(font, "440 Hz", True, (255, 255, 255))
+        assert manager.render(font, "440 Hz", True, [255, 255, 255]) is label, "Repeated text was rendered again."
+        assert manager.render(font, "440 Hz", True, (255, 0, 0)) is not label, "Text colour is not part of the key."
+        for text in ("a", "b", "c"):
+            manager.render(font, text, True, (255, 255, 255))
+        assert manager.render(font, "440 Hz", True, (255, 255, 255)) is not label, "Text cache ignored its size limit."
+        assert (manager.hits, manager.misses) == (1, 6), "Hit/miss counters are wrong."
+        assert manager.stats()["texts"] == 3, "FontManager.stats() failed."
+        log("Text cache tests passed.", indent + "  ", verbose)
+
+        log("Font manager tests passed.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Font manager tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
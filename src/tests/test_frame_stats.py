@@ -0,0 +1,76 @@
+import time
+import pygame
+from src.core.frame_stats import FrameStats
+from src.core.component import Component
+from src.core.view import View
+from src.core.style import Style
+from src.core.log import log
+import traceback as tb
+import sys
+
+class _Ticker(Component):
+    def __init__(self, view, frames):
+        super().__init__(pygame.Rect(0, 0, 10, 10), Style())
+        self.view = view
+        self.frames = frames
+        self.updates = 0
+
+    def update(self):
+        self.updates += 1
+        if self.updates >= self.frames:
+            self.view.running = False
+        self.mark_dirty()
+
+def test_frame_stats(indent="", verbose=True) -> bool:
+    try:
+        log("Testing frame pacing...", indent, verbose)
+
+        log("Testing FrameStats...", indent + "  ", verbose)
+        stats = FrameStats(target_fps=50, window=100)
+        for seconds in [0.01] * 90 + [0.03] * 10:
+            stats.record(seconds)
+        summary = stats.summary()
+        assert summary["frames"] == 100 and summary["dropped"] == 10, "Overrunning frames were not counted as dropped."
+        assert abs(summary["mean"] - 0.012) < 1e-9 and summary["p99"] == summary["max"] == 0.03, "Frame time statistics are wrong."
+        assert summary["p95"] > 0.01, "p95 missed the slow frames."
+        stats.reset()
+        assert stats.summary() == {"frames": 0, "dropped": 0, "mean": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}, "FrameStats.reset() failed."
+        log("FrameStats tests passed.", indent + "  ", verbose)
+
+        # The loop honours self.running and is paced to target_fps
+        log("Testing paced mainloop...", indent + "  ", verbose)
+        pygame.display.init()
+        view = View(pygame.display.set_mode((200, 100)))
+        view.target_fps = 100
+        ticker = _Ticker(view, 12)
+        view.add_child(ticker)
+        start = time.perf_counter()
+        view.mainloop(quit=False)
+        elapsed = time.perf_counter() - start
+        assert ticker.updates == 12, "mainloop ignored self.running."
+        assert elapsed >= 0.09, "mainloop was not paced to target_fps."
+        assert view.stats.frames == 12, "Frame timings were not recorded."
+        log("Paced mainloop tests passed.", indent + "  ", verbose)
+
+        # With nothing to repaint the loop sleeps in event.wait until an event arrives
+        log("Testing idle wait...", indent + "  ", verbose)
+        view = View(pygame.display.get_surface())
+        view.target_fps = 0  # Unpaced: only the idle wait can keep the CPU free
+        pygame.time.set_timer(pygame.QUIT, 300, 1)
+        start, cpu = time.perf_counter(), time.process_time()
+        view.mainloop(quit=False)
+        elapsed, cpu = time.perf_counter() - start, time.process_time() - cpu
+        assert elapsed >= 0.25, "Idle loop exited before the quit event."
+        assert cpu < 0.5 * elapsed, "Idle loop kept the CPU busy."
+        assert view.stats.frames == 1, "Idle wake-ups were recorded as frames."
+        log("Idle wait tests passed.", indent + "  ", verbose)
+
+        log("Frame pacing tests passed.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Frame pacing tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
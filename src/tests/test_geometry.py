@@ -1,5 +1,6 @@
 from src.core.log import log
 from src.core.geometry import *
+import math
 import pygame
 import traceback as tb
 import sys
@@ -22,6 +23,22 @@ def test_geometry(indent="", verbose=True) -> bool:
         assert v3d.length() == 3.0, "3D Vector length calculation failed."
         log("Vector tests passed.", indent + "  ", verbose)
 
+        # Test VectorArray
+        log("Testing VectorArray...", indent + "  ", verbose)
+        points = VectorArray.from_vectors([Vector(3, 4), Vector(6, 8), Vector(0, 1)])
+        assert np.allclose(points.length(), [5, 10, 1]), "VectorArray length calculation failed."
+        moved = points + Vector(1, 1)
+        assert isinstance(moved, VectorArray) and moved[0].coords == (4.0, 5.0), "VectorArray + Vector failed."
+        assert (Vector(1, 1) - points)[2].coords == (1.0, 0.0), "Vector - VectorArray failed."
+        assert np.allclose((moved - points).data, 1), "VectorArray - VectorArray failed."
+        solid = VectorArray([[1, 2, 2], [0, 0, 3]])
+        assert np.allclose(solid.length(), [3, 3]) and solid.project_to_2d().dims == 2, "3D VectorArray failed."
+        view = points[1:]
+        view += Vector(10, 10)
+        assert points[1].coords == (16.0, 18.0), "VectorArray slices are not views."
+        assert [v.coords for v in points[:1]] == [(3.0, 4.0)], "VectorArray iteration failed."
+        log("VectorArray tests passed.", indent + "  ", verbose)
+
         # Test Triangle
         log("Testing Triangle...", indent + "  ", verbose)
         tri = Triangle(Vector(0, 0), Vector(10, 0), Vector(5, 5))
@@ -56,6 +73,57 @@ def test_geometry(indent="", verbose=True) -> bool:
         assert not rect3d.contains(11, 1, 0), "Rect3D.contains() failed for outside point."
         log("Shape3D contains() tests passed.", indent + "  ", verbose)
 
+        # Test contains_many against the scalar path
+        log("Testing contains_many...", indent + "  ", verbose)
+        rng = np.random.default_rng(0)
+        flat = rng.uniform(-12, 12, (2000, 2))
+        solid = np.column_stack([flat, rng.uniform(-1, 1, 2000)])
+        shapes = [rect, ellipse, tri, Rect3D(Vector(-2, -3, 0), Vector(6, 4)),
+                  Ellipse3D(Vector(1, 1, 0), Vector(4, 0, 1), Vector(0, 2, 1)),
+                  Triangle3D(Vector(-5, 0, 0), Vector(5, -5, 1), Vector(0, 8, 2))]
+        for shape in shapes:
+            points = solid if isinstance(shape, Shape3D) else flat
+            expected = [shape.contains(*p) for p in points]
+            assert np.array_equal(shape.contains_many(points), expected), f"{type(shape).__name__}.contains_many() failed."
+        assert tri.contains_many(VectorArray(flat)).sum() > 0, "contains_many() rejected a VectorArray."
+        ellipse.radii_x = Vector(1, 0)
+        assert not ellipse.contains_many([Vector(3, 1)])[0], "Cached ellipse radii were not refreshed."
+        log("contains_many tests passed.", indent + "  ", verbose)
+
+        # Test Transform
+        log("Testing Transform...", indent + "  ", verbose)
+        turn = Transform.rotation(math.pi / 2)
+        move = Transform.translation(10, 0, 0)
+        composed = move @ turn
+        assert np.allclose(composed.apply(Vector(1, 0, 0)).coords, (10, 1, 0)), "Transform composition failed."
+        assert composed.inverse is composed.inverse and composed.inverse.inverse is composed, "Transform inverse is not cached."
+        assert np.allclose((composed.inverse @ composed).matrix, np.eye(4)), "Transform inverse failed."
+        batch = rng.uniform(-5, 5, (100, 3))
+        assert np.allclose(turn.apply(batch), [turn.apply(Vector(*p)).coords for p in batch]), "Batched transform failed."
+        assert np.allclose(Transform.of(np.eye(3) * 2).apply([[1, 2]]), [[2, 4, 0]]), "2D points were not padded."
+        log("Transform tests passed.", indent + "  ", verbose)
+
+        # Transformed shapes test the query point in their own coordinates
+        log("Testing transformed shapes...", indent + "  ", verbose)
+        for shape in shapes[3:]:
+            plain = [shape.contains(*p) for p in solid]
+            shape.rotation_matrix = Transform.rotation(0.7).matrix[:3, :3]
+            shape.translation_vector = Vector(3, -2, 0)
+            world = shape.transform.apply(solid)
+            assert [shape.contains(*p) for p in world] == plain, f"Transformed {type(shape).__name__}.contains() failed."
+            assert np.array_equal(shape.contains_many(world), plain), f"Transformed {type(shape).__name__}.contains_many() failed."
+            assert np.array_equal(shape.contains_many(solid, mat=shape.transform), plain), "mat argument was not applied."
+            inside = world[np.array(plain)]
+            assert shape.bounds().contains_many(inside).all(), f"Transformed {type(shape).__name__}.bounds() failed."
+            shape.translation_vector = None
+            assert np.allclose(shape.transform.matrix[:3, 3], 0), "Transform was not invalidated."
+        skewed = Ellipse3D(Vector(0, 0, 0), Vector(3, 4), Vector(0, 1))
+        inside = solid[skewed.contains_many(solid)]
+        box = skewed.box()
+        assert ((inside[:, :2] >= box[:2]) & (inside[:, :2] <= box[3:5])).all(), "Ellipse3D box misses contained points."
+        assert skewed.bounds().contains_many(inside[:, :2]).all(), "Ellipse3D.bounds() misses contained points."
+        log("Transformed shape tests passed.", indent + "  ", verbose)
+
         # Test Shape3D transformations (basic translation)
         log("Testing Shape3D transformations...", indent + "  ", verbose)
         shape3d = Ellipse3D(Vector(0, 0, 0), Vector(5, 0), Vector(0, 3))
@@ -0,0 +1,91 @@
+import tracemalloc
+import numpy as np
+from scipy.signal import butter, sosfilt
+from src.core.graph import Graph, SourceNode, ResampleNode, GainNode, FilterNode, MixNode, SinkNode
+from src.core.resample import Resampler
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_graph(indent="", verbose=True) -> bool:
+    try:
+        log("Testing audio graph...", indent, verbose)
+        rng = np.random.default_rng(0)
+        source = rng.uniform(-1, 1, (5000, 2)).astype(np.float32)
+
+        # source -> gain -> sink matches the resampler scaled by the gain
+        log("Testing chains and mixing...", indent + "  ", verbose)
+        graph = Graph(blocksize=256)
+        reader = ResampleNode(source, speed=0.75)
+        sink = graph.chain(reader, GainNode(0.5), SinkNode())
+        reference = Resampler("linear", 2, 256)
+        for _ in range(3):
+            assert np.allclose(graph.render(), 0.5 * reference.process(source, 0.75, 256)), "Gain chain output is wrong."
+
+        # A second source mixed in with its own gain
+        order = graph.order
+        mix = MixNode()
+        graph.remove(sink)
+        graph.connect(graph.nodes[1], mix)
+        constant = SourceNode(lambda frames: np.ones((frames, 1), dtype=np.float32))
+        graph.connect(constant, mix)
+        mix.set_gain(constant, 0.25)
+        graph.chain(mix, SinkNode())
+        assert graph.order is None, "Graph edit did not invalidate the evaluation order."
+        out = graph.render().copy()
+        assert graph.order is not order, "Evaluation order was not rebuilt."
+        assert np.allclose(out, 0.5 * reference.process(source, 0.75, 256) + 0.25), "Mix node output is wrong."
+        graph.remove(constant)
+        assert constant not in mix.gains, "Removed node kept its mix gain."
+        log("Chain and mixing tests passed.", indent + "  ", verbose)
+
+        # Filter state carries across blocks
+        log("Testing persistent filter state...", indent + "  ", verbose)
+        sos = butter(4, 0.1, output="sos")
+        graph = Graph(blocksize=100)
+        position = {"start": 0}
+        def producer(frames):
+            block = source[position["start"]:position["start"] + frames]
+            position["start"] += frames
+            return block
+        graph.chain(SourceNode(producer), FilterNode(sos), SinkNode())
+        blocks = np.concatenate([graph.render().copy() for _ in range(20)])
+        assert np.allclose(blocks, sosfilt(sos, source[:2000], axis=0), atol=1e-5), "Filter state was lost between blocks."
+        log("Filter state tests passed.", indent + "  ", verbose)
+
+        # Cycles are rejected
+        graph = Graph()
+        a, b = GainNode(), GainNode()
+        graph.connect(a, b)
+        graph.connect(b, a)
+        try:
+            graph.render()
+            assert False, "Cycle was not detected."
+        except ValueError:
+            pass
+
+        # Steady-state blocks allocate no audio-sized buffers
+        log("Testing steady-state allocations...", indent + "  ", verbose)
+        graph = Graph(blocksize=4096)
+        mix = MixNode()
+        for speed in (0.5, 1.0, 1.5):
+            graph.chain(ResampleNode(source, speed), GainNode(0.3), mix)
+        graph.chain(mix, SinkNode())
+        graph.render()
+        tracemalloc.start()
+        for _ in range(10):
+            graph.render()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert peak < 4096 * 2 * 4, f"Steady-state processing allocated {peak} bytes."
+        log("Allocation tests passed.", indent + "  ", verbose)
+
+        log("All audio graph tests passed successfully.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Audio graph tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
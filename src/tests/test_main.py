@@ -6,6 +6,24 @@ from src.tests.test_style import test_style
 from src.tests.test_camera import test_camera
 from src.tests.test_geometry import test_geometry
 from src.tests.test_view import test_view
+from src.tests.test_playback import test_playback
+from src.tests.test_mixer import test_mixer
+from src.tests.test_resample import test_resample
+from src.tests.test_source import test_source
+from src.tests.test_pcm_cache import test_pcm_cache
+from src.tests.test_sample_bank import test_sample_bank
+from src.tests.test_engine import test_engine
+from src.tests.test_render import test_render
+from src.tests.test_graph import test_graph
+from src.tests.test_spatial import test_spatial
+from src.tests.test_culling import test_culling
+from src.tests.test_raster import test_raster
+from src.tests.test_colors import test_colors
+from src.tests.test_spectrum import test_spectrum
+from src.tests.test_redraw import test_redraw
+from src.tests.test_frame_stats import test_frame_stats
+from src.tests.test_fonts import test_fonts
+from src.tests.test_events import test_events
 
 def test_main(indent=""):
   log("Testing main", indent, True)
@@ -16,6 +34,24 @@ def test_main(indent=""):
     "camera": (test_camera, True),
     "geometry": (test_geometry, True),
     "view": (test_view, True),
+    "playback": (test_playback, True),
+    "mixer": (test_mixer, True),
+    "resample": (test_resample, True),
+    "source": (test_source, True),
+    "pcm cache": (test_pcm_cache, True),
+    "sample bank": (test_sample_bank, True),
+    "engine": (test_engine, True),
+    "render": (test_render, True),
+    "graph": (test_graph, True),
+    "spatial": (test_spatial, True),
+    "culling": (test_culling, True),
+    "raster": (test_raster, True),
+    "colors": (test_colors, True),
+    "spectrum": (test_spectrum, True),
+    "redraw": (test_redraw, True),
+    "frame stats": (test_frame_stats, True),
+    "fonts": (test_fonts, True),
+    "events": (test_events, True),
   }
   print(f"{len(tests)}")
   results = {}
@@ -0,0 +1,72 @@
+import numpy as np
+from src.core.mixer import Mixer, Voice
+from src.core.playback import FakeOutputStream
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_mixer(indent="", verbose=True) -> bool:
+    try:
+        log("Testing Mixer...", indent, verbose)
+        mixer = Mixer(44100, channels=2, blocksize=32, stream_factory=FakeOutputStream)
+
+        def constant(value):
+            return lambda frames: np.full((frames, 1), value, dtype=np.float32)
+
+        # Centred voices pass through at unity gain and sum
+        log("Testing voice summing and pan...", indent + "  ", verbose)
+        a = mixer.add_voice(constant(0.25))
+        b = mixer.add_voice(constant(0.5), gain=2.0)
+        block = mixer.render(32)
+        assert np.allclose(block, 1.25), "Mixer did not sum centred voices."
+        b.set_gain_pan(pan=-1.0)
+        block = mixer.render(32)
+        assert np.allclose(block[:, 0], 0.25 + 2.0 * np.sqrt(2) * 0.5), "Hard-left pan failed on left channel."
+        assert np.allclose(block[:, 1], 0.25), "Hard-left pan leaked into right channel."
+        log("Voice summing and pan tests passed.", indent + "  ", verbose)
+
+        # Voices are mapped onto however many channels the mixer has
+        log("Testing channel mapping...", indent + "  ", verbose)
+        surround = Mixer(44100, channels=4, blocksize=32, offline=True)
+        surround.add_voice(constant(1.0), gain=0.5)
+        assert np.allclose(surround.render(32), 0.5), "Voice gain was not applied beyond the panned channels."
+        mono = Mixer(44100, channels=1, blocksize=32, offline=True)
+        stereo = np.tile(np.array([[0.2, 0.6]], dtype=np.float32), (16, 1))
+        mono.add_voice(lambda frames: stereo, gain=2.0, pan=-1.0)
+        block = mono.render(32)
+        assert np.allclose(block[:16], 0.8) and np.allclose(block[16:], 0), "Stereo voice was not down-mixed to mono."
+        log("Channel mapping tests passed.", indent + "  ", verbose)
+
+        # Swap-remove keeps slot indices consistent
+        log("Testing O(1) voice removal...", indent + "  ", verbose)
+        voices = [mixer.add_voice(constant(1.0)) for _ in range(40)]
+        mixer.remove_voice(a)
+        mixer.remove_voice(voices[10])
+        mixer.remove_voice(voices[10])  # Removing twice is harmless
+        assert len(mixer.voices) == 40, "Voice removal miscounted."
+        assert all(v.index == i for i, v in enumerate(mixer.voices)), "Voice slots are inconsistent."
+        assert a.index is None and voices[10].index is None, "Removed voices kept their slot."
+        log("Voice removal tests passed.", indent + "  ", verbose)
+
+        # Voices that return None are dropped after their last block
+        log("Testing finished voices...", indent + "  ", verbose)
+        finished = mixer.add_voice(lambda frames: None)
+        mixer.render(32)
+        assert finished.index is None, "Finished voice was not unregistered."
+
+        # Output flows through the shared stream
+        mixer.start()
+        mixer.engine.stream.pump(1)
+        mixer.close()
+        assert mixer.engine.underruns == 0, "Mixer underran on its first block."
+        log("Finished voice tests passed.", indent + "  ", verbose)
+
+        log("All Mixer tests passed successfully.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Mixer tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -0,0 +1,59 @@
+import numpy as np
+import soundfile as sf
+import tempfile
+import time
+from pathlib import Path
+from src.core.pcm_cache import PCMCache
+from src.core.sound import Sound
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_pcm_cache(indent="", verbose=True) -> bool:
+    try:
+        log("Testing PCMCache...", indent, verbose)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PCMCache(Path(directory) / "pcm", max_bytes=1 << 20)
+            source = Path("audio") / "short.mp3"
+            decoded, rate = sf.read(source, dtype="float32", always_2d=True)
+
+            # A cold load transcodes, a warm load maps the same file read-only
+            log("Testing cold and warm loads...", indent + "  ", verbose)
+            cold, cold_rate = cache.load(source)
+            warm, warm_rate = cache.load(source)
+            assert cache.misses == 1 and cache.hits == 1, "Second load did not hit the cache."
+            assert isinstance(warm, np.memmap) and not warm.flags.writeable, "Cache did not serve a read-only memmap."
+            assert cold_rate == warm_rate == rate, "Cached sample rate is wrong."
+            assert np.array_equal(warm, decoded), "Cached PCM differs from the decoded file."
+            log("Cold and warm load tests passed.", indent + "  ", verbose)
+
+            # A target rate is part of the key and resamples once
+            log("Testing target rate and eviction...", indent + "  ", verbose)
+            half, half_rate = cache.load(source, samplerate=rate // 2)
+            assert half_rate == rate // 2 and abs(len(half) - len(decoded) // 2) <= 1, "Resampled entry is wrong."
+            assert cache.misses == 2, "Target rate was not part of the cache key."
+
+            # Exceeding the budget evicts the least recently used entry, never the new one
+            wav = Path(directory) / "tone.flac"
+            sf.write(wav, np.zeros((200000, 1), dtype=np.float32), 44100)
+            time.sleep(0.01)
+            cache.load(wav)
+            assert cache.size() <= cache.max_bytes, "Cache exceeded its size budget."
+            assert (cache.directory / f"{cache.key(wav)}.f32").exists(), "Newest entry was evicted."
+            assert np.array_equal(warm, decoded), "Eviction broke a memmap that was still in use."
+            log("Target rate and eviction tests passed.", indent + "  ", verbose)
+
+            # Sounds built from the same compressed file share the mapped file
+            sound = Sound(source, cache=cache)
+            assert isinstance(sound.audio_data, np.memmap), "Sound did not load through the cache."
+            sound.close()
+
+        log("All PCMCache tests passed successfully.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"PCMCache tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
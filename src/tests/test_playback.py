@@ -0,0 +1,96 @@
+import numpy as np
+from src.core.playback import RingBuffer, PlaybackEngine, FakeOutputStream
+from src.core.sound import Sound
+from src.core.mixer import Mixer
+from src.core.log import log
+from pathlib import Path
+import traceback as tb
+import sys
+
+def test_playback(indent="", verbose=True) -> bool:
+    try:
+        log("Testing playback engine...", indent, verbose)
+
+        # RingBuffer wraps around and never overwrites unread frames
+        log("Testing RingBuffer...", indent + "  ", verbose)
+        ring = RingBuffer(8, 1)
+        assert ring.write(np.arange(6).reshape(-1, 1)) == 6, "RingBuffer.write() failed."
+        out = np.zeros((4, 1))
+        assert ring.read_into(out) == 4 and out[:, 0].tolist() == [0, 1, 2, 3], "RingBuffer.read_into() failed."
+        assert ring.write(np.arange(6, 12).reshape(-1, 1)) == 6, "RingBuffer wrap-around write failed."
+        assert ring.free() == 0, "RingBuffer overfilled."
+        out = np.zeros((10, 1))
+        assert ring.read_into(out) == 8 and out[:8, 0].tolist() == list(range(4, 12)), "RingBuffer wrap-around read failed."
+        log("RingBuffer tests passed.", indent + "  ", verbose)
+
+        # A counting producer lets us check continuity of the delivered stream
+        log("Testing PlaybackEngine with a fake stream...", indent + "  ", verbose)
+        state = {"next": 0}
+        def producer(frames):
+            block = np.arange(state["next"], state["next"] + frames, dtype=np.float32)
+            state["next"] += frames
+            return np.stack([block, -block], axis=1)
+
+        engine = PlaybackEngine(producer, 44100, 2, blocksize=64, buffer_blocks=4, stream_factory=FakeOutputStream)
+        engine.start()
+        engine.stream.pump(4)  # Exactly the prefilled amount, independent of producer thread timing
+        engine.stop()
+        delivered = engine.stream.frames()
+        assert delivered.shape == (256, 2), "Fake stream recorded the wrong shape."
+        assert np.array_equal(delivered[:, 0], np.arange(256)), "Frames were dropped or reordered."
+        assert np.array_equal(delivered[:, 1], -np.arange(256)), "Channel layout was not preserved."
+        assert engine.underruns == 0, "Unexpected underrun with a full buffer."
+
+        # With the producer stopped the callback must zero-fill and count underruns
+        engine.ring.read_into(np.zeros((engine.ring.capacity, 2), dtype=np.float32))
+        engine.stream.pump(2)
+        assert engine.underruns == 2, "Underruns were not reported."
+        assert not engine.stream.frames()[-128:].any(), "Underrun blocks were not silenced."
+        stats = engine.stats()
+        assert stats["callbacks"] == 6 and stats["frames_delivered"] == 384, "PlaybackEngine.stats() failed."
+        engine.close()
+        assert engine.stream is None, "PlaybackEngine.close() failed."
+        log("PlaybackEngine tests passed.", indent + "  ", verbose)
+
+        # Sound plays through the engine without touching a real device
+        log("Testing Sound playback on a fake stream...", indent + "  ", verbose)
+        mixer = Mixer(44100, channels=1, stream_factory=FakeOutputStream)
+        sound = Sound(Path("audio") / "short.mp3", mixer=mixer)
+        sound.play()
+        stream = mixer.engine.stream
+        stream.pump(2)
+        sound.close()
+        assert mixer.engine.stream is None, "Sound.close() did not release the idle output stream."
+        delivered = stream.frames()
+        assert delivered.shape == (2 * sound.chunk_size, 1), "Sound playback delivered the wrong shape."
+        assert np.allclose(delivered[:sound.chunk_size], sound.audio_data[:sound.chunk_size]), "Sound playback delivered the wrong frames."
+        log("Sound playback tests passed.", indent + "  ", verbose)
+
+        # close() gives back the stream, the decoder file and the read-ahead thread
+        log("Testing Sound.close...", indent + "  ", verbose)
+        mixer = Mixer(44100, channels=1, stream_factory=FakeOutputStream)
+        streamed = Sound(Path("audio") / "short.mp3", mixer=mixer, streaming=True)
+        other = Sound(Path("audio") / "short.mp3", mixer=mixer)
+        streamed.play()
+        other.play()
+        mixer.engine.stream.pump(1)
+        streamed.close()
+        assert streamed.voice is None and mixer.engine.stream is not None, "Closing one Sound released a shared stream."
+        assert streamed.audio_data.file.closed and not streamed.audio_data._thread.is_alive(), \
+            "Sound.close() did not close its streaming source."
+        other.close()
+        assert mixer.engine.stream is None, "Closing the last Sound kept the output stream open."
+        other.play()
+        assert mixer.engine.stream is not None, "play() after close() did not reopen the stream."
+        other.close()
+        log("Sound.close tests passed.", indent + "  ", verbose)
+
+        log("All playback tests passed successfully.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Playback tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -0,0 +1,64 @@
+import math
+import numpy as np
+import pygame
+from src.core.geometry import Vector, Rect, Ellipse, Triangle, Ellipse3D, Triangle3D, Transform
+from src.core.raster import coverage, fill, region
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_raster(indent="", verbose=True) -> bool:
+    try:
+        log("Testing rasterization...", indent, verbose)
+        size = (64, 48)
+        columns, rows = np.meshgrid(np.arange(size[0]) + 0.5, np.arange(size[1]) + 0.5)
+        centers = np.column_stack([columns.ravel(), rows.ravel()])
+        shapes = [Rect(Vector(3.2, 4.7), Vector(20.5, 11.1)), Ellipse(Vector(30, 20), Vector(15, 0), Vector(0, 9)),
+                  Triangle(Vector(-5, 40), Vector(50, 2), Vector(60, 47)),
+                  Triangle3D(Vector(10, 10, 1), Vector(40, 12, 5), Vector(20, 44, -3)),
+                  Ellipse3D(Vector(50, 40, 0), Vector(20, 0, 2), Vector(0, 6, 2))]
+
+        # Without antialiasing a pixel is covered exactly when its center is inside
+        log("Testing coverage masks...", indent + "  ", verbose)
+        for shape in shapes:
+            expected = shape.contains_many(centers).reshape(size[1], size[0])
+            assert np.array_equal(coverage(shape, size) == 1, expected), f"{type(shape).__name__} mask failed."
+        assert region(Rect(Vector(100, 100), Vector(5, 5)), *size) is None, "Off-canvas shape was rasterized."
+        union = coverage(shapes[:2], size)
+        assert np.array_equal(union, np.maximum(coverage(shapes[0], size), coverage(shapes[1], size))), "Union failed."
+        log("Coverage mask tests passed.", indent + "  ", verbose)
+
+        # Antialiased coverage integrates to the shape's area
+        log("Testing antialiasing...", indent + "  ", verbose)
+        rect = coverage(shapes[0], size, antialias=True)
+        assert math.isclose(rect.sum(), 20.5 * 11.1, rel_tol=1e-5), "Rect coverage area is wrong."
+        assert rect[rect > 0].min() < 1, "Rect edges were not antialiased."
+        ellipse = coverage(shapes[1], size, antialias=True, samples=8)
+        assert math.isclose(ellipse.sum(), math.pi * 15 * 9, rel_tol=0.01), "Ellipse coverage area is wrong."
+        tilted = Triangle3D(Vector(0, 0, 0), Vector(20, 0, 0), Vector(0, 20, 0))
+        tilted.translation_vector = Vector(20, 10, 0)
+        assert math.isclose(coverage(tilted, size, antialias=True, samples=8).sum(), 200, rel_tol=0.01), "Transformed shape area is wrong."
+        log("Antialiasing tests passed.", indent + "  ", verbose)
+
+        # Painting onto surfaces
+        log("Testing surface fills...", indent + "  ", verbose)
+        surface = pygame.Surface(size)
+        surface.fill((0, 0, 0))
+        fill(surface, shapes[1], (255, 128, 0))
+        painted = pygame.surfarray.array3d(surface).transpose(1, 0, 2)
+        assert np.array_equal(painted[..., 0] == 255, coverage(shapes[1], size) == 1), "Surface fill failed."
+        surface.fill((0, 0, 0))
+        fill(surface, [shapes[0]], (200, 200, 200), antialias=True)
+        red = pygame.surfarray.array3d(surface)[..., 0].T
+        assert np.allclose(red, np.rint(200 * rect), atol=1), "Antialiased surface fill failed."
+        log("Surface fill tests passed.", indent + "  ", verbose)
+
+        log("Rasterization tests passed.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Rasterization tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
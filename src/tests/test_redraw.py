@@ -0,0 +1,145 @@
+import threading
+import pygame
+from src.core.view import View
+from src.core.slider import Slider
+from src.core.button import Button
+from src.core.style import Style
+from src.core.log import log
+import traceback as tb
+import sys
+
+class _Backdrop:
+    """A child without a rect: never culled, painted under everything added after it."""
+    def draw(self, surface):
+        surface.fill((0, 0, 255))
+
+def _scene(canvas):
+    view = View(canvas)
+    style = Style(background=(60, 60, 200), foreground=(240, 240, 240))
+    slider = Slider(200, 0, 1000, pygame.Rect(40, 40, 200, 20), style)
+    button = Button(pygame.Rect(300, 200, 80, 40), Style(background=(200, 60, 60), text=(0, 0, 0),
+                                                        font=pygame.font.Font(None, 20)), "Go")
+    view.add_child(slider)
+    view.add_child(button)
+    return view, slider, button
+
+def test_redraw(indent="", verbose=True) -> bool:
+    try:
+        log("Testing dirty-rect redraw...", indent, verbose)
+        pygame.font.init()
+
+        log("Testing idle and partial frames...", indent + "  ", verbose)
+        canvas = pygame.Surface((400, 300))
+        view, slider, button = _scene(canvas)
+        assert view.draw() == [canvas.get_rect()], "First frame was not a full redraw."
+        assert view.draw() == [], "Idle frame repainted something."
+        canvas.set_at((390, 290), (1, 2, 3))  # Outside every child: must survive partial frames
+        slider.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(100, 50), button=1))
+        slider.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(60, 50), buttons=(1, 0, 0), rel=(0, 0)))
+        rects = view.draw()
+        assert rects == [slider.rect.inflate(slider.rect.height, 0)], "Slider change repainted the wrong area."
+        assert canvas.get_at((390, 290))[:3] == (1, 2, 3), "Partial frame touched pixels outside the dirty rect."
+        log("Idle and partial frame tests passed.", indent + "  ", verbose)
+
+        # Partial frames end up identical to repainting everything
+        log("Testing partial frames against full redraws...", indent + "  ", verbose)
+        slider.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(60, 50), button=1))
+        button.set_rect(250, 30, 80, 40)  # Overlaps the slider; old and new areas are repainted
+        view.draw()
+        reference = pygame.Surface((400, 300))
+        other, other_slider, other_button = _scene(reference)
+        other_slider.current, other_button.rect = slider.current, button.rect
+        other.draw()
+        canvas.set_at((390, 290), (0, 0, 0))
+        assert pygame.image.tobytes(canvas, "RGB") == pygame.image.tobytes(reference, "RGB"), \
+            "Partial redraws diverged from a full redraw."
+        view.remove_child(button)
+        assert view.draw() == [pygame.Rect(250, 30, 80, 40)] and canvas.get_at((300, 60))[:3] == (0, 0, 0), \
+            "Removed child was not erased."
+        log("Consistency tests passed.", indent + "  ", verbose)
+
+        # Children without bounds are repainted inside every dirty rect, in stacking order
+        log("Testing unbounded children...", indent + "  ", verbose)
+        canvas = pygame.Surface((400, 300))
+        view = View(canvas)
+        view.add_child(_Backdrop())
+        slider = Slider(200, 0, 1000, pygame.Rect(20, 40, 100, 20), Style(background=(60, 60, 200)))
+        view.add_child(slider)
+        view.draw()
+        assert canvas.get_at((12, 45))[:3] == (0, 0, 255), "Unbounded child was not drawn."
+        slider.update_value(100)
+        assert view.draw() == [pygame.Rect(10, 40, 120, 20)], "Slider change repainted the wrong area."
+        assert canvas.get_at((12, 45))[:3] == (0, 0, 255), "Partial redraw erased an unbounded child."
+        assert canvas.get_at((30, 50))[:3] == (60, 60, 200), "Unbounded child was drawn over a later child."
+        log("Unbounded child tests passed.", indent + "  ", verbose)
+
+        log("Testing rect merging...", indent + "  ", verbose)
+        bounds = pygame.Rect(0, 0, 400, 300)
+        merged = View._merge([pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10), pygame.Rect(100, 100, 5, 5),
+                              pygame.Rect(390, 290, 50, 50)], bounds)
+        assert merged == [pygame.Rect(0, 0, 15, 15), pygame.Rect(100, 100, 5, 5), pygame.Rect(390, 290, 10, 10)], \
+            "Overlapping dirty rects were not merged."
+        assert View._merge([pygame.Rect(0, 0, 300, 250)], bounds) == [bounds], "Large damage did not become a full redraw."
+        assert View._merge([pygame.Rect(0, 0, 10, 10), pygame.Rect(20, 0, 10, 10)], bounds) == [pygame.Rect(0, 0, 30, 10)], \
+            "Nearby dirty rects were not coalesced."
+        scattered = [pygame.Rect(x, y, 2, 2) for x in range(0, 400, 40) for y in range(0, 300, 60)]
+        assert View._merge(scattered, bounds) == [bounds], "Many scattered rects did not become a full redraw."
+        log("Rect merging tests passed.", indent + "  ", verbose)
+
+        # Damage reported from another thread while frames are drawn is never lost
+        log("Testing invalidate() from another thread...", indent + "  ", verbose)
+        view = View(pygame.Surface((400, 300)))
+        view.draw()
+        damaged = [pygame.Rect(x % 400, x // 400 * 2, 1, 1) for x in range(0, 20000, 7)]
+        worker = threading.Thread(target=lambda: [view.invalidate(rect) for rect in damaged])
+        painted = []
+        worker.start()
+        while worker.is_alive():
+            painted += view.draw()
+        worker.join()
+        painted += view.draw()
+        assert all(rect.collidelist(painted) != -1 for rect in damaged), "Damage from another thread was lost."
+        log("Threaded invalidate tests passed.", indent + "  ", verbose)
+
+        # Components blit an off-screen rendering until their appearance key changes
+        log("Testing cached appearances...", indent + "  ", verbose)
+        canvas = pygame.Surface((400, 300))
+        view, slider, button = _scene(canvas)
+        view.draw()
+        cached = button._cache
+        button.draw(canvas)
+        assert button._cache is cached, "Unchanged button was rendered again."
+        direct = pygame.Surface((400, 300))
+        button.draw_appearance(direct, button.rect)
+        assert pygame.image.tobytes(canvas.subsurface(button.rect), "RGB") == \
+            pygame.image.tobytes(direct.subsurface(button.rect), "RGB"), "Cached button differs from a direct draw."
+        button.set_text("Stop")
+        assert view.draw() == [button.rect] and button._cache is not cached, "Text change did not re-render the button."
+        button.style.colors["background"] = (10, 200, 10)
+        button.mark_dirty()
+        view.draw()
+        assert canvas.get_at(button.rect.topleft)[:3] == (10, 200, 10), "Colour change did not re-render the button."
+
+        cached = slider._cache
+        slider.current += 1  # Less than a pixel of handle movement
+        slider.draw(canvas)
+        assert slider._cache is cached, "Sub-pixel slider change was rendered again."
+        canvas.fill((9, 9, 9))
+        slider.current = slider.max_val
+        slider.draw(canvas)
+        assert slider._cache is not cached, "Slider move did not re-render."
+        left = slider.appearance_rect().left
+        assert canvas.get_at((left, slider.rect.y))[:3] == (9, 9, 9), "Slider overhang is not transparent."
+        assert canvas.get_at((slider.rect.right + 2, slider.rect.y))[:3] == tuple(slider.style.colors["foreground"]), \
+            "Slider handle overhang was not drawn."
+        log("Cached appearance tests passed.", indent + "  ", verbose)
+
+        log("Dirty-rect redraw tests passed.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Dirty-rect redraw tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -0,0 +1,59 @@
+import numpy as np
+import soundfile as sf
+import tempfile
+from pathlib import Path
+from src.core.render import render_to_file
+from src.core.mixer import Mixer
+from src.core.sound import Sound
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_render(indent="", verbose=True) -> bool:
+    try:
+        log("Testing offline rendering...", indent, verbose)
+        source = Path("audio") / "short.mp3"
+        with tempfile.TemporaryDirectory() as directory:
+            # A Sound renders exactly the chunks it would have played
+            log("Testing Sound.render_to_file...", indent + "  ", verbose)
+            reference = Sound(source, speed=0.7)
+            expected = np.concatenate([reference._generate_chunk(1000).copy() for _ in range(5)])
+            path = Path(directory) / "sound.wav"
+            report = Sound(source, speed=0.7).render_to_file(path, frames=4500, blocksize=1000, subtype="FLOAT")
+            rendered, rate = sf.read(path, dtype="float32", always_2d=True)
+            assert report["frames"] == 4500 and len(rendered) == 4500, "Wrong number of frames rendered."
+            assert rate == reference.sample_rate, "Rendered file has the wrong sample rate."
+            assert np.allclose(rendered, expected[:4500]), "Rendered audio differs from live chunks."
+            assert report["seconds"] == 4500 / reference.sample_rate, "Render report has the wrong duration."
+            # Speed depends on the machine, so it is reported rather than checked
+            log(f"Rendered at {report['realtime_factor']:.0f}x real time.", indent + "    ", verbose)
+            log("Sound.render_to_file tests passed.", indent + "  ", verbose)
+
+            # An offline mixer never opens a stream and renders its voices to FLAC
+            log("Testing offline Mixer rendering...", indent + "  ", verbose)
+            mixer = Mixer(44100, channels=2, offline=True)
+            left, right = Sound(source, mixer=mixer, pan=-1.0), Sound(source, mixer=mixer, pan=1.0, speed=0.5)
+            left.play()
+            right.play()
+            assert mixer.engine.stream is None, "Offline mixer opened a stream."
+            report = mixer.render_to_file(Path(directory) / "mix.flac", seconds=1.0)
+            rendered, _ = sf.read(Path(directory) / "mix.flac", always_2d=True)
+            assert rendered.shape == (44100, 2) and report["seconds"] == 1.0, "Mixer render has the wrong shape."
+            assert np.abs(rendered).max() > 0, "Mixer render is silent."
+            left.close()
+            right.close()
+
+            # Producers that finish end the render early
+            report = render_to_file(lambda frames: None, Path(directory) / "empty.wav", seconds=1.0, channels=1)
+            assert report["frames"] == 0, "Finished producer did not stop the render."
+            log("Offline Mixer tests passed.", indent + "  ", verbose)
+
+        log("All offline rendering tests passed successfully.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Offline rendering tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -0,0 +1,67 @@
+import numpy as np
+from src.core.resample import Resampler, QUALITIES
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_resample(indent="", verbose=True) -> bool:
+    try:
+        log("Testing Resampler...", indent, verbose)
+        source = np.sin(np.arange(1000) * 0.05).astype(np.float32).reshape(-1, 1)
+
+        # At unit speed and integer phase every quality reproduces the source
+        log("Testing identity at unit speed...", indent + "  ", verbose)
+        for quality in QUALITIES:
+            out = Resampler(quality).process(source, 1.0, 200)
+            assert np.allclose(out, source[:200], atol=1e-5), f"{quality} resampling is not transparent at speed 1."
+        log("Identity tests passed.", indent + "  ", verbose)
+
+        # Fractional phase survives chunk boundaries
+        log("Testing phase continuity...", indent + "  ", verbose)
+        for quality in QUALITIES:
+            whole = Resampler(quality).process(source, 0.37, 300).copy()
+            split = Resampler(quality)
+            first = split.process(source, 0.37, 128).copy()
+            second = split.process(source, 0.37, 172).copy()
+            assert np.allclose(np.concatenate([first, second]), whole, atol=1e-5), f"{quality} lost phase between chunks."
+        log("Phase continuity tests passed.", indent + "  ", verbose)
+
+        # Linear interpolation lands halfway between samples at half speed
+        log("Testing interpolation and reverse playback...", indent + "  ", verbose)
+        ramp = np.arange(10, dtype=np.float32).reshape(-1, 1)
+        out = Resampler("linear").process(ramp, 0.5, 6)
+        assert np.allclose(out[:, 0], [0, 0.5, 1, 1.5, 2, 2.5]), "Linear interpolation failed."
+
+        # Negative speeds read backwards and wrap around the start
+        reverse = Resampler("linear")
+        reverse.position = 2.0
+        out = reverse.process(ramp, -1.0, 4)
+        assert np.allclose(out[:, 0], [2, 1, 0, 9]), "Reverse playback failed."
+        assert reverse.position == 8.0, "Reverse playback did not wrap its position."
+        log("Interpolation and reverse tests passed.", indent + "  ", verbose)
+
+        # A per-frame speed curve matches the scalar path when constant and keeps its phase
+        # ("nearest" is skipped: summed speeds may round to the other side of a sample)
+        log("Testing per-frame speed curves...", indent + "  ", verbose)
+        for quality in QUALITIES[1:]:
+            scalar = Resampler(quality).process(source, 0.8, 256).copy()
+            curve = Resampler(quality).process(source, np.full(256, 0.8), 256)
+            assert np.allclose(curve, scalar, atol=1e-5), f"{quality} speed curve differs from scalar speed."
+            listed = Resampler(quality).process(source, [0.8] * 256, 256)
+            assert np.allclose(listed, scalar, atol=1e-5), f"{quality} rejected a speed curve given as a list."
+        ramp_speed = np.linspace(0.5, -0.5, 200)
+        whole = Resampler("cubic").process(source, ramp_speed, 200).copy()
+        split = Resampler("cubic")
+        parts = [split.process(source, ramp_speed[:77], 77).copy(), split.process(source, ramp_speed[77:], 123).copy()]
+        assert np.allclose(np.concatenate(parts), whole, atol=1e-5), "Speed curve lost phase between chunks."
+        log("Speed curve tests passed.", indent + "  ", verbose)
+
+        log("All Resampler tests passed successfully.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Resampler tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -0,0 +1,61 @@
+import gc
+import numpy as np
+import soundfile as sf
+import tempfile
+from pathlib import Path
+from src.core.sample_bank import SampleBank
+from src.core.sound import Sound
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_sample_bank(indent="", verbose=True) -> bool:
+    try:
+        log("Testing SampleBank...", indent, verbose)
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for i in range(3):
+                paths.append(Path(directory) / f"tone{i}.wav")
+                sf.write(paths[-1], np.full((1000, 2), 0.1 * i, dtype=np.float32), 8000, subtype="FLOAT")
+
+            # Sounds on the same file share one read-only buffer but keep their own position
+            log("Testing shared buffers...", indent + "  ", verbose)
+            bank = SampleBank(memory_budget=0)
+            a = Sound(paths[0], bank=bank)
+            b = Sound(paths[0], speed=2.0, bank=bank)
+            assert a.sample is b.sample and bank.loads == 1 and bank.hits == 1, "Identical files were loaded twice."
+            assert np.shares_memory(a.audio_data, b.audio_data), "Sounds do not share their buffer."
+            assert not a.audio_data.flags.writeable, "Shared buffer is writeable."
+            a._generate_chunk(10)
+            b._generate_chunk(10)
+            assert a.current_position == 10 and b.current_position == 20, "Playback state leaked between Sounds."
+            log("Shared buffer tests passed.", indent + "  ", verbose)
+
+            # Unused samples are released once nothing references them
+            log("Testing release, budget and pinning...", indent + "  ", verbose)
+            key = a.sample.key
+            del a, b
+            bank.clear()
+            gc.collect()
+            assert key not in bank, "Unused sample was not released."
+
+            # The budget keeps the most recent samples warm; pinned ones survive regardless
+            sample_bytes = 1000 * 2 * 4
+            bank = SampleBank(memory_budget=2 * sample_bytes)
+            pinned = bank.get(paths[0], pin=True).key
+            keys = [bank.get(path).key for path in paths[1:]] + [bank.get(paths[1]).key]
+            gc.collect()
+            assert pinned in bank, "Pinned sample was released."
+            assert keys[0] in bank and keys[1] in bank, "Recently used samples were not kept warm."
+            assert bank._recent_bytes <= bank.memory_budget, "Keep-warm set exceeded the memory budget."
+            log("Release, budget and pinning tests passed.", indent + "  ", verbose)
+
+        log("All SampleBank tests passed successfully.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"SampleBank tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
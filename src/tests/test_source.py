@@ -0,0 +1,59 @@
+import threading
+import numpy as np
+import soundfile as sf
+import tempfile
+from pathlib import Path
+from src.core.source import StreamingSource
+from src.core.sound import Sound
+from src.core.log import log
+import traceback as tb
+import sys
+
+def test_source(indent="", verbose=True) -> bool:
+    try:
+        log("Testing StreamingSource...", indent, verbose)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "stream.wav"
+            rng = np.random.default_rng(0)
+            data = rng.uniform(-0.5, 0.5, (10000, 2)).astype(np.float32)
+            sf.write(path, data, 8000, subtype="FLOAT")
+
+            # Random access matches a full read while memory stays bounded
+            log("Testing block decoding and cache bound...", indent + "  ", verbose)
+            source = StreamingSource(path, block_frames=1000, cache_blocks=3)
+            assert source.shape == data.shape and len(source) == len(data), "StreamingSource shape is wrong."
+            indices = rng.integers(0, len(data), (50, 4))
+            assert np.array_equal(source[indices], data[indices]), "Random access returned wrong frames."
+            assert np.array_equal(source[995:1005], data[995:1005]), "Slice across a block boundary failed."
+            assert np.array_equal(source[-1], data[-1]), "Negative index failed."
+            assert len(source.cache) <= 3, "Block cache exceeded its bound."
+            # A decode in progress (file_lock held) must not stall reads of cached blocks
+            reader = threading.Thread(target=lambda: source[-1])  # Block read just above
+            with source.file_lock:
+                reader.start()
+                reader.join(timeout=2)
+                assert not reader.is_alive(), "Reading a cached block waited for a decode."
+            source.close()
+            log("Block decoding tests passed.", indent + "  ", verbose)
+
+            # A streaming Sound renders exactly what an in-memory Sound renders
+            log("Testing streaming Sound playback...", indent + "  ", verbose)
+            loaded = Sound(path, speed=-1.3)
+            streamed = Sound(path, speed=-1.3, streaming=True)
+            for _ in range(20):
+                expected = loaded._generate_chunk().copy()
+                assert np.allclose(streamed._generate_chunk(), expected), "Streaming Sound diverged from in-memory Sound."
+            loaded.close()
+            streamed.close()
+            assert streamed.audio_data._closed, "Sound.close() did not close its streaming source."
+            log("Streaming Sound tests passed.", indent + "  ", verbose)
+
+        log("All StreamingSource tests passed successfully.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"StreamingSource tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
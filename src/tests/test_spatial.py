@@ -0,0 +1,99 @@
+import numpy as np
+import pygame
+from src.core.geometry import Vector, Rect, Ellipse, Triangle
+from src.core.spatial import GridIndex, bounds_of
+from src.core.component import Component
+from src.core.view import View
+from src.core.style import Style
+from src.core.log import log
+import traceback as tb
+import sys
+
+class _Recorder(Component):
+    def __init__(self, rect):
+        super().__init__(rect, Style())
+        self.events = []
+
+    def handle_event(self, event):
+        self.events.append(event.type)
+
+def test_spatial(indent="", verbose=True) -> bool:
+    try:
+        log("Testing spatial index...", indent, verbose)
+        rng = np.random.default_rng(0)
+
+        # Point and rect queries agree with a linear scan
+        log("Testing queries...", indent + "  ", verbose)
+        shapes = []
+        for x, y, size in zip(rng.uniform(0, 1000, 300), rng.uniform(0, 1000, 300), rng.uniform(5, 80, 300)):
+            kind = len(shapes) % 3
+            if kind == 0:
+                shapes.append(Rect(Vector(x, y), Vector(size, size / 2)))
+            elif kind == 1:
+                shapes.append(Ellipse(Vector(x, y), Vector(size, 0), Vector(0, size / 3)))
+            else:
+                shapes.append(Triangle(Vector(x, y), Vector(x + size, y), Vector(x, y + size)))
+        index = GridIndex(cell_size=50)
+        for shape in shapes:
+            index.insert(shape)
+        assert len(index) == len(shapes), "GridIndex lost items."
+        for x, y in rng.uniform(0, 1000, (200, 2)):
+            expected = [shape for shape in shapes if shape.contains(x, y)]
+            assert index.query_point(x, y) == expected, "GridIndex.query_point() disagrees with contains()."
+        area = Rect(Vector(200, 300), Vector(150, 90))
+        left, top, right, bottom = bounds_of(area)
+        expected = [shape for shape in shapes if bounds_of(shape)[0] <= right and left <= bounds_of(shape)[2]
+                    and bounds_of(shape)[1] <= bottom and top <= bounds_of(shape)[3]]
+        assert index.query_rect(area) == expected, "GridIndex.query_rect() failed."
+        assert index.query_rect((-1e6, -1e6, 2e6, 2e6)) == shapes, "Whole-plane rect query failed."
+        log("Query tests passed.", indent + "  ", verbose)
+
+        # Incremental edits
+        log("Testing insert/remove/move...", indent + "  ", verbose)
+        first = shapes[0]
+        index.remove(first)
+        assert first not in index and first not in index.query_rect(first), "GridIndex.remove() failed."
+        index.insert(first)
+        assert index.query_rect(first)[-1] is first, "Reinserted item is not topmost."
+        first.top_left = Vector(2000, 2000)
+        index.move(first)
+        assert index.query_point(2001, 2001) == [first], "GridIndex.move() did not add the new cells."
+        assert all(column >= 40 for (column, row), members in index.cells.items() if first in members), "Moved item kept old cells."
+        log("Edit tests passed.", indent + "  ", verbose)
+
+        # Views only deliver clicks to the children under the pointer
+        log("Testing view routing...", indent + "  ", verbose)
+        view = View(pygame.Surface((400, 300)))
+        near, far = _Recorder(pygame.Rect(10, 10, 50, 50)), _Recorder(pygame.Rect(200, 200, 50, 50))
+        view.add_child(near)
+        view.children.append(far)  # Appended without add_child, as some callers do
+        view.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(220, 220), button=1))
+        view.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(20, 20), buttons=(0, 0, 0), rel=(0, 0)))
+        assert near.events == [pygame.MOUSEMOTION], "Click reached a child outside the pointer."
+        assert far.events == [pygame.MOUSEBUTTONDOWN], "Pointer events reached a child outside the pointer."
+        far.set_rect(0, 0, 5, 5)
+        view.move_child(far)
+        view.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(2, 2), button=1))
+        assert far.events[-1] == pygame.MOUSEBUTTONDOWN and len(near.events) == 1, "Moved child was not re-indexed."
+        replacement = _Recorder(pygame.Rect(300, 10, 50, 50))
+        view.children[0] = replacement  # Replaced in place, same number of children
+        view.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(320, 20), button=1))
+        view.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(20, 20), button=1))
+        assert replacement.events == [pygame.MOUSEBUTTONDOWN] and len(near.events) == 1, "Replaced child was not re-indexed."
+        assert near not in view.index and near.parent is None, "Replaced child stayed indexed."
+        far.rect = pygame.Rect(100, 100, 5, 5)  # Assigned directly instead of through set_rect
+        view.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(2, 2), button=1))
+        view.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(102, 102), button=1))
+        assert far.events.count(pygame.MOUSEBUTTONDOWN) == 3 and view.index.items[far][0] == (100, 100, 105, 105), \
+            "Child with a reassigned rect stayed at its old bounds."
+        log("View routing tests passed.", indent + "  ", verbose)
+
+        log("Spatial index tests passed.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Spatial index tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -0,0 +1,95 @@
+import time
+import numpy as np
+import pygame
+from src.core.spectrum import SpectrumAnalyzer
+from src.core.spectrogram_view import SpectrogramView
+from src.core.colors import note_colors
+from src.core.sound import Sound
+from src.core.log import log
+from pathlib import Path
+import traceback as tb
+import sys
+
+def test_spectrum(indent="", verbose=True) -> bool:
+    try:
+        log("Testing spectrum analyzer...", indent, verbose)
+        samplerate, size, hop = 8000, 512, 128
+        step = samplerate / size
+        t = np.arange(8 * size) / samplerate
+        sine = np.sin(2 * np.pi * 40 * step * t).astype(np.float32)  # Exactly on bin 40
+
+        # Overlapping windowed FFTs locate a sine and report its amplitude
+        log("Testing analysis...", indent + "  ", verbose)
+        analyzer = SpectrumAnalyzer(samplerate, size, hop, history=8, channels=2, max_backlog=8)
+        for chunk in np.split(np.stack([sine, sine], axis=1)[:2 * size], 8):
+            assert analyzer.feed(chunk), "SpectrumAnalyzer.feed() dropped a chunk with room to spare."
+        assert analyzer.process() == 2 * size // hop and analyzer.frames == 8, "Wrong number of spectra for the hop size."
+        spectrum = analyzer.latest(1)[0]
+        assert spectrum.argmax() == 40 and abs(spectrum[40] - 1) < 1e-3, "Sine peak is misplaced or mis-scaled."
+        assert analyzer.frequencies[40] == 40 * step, "Bin frequencies are wrong."
+        analyzer.feed(sine[:hop])  # Mono chunks are broadcast to every channel
+        analyzer.process()
+        assert abs(analyzer.latest(1)[0][40] - 1) < 1e-3, "Mono feed failed."
+        mono = SpectrumAnalyzer(samplerate, size, hop, channels=1, max_backlog=8)
+        assert mono.feed(np.stack([sine, sine], axis=1)[:size]), "Stereo chunk was rejected by a mono analyzer."
+        mono.process()
+        assert abs(mono.latest(1)[0][40] - 1) < 1e-3, "Stereo chunk was not down-mixed."
+        ordered = analyzer.latest()
+        assert len(ordered) == 8 and np.array_equal(ordered[-1], analyzer.spectrogram[analyzer.frames % 8 - 1]), \
+            "SpectrumAnalyzer.latest() is not oldest-first."
+        log("Analysis tests passed.", indent + "  ", verbose)
+
+        # Under load analysis frames are dropped, the feeding side never waits
+        log("Testing load shedding...", indent + "  ", verbose)
+        analyzer = SpectrumAnalyzer(samplerate, size, hop, channels=1, buffer_frames=4 * size, max_backlog=2)
+        accepted = [analyzer.feed(chunk[:, None]) for chunk in np.split(sine, 16)]
+        assert accepted == [True] * 8 + [False] * 8 and analyzer.chunks_dropped == 8, "Full ring buffer did not drop chunks."
+        assert analyzer.process() == 2 and analyzer.frames_dropped == 4 * size // hop - 2, "Backlog was not skipped."
+        log("Load shedding tests passed.", indent + "  ", verbose)
+
+        # Background thread and Sound tap
+        log("Testing threaded analysis of a Sound...", indent + "  ", verbose)
+        sound = Sound(Path("audio") / "short.mp3")
+        analyzer = SpectrumAnalyzer(sound.sample_rate, 1024, 256, channels=sound.audio_data.shape[1])
+        sound.set_tap(analyzer.feed)
+        analyzer.start()
+        chunk = sound._generate_chunk().copy()
+        deadline = time.perf_counter() + 5
+        while analyzer.frames < sound.chunk_size // 256 and time.perf_counter() < deadline:
+            time.sleep(0.001)
+        analyzer.stop()
+        assert not analyzer.is_running(), "SpectrumAnalyzer.stop() failed."
+        assert analyzer.frames == sound.chunk_size // 256, "Background thread did not analyze the tapped chunk."
+        assert np.array_equal(chunk, sound.audio_data[:sound.chunk_size]), "Tap altered the audio."
+        sound.set_tap(None)
+        sound._generate_chunk()
+        assert analyzer.ring.available() == 0, "Removed tap still receives chunks."
+        sound.close()
+        log("Threaded analysis tests passed.", indent + "  ", verbose)
+
+        # The view scrolls spectra in from the right, tinted by note colour
+        log("Testing SpectrogramView...", indent + "  ", verbose)
+        analyzer = SpectrumAnalyzer(samplerate, size, hop, channels=1)
+        view = SpectrogramView(analyzer, pygame.Rect(10, 5, 40, 100), floor_db=-60)
+        canvas = pygame.Surface((60, 110))
+        analyzer.feed(sine[:5 * hop])
+        analyzer.process()
+        view.draw(canvas)
+        pixels = pygame.surfarray.array3d(canvas)[10:50, 5:105]
+        assert not pixels[:35].any() and pixels[35:].any(), "Spectra were not drawn as the rightmost columns."
+        brightest = pixels[-1].sum(axis=1).argmax()
+        assert view._bins[brightest] in (39, 40, 41), "Peak drawn on the wrong row."
+        rows = np.geomspace(27.5, samplerate / 2, 100)[::-1]  # Row frequencies, top to bottom
+        color = note_colors(rows[brightest:brightest + 1])[0].astype(int)
+        assert np.abs(pixels[-1, brightest].astype(int) - color).max() <= 3, "Peak not drawn in its note colour."
+        log("SpectrogramView tests passed.", indent + "  ", verbose)
+
+        log("Spectrum analyzer tests passed.", indent, verbose)
+        return True
+    except Exception as e:
+        log(f"Spectrum analyzer tests failed: {e}", indent, verbose)
+        exec_type, exec_value, third = sys.exc_info()
+        print(exec_type.__name__)
+        print(exec_value)
+        tb.print_tb(third)
+        return False
@@ -69,15 +69,12 @@ def test_view(indent="", verbose=True):
             if not running:
                 break
 
-            # Clear screen
-            root_view.canvas.fill((0, 0, 0))  # Black background
-
-            # Draw the root view and its components
+            # Repaint whatever changed; the view presents it itself
             root_view.draw()
 
-            pygame.display.flip()
             clock.tick(60)
 
+        sound.close()
         pygame.quit()
         return True
     except Exception as e: